@@ -1,13 +1,16 @@
+import csv
+import io
 import json
 import logging
 import os
+import click
 import secrets
-from pathlib import Path
-import smtplib
-import logging
+import time
+import weakref
+from decimal import Decimal, InvalidOperation
 from dotenv import load_dotenv
-from email.message import EmailMessage
 from flask import (
+    Blueprint,
     Flask,
     g,
     request,
@@ -16,10 +19,13 @@ from flask import (
     url_for,
     render_template,
     jsonify,
+    Response,
+    stream_with_context,
+    current_app,
+    send_file,
 )
 from flask_bootstrap import Bootstrap
-from flask_migrate import Migrate
-from werkzeug.debug import console
+from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.security import generate_password_hash, check_password_hash
 from models import (
     User,
@@ -27,59 +33,142 @@ from models import (
     Fundraiser,
     login_required,
     has_active_fundraiser,
-    Contribution,
+    active_fundraiser,
+    owned_fundraiser_or_404,
+    reconcile_fundraiser_totals,
+    rebuild_contribution_rollups,
+    fundraiser_analytics,
+    ANALYTICS_MAX_TOP_CONTRIBUTORS,
+    contributions_page,
+    iter_contribution_rows,
+    EXPORT_COLUMNS,
+    latest_contribution_id,
+    insert_contributions,
+    purge_fundraiser,
+    archive_ended_fundraisers,
+    fundraiser_dashboard,
+    search_contributions,
 )
+from assets import init_assets
+from live import broadcaster, stream_events, TooManyListeners
+from log_config import init_logging
+from metrics import init_metrics, CONTRIBUTIONS_INGESTED, CONTRIBUTION_DUPLICATES, PARSE_FAILURES
+from mpesa import parse_message, split_messages
+from page_cache import fundraiser_stamp, init_page_cache, render_fundraiser_page
+from sqlite_profile import engine_options, init_sqlite_profile
+from write_queue import contribution_writer, WRITE_TIMEOUT
 from models import db
 
-# Configure logging to write to a file
-logging.basicConfig(filename="Nijenge_app.log", level=logging.DEBUG)
+# Routes, template filters and CLI commands; create_app() registers them on the app
+main = Blueprint("main", __name__, cli_group=None)
+
+# Engines of the apps built in this process, whose pooled connections a forked child drops
+FORKED_ENGINES = weakref.WeakSet()
+
+
+def dispose_engines_after_fork():
+    for engine in list(FORKED_ENGINES):
+        engine.dispose(close=False)
+
+
+# registered once here rather than in create_app(), so building several apps in one
+# process, as the tests and CLI do, does not stack up fork hooks
+os.register_at_fork(after_in_child=dispose_engines_after_fork)
+
 
+def create_app(config=None):
+    """
+    Builds and configures the application.
+
+    Rarely used modules (mail delivery, PDF rendering, query plan checks and Flask-Migrate
+    with Alembic) are imported by the code that needs them rather than here, so a worker
+    starts without loading them. The app can be preloaded by gunicorn: each forked worker
+    drops the database connections inherited from the parent, and log_config restarts its
+    writer thread.
+
+    Parameters:
+        config (dict): Settings applied over the ones read from the environment.
+
+    Returns:
+        Flask: The application.
+    """
+    # Load environment variables from .env file
+    load_dotenv()
+
+    app = Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get("DATABASE_URL", "sqlite:///Toa.db")
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    # shared by every worker, so any of them can read a session cookie set by another
+    app.config["SECRET_KEY"] = os.environ.get("SECRET_KEY")
+    # request bodies, bulk uploads included, are refused with 413 beyond this many bytes
+    app.config["MAX_CONTENT_LENGTH"] = int(os.environ.get("MAX_CONTENT_LENGTH", 4 * 1024 * 1024))
+    app.config.update(config or {})
+    app.config.setdefault(
+        "SQLALCHEMY_ENGINE_OPTIONS", engine_options(app.config["SQLALCHEMY_DATABASE_URI"])
+    )
+    Bootstrap(app)
+
+    # Configure logging to write JSON lines to a rotating file from a background thread
+    init_logging(app)
+
+    if not app.config["SECRET_KEY"]:
+        app.config["SECRET_KEY"] = secrets.token_urlsafe(32)
+        logging.warning(
+            "SECRET_KEY is not set; using a random key, so sessions end when the server restarts"
+        )
 
-# Load environment variables from .env file
-load_dotenv()
+    # Initialize Flask-SQLAlchemy
+    db.init_app(app)
+    with app.app_context():
+        engine = db.engine
+        init_sqlite_profile(engine)
+        # Per-endpoint latency and SQL statement metrics, served on /metrics
+        init_metrics(app, engine)
+    # a worker forked from a preloaded app must not use the parent's pooled connections
+    FORKED_ENGINES.add(engine)
 
-app = Flask(__name__)
-Bootstrap(app)
+    # Live fundraiser updates for the SSE streams
+    broadcaster.init_app(app)
 
-app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///Toa.db"
-app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    # Single contributions are committed in groups by one writer thread per process
+    contribution_writer.init_app(app)
 
-# Initialize Flask-SQLAlchemy
-db.init_app(app)
+    # Cached pages and fragments, and compiled templates kept on disk
+    init_page_cache(app)
 
-# Get the path to the virtual environment configuration file
-venv_path = os.environ.get("VIRTUAL_ENV")
-venv_cfg_path = None
+    # Fingerprinted, precompressed static files from `flask build-assets`
+    init_assets(app)
 
-if venv_path is not None:
-    venv_cfg_path = Path(venv_path) / "pyvenv.cfg"
+    # Flask-Migrate imports Alembic, which takes longer to load than the rest of the app,
+    # and only the `flask db` commands use it
+    if click.get_current_context(silent=True) is not None:
+        from flask_migrate import Migrate
 
-app.config["SECRET_KEY"] = secrets.token_urlsafe(16)
+        Migrate(app, db)
 
-# Initialize Flask-Migrate
-migrate = Migrate(app, db)
+    app.register_blueprint(main)
+    return app
 
 
-@app.template_filter('tojson_string')
+@main.app_template_filter('tojson_string')
 def tojson_string_filter(value):
     return json.dumps(value)
 
 
-@app.template_filter("currency_format")
+@main.app_template_filter("currency_format")
 def currency_format(value):
     formatted_value = f"KES {value:,.2f}"  # Format as KES with thousands separator and 2 decimal places
     return formatted_value
 
 
-@app.route("/")
+@main.route("/")
 def index():
     return render_template("index.html")
 
 
-@app.route("/contact", methods=["POST"])
+@main.route("/contact", methods=["POST"])
 def contact():
     logging.info("Received contact form submission")
-    print("From app.py", request.form)  # Print the entire form data
 
     name = request.form.get("name")
     email = request.form.get("email")
@@ -97,48 +186,42 @@ def contact():
         logging.warning("Contact form submission with errors: %s", errors)
         return jsonify({"status": "error", "message": "\n".join(errors)})
 
-    # Send the email
+    # Queue the email for the background sender
     try:
         subject = os.environ.get("SUBJECT")
         recipient = os.environ.get("RECIPIENT")
         body = f"Name: {name}\nEmail: {email}\nMessage: {message}"
 
-        send_mail(subject, recipient, body)  # Call the send_mail function
+        from mailer import enqueue_mail
+
+        email_message = enqueue_mail(subject, recipient, body)
+        db.session.commit()
 
-        # Email sent successfully, return success response
-        logging.info("Contact email sent successfully to %s", recipient)
-        return jsonify({"status": "success", "message": "Email sent successfully!"})
+        logging.info("Contact email %s queued for %s", email_message.id, recipient)
+        # the outbox sender delivers it later, so it has only been received so far
+        return jsonify({"status": "success", "message": "Message received! We will get back to you soon."})
 
     except Exception as e:
-        logging.error(f"An error occurred while sending the email: {str(e)}")
+        db.session.rollback()
+        logging.error(f"An error occurred while queueing the email: {str(e)}")
         # Return error response with Toastr notification
         return jsonify({"status": "error", "message": f"An error occurred while sending the email"})
 
 
-# Create a secure SMTP connection for sending emails
-def send_mail(subject, recipient, body):
-    msg = EmailMessage()  # More modern message handling
-    msg["Subject"] = subject
-    msg["From"] = os.getenv("MAIL_USERNAME")
-    msg["To"] = recipient
-    msg.set_content(body)
-
-    password = os.getenv("MAIL_PASSWORD")
-    if password is None:
-        raise ValueError("MAIL_PASSWORD environment variable is not set")
+@main.cli.command("send-outbox")
+@click.option("--once", is_flag=True, help="Exit once the queued mail has been sent.")
+@click.option("--poll-interval", default=2.0, help="Seconds between checks of an empty outbox.")
+def send_outbox(once, poll_interval):
+    """Send queued emails over one reused SMTP connection."""
+    from mailer import OutboxSender
 
-    mail_username = os.getenv("MAIL_USERNAME")
-    if mail_username is None:
-        raise ValueError("MAIL_USERNAME environment variable is not set")
+    OutboxSender().run(poll_interval=poll_interval, once=once)
 
-    with smtplib.SMTP_SSL("smtp.mail.yahoo.com", 465) as smtp:
-        smtp.login(mail_username, password)
-        smtp.send_message(msg)
 
 from flask import request, get_flashed_messages, flash, make_response, redirect, url_for
 
 
-@app.route("/messages")
+@main.route("/messages")
 def get_messages():
     messages = get_flashed_messages(with_categories=True)
 
@@ -150,7 +233,7 @@ def get_messages():
     return jsonify(messages=messages)
 
 
-@app.route("/logout")
+@main.route("/logout")
 def logout():
     """Logs the user out by removing the user ID and name from the session."""
 
@@ -161,13 +244,13 @@ def logout():
     # Redirect to the login page or another appropriate route
     flash("You have been logged out", "info")
     logging.info( "User %s has been logged out", session["username"])
-    return redirect(url_for("index"))
+    return redirect(url_for("main.index"))
 
 
 from flask import flash, redirect, url_for
 
 
-@app.route("/login", methods=["GET", "POST"])
+@main.route("/login", methods=["GET", "POST"])
 def login():
     if request.method == "POST":
         username = request.form["username"]
@@ -191,20 +274,20 @@ def login():
                 flash("Login successful", "success")
 
                 # Redirect to index on successful login
-                return redirect(url_for("index"))
+                return redirect(url_for("main.index"))
             else:
                 logging.warning("Failed login attempt for user: %s", username)
                 flash("Invalid username or password", "error")
-                return redirect(url_for("index", login_error="true"))
+                return redirect(url_for("main.index", login_error="true"))
         except Exception as e:
             flash("There was an error logging in: " + str(e), "error")
             logging.error("Error during login: %s", str(e))
-            return redirect(url_for("index", login_error="true"))
+            return redirect(url_for("main.index", login_error="true"))
 
     return render_template("login.html")
 
 
-@app.route("/register", methods=["GET", "POST"])
+@main.route("/register", methods=["GET", "POST"])
 def register():
     """
     Registers a new user.
@@ -239,17 +322,17 @@ def register():
         if User.query.filter_by(username=username).first():
             flash("Email already exists. Please use a different email.", "error")
             logging.warning("Registration attempt with existing email: %s", username)
-            return redirect(url_for("index") + "#register-error")
+            return redirect(url_for("main.index") + "#register-error")
 
         # Password validation
         if not password or not confirm_password:
             flash("Password and confirmation password are required", "error")
             logging.warning("Password and confirmation password are required")
-            return redirect(url_for("index") + "#register-error")
+            return redirect(url_for("main.index") + "#register-error")
         if password != confirm_password:
             flash("Passwords do not match", "error")
             logging.warning("Passwords do not match for username: %s", username)
-            return redirect(url_for("index") + "#register-error")
+            return redirect(url_for("main.index") + "#register-error")
 
         # Hash the password before storing
         hashed_password = generate_password_hash(password)
@@ -263,93 +346,81 @@ def register():
 
         flash("Registration successful", "success")
         logging.info("New user registered successfully: %s", username)
-        return redirect(url_for("index"))
+        return redirect(url_for("main.index"))
 
     return render_template("register.html")
 
-from flask import g, session
-from models import User
-
-
-@app.before_request
-def load_user():
-    user_id = session.get("user_id")
-    if user_id:
-        g.user = User.query.get(user_id)
-    else:
-        g.user = None
-
-
-@app.route("/fundraiser", methods=["GET", "POST"])
+@main.route("/fundraiser", methods=["GET", "POST"])
 @login_required  # Decorator to check for login status
 def fundraiser():
     """
     A route handler for the "/fundraiser" URL. This function is decorated with the `@login_required` decorator,
     which means that the user must be logged in to access this route.
     
-    The function checks if the user has an active fundraiser by calling the `has_active_fundraiser()` function.
-    If the user has an active fundraiser, the function retrieves the fundraiser object using the `Fundraiser.query.filter_by()`
-    method and assigns it to the `user_fundraiser` variable. If the `user_fundraiser` is not `None`, the function logs
-    the fundraiser ID and renders the "fundraiser_success.html" template with the fundraiser ID and fundraiser object as
-    parameters. If the `user_fundraiser` is `None`, the function logs a warning message and returns a string indicating
-    that no active fundraiser was found for the user.
-    
-    If the user does not have an active fundraiser, the function redirects the user to the "create_fundraiser" route.
-    
+    A user can run several fundraisers at once. A POST creates a new one through `create_fundraiser()`.
+    On a GET, a user with an active fundraiser, as found by `has_active_fundraiser()`, is redirected to
+    the dashboard that lists all of their fundraisers; a user without one gets the form to create one.
+
     If an exception occurs during the execution of the function, the function logs an error message and returns a string
     indicating that an error occurred while processing the request.
-    
+
     Returns:
-        - If the user has an active fundraiser, the function returns the rendered "fundraiser_success.html" template with
-          the fundraiser ID and fundraiser object as parameters.
-        - If the user does not have an active fundraiser, the function returns a string indicating that no active fundraiser
-          was found for the user.
+        - If the request is a POST, the response of `create_fundraiser()`.
+        - If the user has an active fundraiser, a redirect to the "dashboard" route.
+        - If the user does not have an active fundraiser, the rendered "fundraiser.html" form.
         - If an exception occurs, the function returns a string indicating that an error occurred while processing the request.
     """
     try:
-        if has_active_fundraiser():
-            # Redirect to fundraiser_success page if user has an active fundraiser
-            user_fundraiser = Fundraiser.query.filter_by(user_id=g.user.id).first()
-            if user_fundraiser is not None:
-                logging.info(
-                    "Fundraiser ID: %s", user_fundraiser.id
-                )  # Log the fundraiser ID
-                return render_template(
-                    "fundraiser_success.html",
-                    fundraiser_id=user_fundraiser.id,
-                    fundraiser=user_fundraiser,
-                )
-            else:
-                # Handle the case where user_fundraiser is None
-                logging.warning("No active fundraiser found for the user")
-                return "No active fundraiser found for the user"
-        else:
+        if request.method == "POST" or not has_active_fundraiser():
             return create_fundraiser()
+        return redirect(url_for("main.dashboard"))
     except Exception as e:
         logging.error("Error in fundraiser route: %s", str(e))
         return "An error occurred while processing your request."
 
 
+@main.route("/dashboard")
+@login_required
+def dashboard():
+    """
+    Lists all of the user's fundraisers with their progress.
+
+    Every fundraiser's funds raised, contribution count and time of the latest contribution
+    come from the single query of `fundraiser_dashboard()`, so the page costs the same
+    number of queries for one campaign or for hundreds.
+
+    Returns:
+        The rendered "dashboard.html" template, or a redirect to the "create_fundraiser"
+        route for a user without fundraisers.
+    """
+    fundraisers = fundraiser_dashboard(g.user.id)
+    if not fundraisers:
+        flash("Please create a fundraiser first", "warning")
+        return redirect(url_for("main.create_fundraiser"))
+    logging.info("Dashboard of user %s lists %s fundraisers", g.user.id, len(fundraisers))
+    return render_template("dashboard.html", fundraisers=fundraisers, now=datetime.utcnow())
+
+
 from flask import flash
 
 
-@app.route("/create_fundraiser", methods=["GET", "POST"])
+@main.route("/create_fundraiser", methods=["GET", "POST"])
+@login_required
 def create_fundraiser():
     """
     A route handler for the "/create_fundraiser" URL. This function handles both GET and POST requests.
     
     If the request method is POST, the function retrieves the form data for the fundraiser fields (name, description, end_date, target_funds) and converts the end_date to a datetime object.
     
-    The function then checks if the user already has an active fundraiser by querying the database. If the user has an active fundraiser, the function displays an error message and redirects the user back to the create_fundraiser page.
-    
-    If the user does not have an active fundraiser, the function creates a new fundraiser object with the form data and adds it to the database. It then commits the changes and displays a success message.
+    The function then creates a new fundraiser object with the form data and adds it to the database, next to any
+    fundraisers the user already runs. It then commits the changes and displays a success message.
     
     If an exception occurs during the process, the function logs an error message and displays an error message to the user.
     
     If the request method is GET, the function retrieves the fundraiser object for the current user from the database. If an exception occurs during the retrieval process, the function logs an error message and displays an error message to the user.
     
     Returns:
-        - If the request method is POST and the fundraiser is created successfully, the function redirects the user to the fundraiser_success page.
+        - If the request method is POST and the fundraiser is created successfully, the function redirects the user to the new fundraiser's fundraiser_success page.
         - If the request method is POST and an exception occurs, the function redirects the user back to the create_fundraiser page.
         - If the request method is GET and the fundraiser is retrieved successfully, the function renders the "fundraiser.html" template with the fundraiser object as a parameter.
         - If the request method is GET and an exception occurs, the function redirects the user to the index page.
@@ -362,16 +433,6 @@ def create_fundraiser():
         target_funds = request.form["target_funds"]
 
         try:
-            # Check if user already has an active fundraiser
-            user_fundraiser = Fundraiser.query.filter_by(user_id=g.user.id).first()
-            if user_fundraiser:
-                flash(
-                    "You already have an active fundraiser. Please complete or cancel it before creating a new one.",
-                    "error",
-                )
-                logging.warning("User %s already has an active fundraiser.", g.user.id)
-                return redirect(url_for("create_fundraiser"))
-
             # Create the new fundraiser
             new_fundraiser = Fundraiser(
                 user_id=g.user.id,
@@ -385,8 +446,8 @@ def create_fundraiser():
 
             flash("Fundraiser created successfully!", "success")
             logging.info("New fundraiser created successfully: %s", new_fundraiser.id)
-            # Redirect to the /fundraiser route to reload the page and display the new fundraiser
-            return redirect(url_for("fundraiser"))
+            # Redirect to the new fundraiser's page
+            return redirect(url_for("main.save_contribution", fundraiser_id=new_fundraiser.id))
 
         except Exception as e:
             logging.error("Error while creating fundraiser: %s", str(e))
@@ -394,12 +455,12 @@ def create_fundraiser():
                 "An error occurred while creating the fundraiser. Please try again.",
                 "error",
             )
-            return redirect(url_for("create_fundraiser"))
+            return redirect(url_for("main.create_fundraiser"))
 
     # Render the form for GET requests
     # Retrieve the fundraiser object
     try:
-        fundraiser = Fundraiser.query.filter_by(user_id=g.user.id).first()
+        fundraiser = active_fundraiser()
         logging.info("Rendering fundraiser form for user %s", g.user.id)
         return render_template("fundraiser.html", fundraiser=fundraiser)
     except Exception as e:
@@ -408,21 +469,30 @@ def create_fundraiser():
             "An error occurred while retrieving fundraiser data. Please try again.",
             "error",
         )
-        return redirect(url_for("index"))
+        return redirect(url_for("main.index"))
 
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from flask import jsonify
-import re  # Import regular expressions for robust parsing
 
 
-@app.route("/fundraiser_success/<int:fundraiser_id>", methods=["GET", "POST"])
+def archived_response(fundraiser):
+    """Refuses a contribution to an archived fundraiser."""
+    logging.warning("Contribution refused for archived fundraiser ID %s", fundraiser.id)
+    return jsonify(
+        {"status": "error", "message": "This fundraiser has ended and no longer accepts contributions."}
+    ), 403
+
+
+@main.route("/fundraiser_success/<int:fundraiser_id>", methods=["GET", "POST"])
 @login_required
 def save_contribution(fundraiser_id):
     """
     Save a contribution for a fundraiser.
 
     This route handles both GET and POST requests to save a contribution for a fundraiser.
+    A POSTed contribution is committed by the group-commit writer of write_queue.py together
+    with the ones other requests submitted at the same moment, and the request waits for it.
 
     Parameters:
         fundraiser_id (int): The ID of the fundraiser.
@@ -441,95 +511,82 @@ def save_contribution(fundraiser_id):
                     - phone_number (str): The phone number of the contributor.
                     - contribution_date (str): The date of the contribution in the format 'YYYY-MM-DD'.
                     - contribution_time (str): The time of the contribution in the format 'HH:MM:SS'.
+            If the M-Pesa reference was already recorded for the fundraiser, returns status 409 with a JSON
+            response whose status is "duplicate" and whose data is the original contribution.
             If there is an error saving the contribution, returns a JSON response with the following fields:
                 - status (str): The status of the response.
                 - message (str): An error message.
         If the request method is GET:
             Renders the 'fundraiser_success.html' template with the fundraiser object.
+        If the fundraiser is archived, a POST gets status 403 with a JSON error and a GET is
+        redirected to the read-only report.
             If there is an error rendering the template, returns a JSON response with the following fields:
                 - status (str): The status of the response.
                 - message (str): An error message.
     """
     try:
-        fundraiser = Fundraiser.query.get_or_404(fundraiser_id)
+        fundraiser = owned_fundraiser_or_404(fundraiser_id)
     except Exception as e:
         logging.error(
             "Error retrieving fundraiser with ID %s: %s", fundraiser_id, str(e)
         )
-        return jsonify({"status": "error", "message": "Fundraiser not found"})
+        return jsonify({"status": "error", "message": "Fundraiser not found"}), 404
+
+    if fundraiser.archived_at is not None:
+        if request.method == "POST":
+            return archived_response(fundraiser)
+        flash("This fundraiser has ended and is archived. Its report is read-only.", "info")
+        return redirect(url_for("main.report", fundraiser_id=fundraiser_id))
 
     if request.method == "POST":
         try:
             message = request.form["message"]
-            contribution_reference = re.search(r"\b[A-Z0-9]{10}\b", message)
-            if not contribution_reference:
-                logging.warning(
-                    "Invalid contribution reference in message: %s", message
-                )
-                return error("Invalid contribution reference", 400)
-            contribution_reference = contribution_reference.group()
-
-            amount = re.search(r"Ksh([\d,]+)\.", message)
-            if not amount:
-                logging.warning("Invalid amount in message: %s", message)
-                return error("Invalid amount", 400)
-            amount = amount.group(1).replace(",", "")
-
-            contributor_name = re.search(r"from ([A-Z\s]+) \d", message)
-            if not contributor_name:
-                logging.warning("Invalid contributor name in message: %s", message)
-                return error("Invalid contributor name", 400)
-            contributor_name = contributor_name.group(1)
-
-            phone_number = re.search(r"(\d+) on", message)
-            if not phone_number:
-                logging.warning("Invalid phone number in message: %s", message)
-                return error("Invalid phone number", 400)
-            phone_number = phone_number.group(1)
-
-            contribution_date = re.search(r"on (\d{1,2}/\d{1,2}/\d{2}) at", message)
-            if not contribution_date:
-                logging.warning("Invalid contribution date in message: %s", message)
-                return error("Invalid contribution date", 400)
-            contribution_date = datetime.strptime(
-                contribution_date.group(1), "%d/%m/%y"
-            ).date()
-
-            contribution_time = re.search(r"at (\d{1,2}:\d{2} (?:AM|PM))", message)
-            if not contribution_time:
-                logging.warning("Invalid contribution time in message: %s", message)
-                return error("Invalid contribution time", 400)
-            contribution_time = datetime.strptime(
-                contribution_time.group(1), "%I:%M %p"
-            ).time()
-
-            contribution = Contribution(
-                fundraiser_id=fundraiser_id,
-                contribution_reference=contribution_reference,
-                contributor_name=contributor_name,
-                phone_number=phone_number,
-                amount=amount,
-                contribution_date=contribution_date,
-                contribution_time=contribution_time,
-            )
-            db.session.add(contribution)
             try:
-                db.session.commit()
+                parsed = parse_message(message)
+            except ValueError as e:
+                PARSE_FAILURES.labels("single").inc()
+                logging.warning("%s in message: %s", str(e), message)
+                return error(str(e), 400)
+            contribution_reference = parsed["contribution_reference"]
+            amount = parsed["amount"]
+            contributor_name = parsed["contributor_name"]
+            phone_number = parsed["phone_number"]
+            contribution_date = parsed["contribution_date"]
+            contribution_time = parsed["contribution_time"]
+
+            # end this request's read transaction; the row is written by the group-commit writer
+            db.session.rollback()
+            try:
+                saved = contribution_writer.submit(fundraiser_id, parsed).result(timeout=WRITE_TIMEOUT)
             except Exception as e:
                 logging.error(
                     "Error committing contribution to the database: %s", str(e)
                 )
                 return jsonify({"status": "error", "message": str(e)})
 
+            if "duplicate" in saved:
+                CONTRIBUTION_DUPLICATES.labels("single").inc()
+                logging.info(
+                    "Duplicate contribution %s for fundraiser ID %s", contribution_reference, fundraiser_id
+                )
+                return jsonify(
+                    {
+                        "status": "duplicate",
+                        "message": "This contribution has already been recorded.",
+                        "data": saved["duplicate"],
+                    }
+                ), 409
+
+            CONTRIBUTIONS_INGESTED.labels("single").inc()
             logging.info(
-                "Contribution saved successfully for fundraiser ID %s with message: %s", fundraiser_id, message
+                "Contribution %s saved successfully for fundraiser ID %s", contribution_reference, fundraiser_id
             )
             return jsonify(
                 {
                     "status": "success",
                     "message": "Contribution saved successfully!",
                     "data": {
-                        "funds_raised": fundraiser.funds_raised,
+                        "funds_raised": saved["funds_raised"],
                         "fundraiser_id": fundraiser_id,
                         "contribution_reference": contribution_reference,
                         "amount": amount,
@@ -554,7 +611,7 @@ def save_contribution(fundraiser_id):
 
     else:
         try:
-            return render_template("fundraiser_success.html", fundraiser=fundraiser)
+            return render_fundraiser_page("fundraiser_success.html", fundraiser)
         except Exception as e:
             logging.error(
                 "Error rendering fundraiser success template for fundraiser ID %s: %s",
@@ -569,17 +626,177 @@ def save_contribution(fundraiser_id):
             )
 
 
+# Maximum number of messages accepted by one bulk submission; at a few hundred bytes a
+# message they fit well within MAX_CONTENT_LENGTH
+BULK_MAX_MESSAGES = 5000
+
+
+@main.app_errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    """Refuses a request body over MAX_CONTENT_LENGTH before any of it is parsed."""
+    logging.warning("Refused a request body over %s bytes on %s", current_app.config["MAX_CONTENT_LENGTH"], request.path)
+    limit = current_app.config["MAX_CONTENT_LENGTH"] // (1024 * 1024)
+    return jsonify({"status": "error", "message": f"The upload is larger than {limit} MB"}), 413
+
+
+@main.route("/fundraiser_success/<int:fundraiser_id>/bulk", methods=["POST"])
+@login_required
+def save_contributions_bulk(fundraiser_id):
+    """
+    Save many contributions for a fundraiser from pasted M-Pesa messages in one request.
+
+    The messages come from the `messages` form field or from an uploaded text file in the `file` field,
+    separated by blank lines or simply following each other. Every message is parsed, and the valid ones
+    are inserted with one batched INSERT in a single transaction together with the fundraiser totals.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser.
+
+    Returns:
+        A JSON response with the following fields:
+            - status (str): The status of the response.
+            - message (str): A summary of the submission.
+            - data (dict): A dictionary containing the following fields:
+                - funds_raised (float): The total amount raised by the fundraiser.
+                - saved (int): The number of contributions saved.
+                - duplicates (int): The number of messages whose M-Pesa reference was already recorded.
+                - failed (int): The number of messages that could not be parsed.
+                - results (list): One entry per message, in order, with its index, status
+                  ("saved", "duplicate" or "invalid"), the contribution reference and either the new
+                  contribution_id, the original_contribution_id of a duplicate or the parse error.
+    """
+    fundraiser = owned_fundraiser_or_404(fundraiser_id)
+    if fundraiser.archived_at is not None:
+        return archived_response(fundraiser)
+
+    upload = request.files.get("file")
+    if upload:
+        text = upload.read().decode("utf-8", errors="replace")
+    else:
+        text = request.form.get("messages", "")
+    messages = split_messages(text)
+    if not messages:
+        return jsonify({"status": "error", "message": "No messages to save"}), 400
+    if len(messages) > BULK_MAX_MESSAGES:
+        return jsonify(
+            {"status": "error", "message": f"At most {BULK_MAX_MESSAGES} messages can be saved at once"}
+        ), 400
+
+    results = []
+    rows = []
+    for index, message in enumerate(messages):
+        try:
+            parsed = parse_message(message)
+        except ValueError as e:
+            PARSE_FAILURES.labels("bulk").inc()
+            results.append({"index": index, "status": "invalid", "message": str(e)})
+            continue
+        rows.append(parsed)
+        results.append({"index": index, "contribution_reference": parsed["contribution_reference"]})
+
+    try:
+        inserted, duplicates = insert_contributions(fundraiser.id, rows)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        logging.error("Error committing bulk contributions for fundraiser ID %s: %s", fundraiser.id, str(e))
+        return jsonify({"status": "error", "message": "An error occurred while saving the contributions."})
+
+    # a reference repeated within the submission is only inserted for its first message
+    saved_references = set()
+    for result in results:
+        reference = result.get("contribution_reference")
+        if reference is None:
+            continue
+        if reference in inserted and reference not in saved_references:
+            saved_references.add(reference)
+            result["status"] = "saved"
+            result["contribution_id"] = inserted[reference]
+        else:
+            original = duplicates.get(reference)
+            result["status"] = "duplicate"
+            result["message"] = "Already recorded"
+            result["original_contribution_id"] = (
+                original.contribution_id if original else inserted[reference]
+            )
+
+    saved = len(inserted)
+    duplicate = sum(1 for result in results if result["status"] == "duplicate")
+    failed = len(messages) - saved - duplicate
+    CONTRIBUTIONS_INGESTED.labels("bulk").inc(saved)
+    CONTRIBUTION_DUPLICATES.labels("bulk").inc(duplicate)
+    logging.info(
+        "Bulk submission for fundraiser ID %s: %s saved, %s duplicate, %s invalid",
+        fundraiser.id,
+        saved,
+        duplicate,
+        failed,
+    )
+    return jsonify(
+        {
+            "status": "success",
+            "message": f"{saved} contributions saved, {duplicate} already recorded, {failed} messages could not be read.",
+            "data": {
+                "funds_raised": fundraiser.funds_raised,
+                "saved": saved,
+                "duplicates": duplicate,
+                "failed": failed,
+                "results": results,
+            },
+        }
+    )
+
+
 # Route to handle AJAX requests for fetching contributions
-@app.route("/report_index")
+@main.route("/fundraiser/<int:fundraiser_id>/events")
+@login_required
+def fundraiser_events(fundraiser_id):
+    """
+    Streams live updates of a fundraiser as Server-Sent Events.
+
+    The stream starts with a "totals" event holding the current funds raised and contribution count.
+    After that, every committed contribution, from any worker, is sent as a "contribution" event
+    followed by a "totals" event, within LIVE_POLL_INTERVAL of the commit. A keepalive comment is sent
+    when the stream is otherwise idle.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser to follow.
+
+    Returns:
+        A text/event-stream response, or a JSON error with status 503 when this worker already
+        streams the maximum number of listeners.
+    """
+    fundraiser = owned_fundraiser_or_404(fundraiser_id)
+    try:
+        events, unsubscribe = stream_events(fundraiser)
+    except TooManyListeners:
+        logging.warning("Refused live updates for fundraiser ID %s: too many listeners", fundraiser_id)
+        response = jsonify({"status": "error", "message": "Too many live listeners, try again later."})
+        response.status_code = 503
+        response.headers["Retry-After"] = "30"
+        return response
+
+    # the stream is not wrapped in stream_with_context, so the request's database session
+    # is released as soon as the response starts instead of being held for its lifetime
+    response = Response(
+        events,
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+    # the server closes every response it is handed, whether or not the stream ever ran
+    response.call_on_close(unsubscribe)
+    return response
+
+
+@main.route("/report_index")
 @login_required
 def report_index():
     """
     A route handler for the "/report_index" URL. This function is decorated with the `@login_required` decorator,
     which means that the user must be logged in to access this route.
     
-    The function checks if the user has an active fundraiser by calling the `has_active_fundraiser()` function.
-    If the user has an active fundraiser, the function retrieves the fundraiser object using the `Fundraiser.query.get_or_404()`
-    method and assigns it to the `fundraiser` variable. If the `fundraiser` is not `None`, the function logs
+    The function fetches the user's fundraiser with the request-scoped `active_fundraiser()` loader and assigns it
+    to the `fundraiser` variable. If the `fundraiser` is not `None`, the function logs
     the fundraiser ID and redirects the user to the "report" route with the fundraiser ID and page number as parameters.
     If the `fundraiser` is `None`, the function logs a warning message and redirects the user to the "fundraiser" route.
     
@@ -596,43 +813,123 @@ def report_index():
         # Check if user is logged in
         if "user_id" not in session:
             flash("Please log in first", "warning")
-            return redirect(url_for("login"))
+            return redirect(url_for("main.login"))
         # Check if user has an active fundraiser
-        fundraiser_id = has_active_fundraiser()
-        if fundraiser_id is None:
+        fundraiser = active_fundraiser()
+        if fundraiser is None:
             logging.warning("No active fundraiser found for the user.")
             flash("Please create a fundraiser first", "warning")
-            return redirect(url_for("fundraiser"))
+            return redirect(url_for("main.fundraiser"))
 
-        fundraiser = Fundraiser.query.get_or_404(fundraiser_id)  # Fetch the fundraiser
-        logging.info("Active fundraiser found for user: %s", fundraiser_id)
+        logging.info("Active fundraiser found for user: %s", fundraiser.id)
 
         page_number = request.args.get("page", 1)
         return redirect(
-            url_for("report", fundraiser_id=fundraiser.id, page_number=page_number)
+            url_for("main.report", fundraiser_id=fundraiser.id, page_number=page_number)
         )
     except Exception as e:
         logging.error("Error in report_index function: %s", str(e))
         flash("An error occurred. Please try again later.", "error")
-        return redirect(url_for("fundraiser"))
+        return redirect(url_for("main.fundraiser"))
+
+
+# Default and maximum number of contributions per page of the JSON report
+REPORT_PAGE_SIZE = 10
+REPORT_MAX_PAGE_SIZE = 500
+
+
+def report_row(contribution):
+    """Converts a contribution into the row shape used by the report table."""
+    return {
+        "reference": contribution.contribution_reference,
+        "name": contribution.contributor_name,
+        "amount": currency_format(contribution.amount),
+        "date": contribution.contribution_date.strftime("%d-%m-%Y"),
+        "time": contribution.contribution_time.strftime("%H:%M:%S"),
+        "timestamp": contribution.timestamp.strftime("%d-%m-%Y %H:%M:%S"),
+    }
+
+
+def fundraiser_etag(fundraiser):
+    """
+    Returns the strong ETag of the data derived from a fundraiser at its current version stamp.
+
+    The stamp includes updated_at because SQLite may hand the ID of a deleted fundraiser to
+    the next one created, whose version starts again at 0.
+    """
+    version, updated_at = fundraiser_stamp(fundraiser)
+    changed = updated_at.strftime("%Y%m%d%H%M%S%f") if updated_at else "0"
+    return f"fundraiser-{fundraiser.id}-v{version}-{changed}"
+
+
+def fundraiser_last_modified(fundraiser):
+    """
+    Returns the Last-Modified of a fundraiser's data, from the same stamp as its ETag.
+
+    HTTP dates have whole seconds, and within one second the data may change again, or a
+    fundraiser reusing a deleted one's ID may be created. The date is therefore only
+    given once its second has passed, so that it stands for a single state of the data.
+
+    Returns:
+        datetime: The time of the last change truncated to the second, or None.
+    """
+    _, updated_at = fundraiser_stamp(fundraiser)
+    if updated_at is None:
+        return None
+    last_modified = updated_at.replace(microsecond=0)
+    if last_modified >= datetime.utcnow().replace(microsecond=0):
+        return None
+    return last_modified.replace(tzinfo=timezone.utc)
+
+
+def not_modified(fundraiser):
+    """
+    Checks the request's validators against the fundraiser's version stamp.
+
+    Only the fundraiser row is consulted, so a client that already holds the current
+    data is answered before any contribution is loaded or serialized.
+
+    Returns:
+        A 304 response if the client's copy is current, otherwise None.
+    """
+    last_modified = fundraiser_last_modified(fundraiser)
+    if request.if_none_match:
+        current = request.if_none_match.contains(fundraiser_etag(fundraiser))
+    elif request.if_modified_since and last_modified:
+        current = last_modified <= request.if_modified_since
+    else:
+        current = False
+    if not current:
+        return None
+    return add_validators(Response(status=304), fundraiser)
+
+
+def add_validators(response, fundraiser):
+    """Sets the ETag and Last-Modified of a fundraiser's data on a response and returns it."""
+    response.set_etag(fundraiser_etag(fundraiser))
+    last_modified = fundraiser_last_modified(fundraiser)
+    if last_modified is not None:
+        response.last_modified = last_modified
+    # the data is per-session; the browser may keep it but must revalidate on every use
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
 
 
 # Report route to fetch contributions for a specific fundraiser
-@app.route("/report/<int:fundraiser_id>")
+@main.route("/report/<int:fundraiser_id>")
 @login_required
 def report(fundraiser_id):
     """
 A route handler for the "/report/<int:fundraiser_id>" URL. This function is decorated with the `@login_required` decorator,
 which means that the user must be logged in to access this route.
 
-The function fetches all contributions for a specific fundraiser using the `fundraiser_id` parameter. It then converts the
-contributions into a list of dictionaries, where each dictionary contains information about the contribution, such as the
-reference, name, amount, date, time, and timestamp. The function also logs a message indicating that contributions have
-been fetched for the specified fundraiser.
-
-If the query parameter `format` is set to "json", the function returns a JSON response containing the contributions as a
-list of dictionaries. Otherwise, the function renders the "report.html" template with the fundraiser object and the
-contributions as parameters.
+If the query parameter `format` is set to "json", the function returns one page of contributions for the fundraiser,
+ordered by timestamp and contribution ID. Pages are fetched with keyset pagination: the `limit` query parameter sets
+the page size (default 10, at most 500) and the `after` query parameter takes the `next_cursor` of the previous page.
+The total count comes from the fundraiser's stored contribution count, so no page ever counts or loads the whole set.
+Otherwise, the function renders the "report.html" template with the fundraiser object; the table is filled in by
+report.js from the JSON pages.
 
 If an exception occurs during the execution of the function, the function logs an error message, displays an error flash
 message, and redirects the user to the "fundraiser" route.
@@ -641,40 +938,48 @@ Parameters:
     - fundraiser_id (int): The ID of the fundraiser for which contributions are being fetched.
 
 Returns:
-    - If the query parameter `format` is set to "json", the function returns a JSON response containing the contributions
-        as a list of dictionaries.
+    - If the query parameter `format` is set to "json", a JSON response with the fields:
+        - items (list): The contributions on this page as dictionaries.
+        - next_cursor (str): The `after` value for the next page, or null on the last page.
+        - total (int): The total number of contributions for the fundraiser.
+      A malformed `after` cursor returns a JSON error with status 400. The response carries an ETag and
+      Last-Modified taken from the fundraiser's version stamp, and a request whose If-None-Match or
+      If-Modified-Since still matches is answered with 304 Not Modified without reading any contributions.
     - If the query parameter `format` is not set or is set to any other value, the function renders the "report.html"
-        template with the fundraiser object and the contributions as parameters.
+        template with the fundraiser object.
     - If an exception occurs, the function logs an error message, displays an error flash message, and redirects the user
         to the "fundraiser" route.
 """
+    fundraiser = owned_fundraiser_or_404(fundraiser_id)
     try:
-        # Fetch all contributions for the fundraiser
-        fundraiser = Fundraiser.query.get_or_404(fundraiser_id)
-        contributions = Contribution.query.filter_by(fundraiser_id=fundraiser_id).all()
-        logging.info("Fetched contributions for fundraiser ID: %s", fundraiser_id)
-
-        # Convert contributions to a list of dictionaries
-        contributions_dict = [
-            {
-                "reference": contribution.contribution_reference,
-                "name": contribution.contributor_name,
-                "amount": currency_format(contribution.amount),
-                "date": contribution.contribution_date.strftime("%d-%m-%Y"),
-                "time": contribution.contribution_time.strftime("%H:%M:%S"),
-                "timestamp": contribution.timestamp.strftime("%d-%m-%Y %H:%M:%S"),
-            }
-            for contribution in contributions
-        ]
-
         if request.args.get("format") == "json":
-            # Return JSON response if 'format' query parameter is 'json'
-            return jsonify(items=contributions_dict)
-        else:
-            # Render the template with initial contributions
-            return render_template(
-                "report.html", fundraiser=fundraiser, contributions=contributions_dict
+            cached = not_modified(fundraiser)
+            if cached is not None:
+                return cached
+            limit = request.args.get("limit", REPORT_PAGE_SIZE, type=int)
+            limit = max(1, min(limit, REPORT_MAX_PAGE_SIZE))
+            try:
+                contributions, next_cursor = contributions_page(
+                    fundraiser_id,
+                    limit,
+                    after=request.args.get("after"),
+                    archived=fundraiser.archived_at is not None,
+                )
+            except ValueError as e:
+                logging.warning("Invalid report cursor for fundraiser ID %s: %s", fundraiser_id, str(e))
+                return jsonify({"status": "error", "message": "Invalid cursor"}), 400
+            logging.info("Fetched contributions for fundraiser ID: %s", fundraiser_id)
+
+            return add_validators(
+                jsonify(
+                    items=[report_row(contribution) for contribution in contributions],
+                    next_cursor=next_cursor,
+                    total=fundraiser.contribution_count,
+                ),
+                fundraiser,
             )
+        else:
+            return render_fundraiser_page("report.html", fundraiser)
     except Exception as e:
         logging.error(
             "Error in report function for fundraiser ID %s: %s", fundraiser_id, str(e)
@@ -683,35 +988,262 @@ Returns:
             "An error occurred while fetching the report. Please try again later.",
             "error",
         )
-        return redirect(url_for("fundraiser"))
+        return redirect(url_for("main.fundraiser"))
+
+
+# Number of rows read from the database and written to the response per chunk
+EXPORT_CHUNK_SIZE = 1000
+
+
+@main.route("/report/<int:fundraiser_id>/export")
+@login_required
+def export_report(fundraiser_id):
+    """
+    Streams every contribution of a fundraiser as CSV (default) or newline-delimited JSON.
+
+    The `format` query parameter selects "csv" or "ndjson". Rows are read from a server-side
+    cursor EXPORT_CHUNK_SIZE at a time and written out as they arrive, so memory use does not
+    grow with the size of the fundraiser and the first bytes go out before the query finishes.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser to export.
+
+    Returns:
+        A streamed attachment response, or a JSON error with status 400 for an unknown format.
+    """
+    fundraiser = owned_fundraiser_or_404(fundraiser_id)
+    archived = fundraiser.archived_at is not None
+    export_format = request.args.get("format", "csv")
+    if export_format not in ("csv", "ndjson"):
+        return jsonify({"status": "error", "message": "Unsupported export format"}), 400
+
+    def generate_csv():
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue()
+        for rows in iter_contribution_rows(fundraiser.id, EXPORT_CHUNK_SIZE, archived):
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(rows)
+            yield buffer.getvalue()
+
+    def generate_ndjson():
+        for rows in iter_contribution_rows(fundraiser.id, EXPORT_CHUNK_SIZE, archived):
+            yield "".join(
+                json.dumps(dict(zip(EXPORT_COLUMNS, row)), default=str) + "\n"
+                for row in rows
+            )
+
+    logging.info("Exporting contributions for fundraiser ID %s as %s", fundraiser.id, export_format)
+    if export_format == "csv":
+        body, mimetype = generate_csv(), "text/csv"
+    else:
+        body, mimetype = generate_ndjson(), "application/x-ndjson"
+    return Response(
+        stream_with_context(body),
+        mimetype=mimetype,
+        headers={
+            "Content-Disposition": f"attachment; filename=fundraiser_{fundraiser.id}_contributions.{export_format}"
+        },
+    )
+
+
+# Number of top contributors listed by the analytics endpoint by default, at most
+# ANALYTICS_MAX_TOP_CONTRIBUTORS
+ANALYTICS_TOP_CONTRIBUTORS = 10
+
+
+@main.route("/report/<int:fundraiser_id>/analytics")
+@login_required
+def report_analytics(fundraiser_id):
+    """
+    Returns the contribution analytics of a fundraiser as JSON.
+
+    The figures come from the hourly and contributor rollups, which are kept up to date with
+    every contribution, so the response costs the same for a small or a very large fundraiser.
+    The `top` query parameter sets how many top contributors are listed (default 10, at most 100).
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser to describe.
+
+    Returns:
+        A JSON response with the fields:
+            - funds_raised (decimal): The total amount raised.
+            - contribution_count (int): The number of contributions.
+            - average_contribution (decimal): The average contribution amount.
+            - daily (list): date, amount and count for each day with contributions.
+            - hourly (list): hour, amount and count for each hour of the day.
+            - top_contributors (list): contributor_name, phone_number, amount and count.
+        or 304 Not Modified when the client's ETag or Last-Modified is still current.
+    """
+    fundraiser = owned_fundraiser_or_404(fundraiser_id)
+    cached = not_modified(fundraiser)
+    if cached is not None:
+        return cached
+    top = request.args.get("top", ANALYTICS_TOP_CONTRIBUTORS, type=int)
+    top = max(1, min(top, ANALYTICS_MAX_TOP_CONTRIBUTORS))
+    logging.info("Fetched analytics for fundraiser ID %s", fundraiser.id)
+    return add_validators(jsonify(fundraiser_analytics(fundraiser, top=top)), fundraiser)
+
 
+# Default and maximum number of contributions returned by a report search
+SEARCH_PAGE_SIZE = 50
+SEARCH_MAX_PAGE_SIZE = REPORT_MAX_PAGE_SIZE
 
-@app.route("/delete_fundraiser", methods=["POST"])
+
+def parse_amount(value):
+    """Parses an amount filter, rejecting NaN and infinities."""
+    amount = Decimal(value)
+    if not amount.is_finite():
+        raise ValueError(f"Amount out of range: {value}")
+    return amount
+
+
+def parse_date(value):
+    """Parses a YYYY-MM-DD date filter."""
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def search_filter(name, parse):
+    """Parses an optional search filter from the query string, returning None when it is empty."""
+    value = request.args.get(name, "").strip()
+    return parse(value) if value else None
+
+
+@main.route("/report/<int:fundraiser_id>/search")
+@login_required
+def search_report(fundraiser_id):
+    """
+    Searches a fundraiser's contributions and returns the matches as JSON, most recent first.
+
+    The `q` query parameter is matched word by word against the contributor's name, phone
+    number and M-Pesa reference, the last word as a prefix. `min_amount` and `max_amount`
+    bound the amount, and `from` and `to` (YYYY-MM-DD) bound the contribution date, both
+    inclusive. `limit` sets how many matches are returned (default 50, at most 500).
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser to search.
+
+    Returns:
+        A JSON response with the fields:
+            - items (list): The matching contributions as report rows.
+            - truncated (bool): Whether there were more matches than `limit`.
+        a JSON error with status 400 for a malformed amount or date, or 304 Not Modified when
+        the client's ETag or Last-Modified is still current.
+    """
+    fundraiser = owned_fundraiser_or_404(fundraiser_id)
+    cached = not_modified(fundraiser)
+    if cached is not None:
+        return cached
+    try:
+        min_amount = search_filter("min_amount", parse_amount)
+        max_amount = search_filter("max_amount", parse_amount)
+        date_from = search_filter("from", parse_date)
+        date_to = search_filter("to", parse_date)
+    except (InvalidOperation, ValueError) as e:
+        logging.warning("Invalid search filter for fundraiser ID %s: %s", fundraiser_id, str(e))
+        return jsonify({"status": "error", "message": "Invalid search filter"}), 400
+    limit = request.args.get("limit", SEARCH_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, SEARCH_MAX_PAGE_SIZE))
+
+    contributions, truncated = search_contributions(
+        fundraiser_id,
+        text=request.args.get("q"),
+        min_amount=min_amount,
+        max_amount=max_amount,
+        date_from=date_from,
+        date_to=date_to,
+        limit=limit,
+        archived=fundraiser.archived_at is not None,
+    )
+    logging.info("Searched contributions for fundraiser ID %s", fundraiser_id)
+    return add_validators(
+        jsonify(items=[report_row(contribution) for contribution in contributions], truncated=truncated),
+        fundraiser,
+    )
+
+
+# Seconds a PDF download waits for a render before answering 202 Accepted
+REPORT_PDF_WAIT = 5
+
+
+@main.route("/report/<int:fundraiser_id>/pdf")
+@login_required
+def report_pdf(fundraiser_id):
+    """
+    Serves the contribution report of a fundraiser as a PDF rendered on the server.
+
+    The rendered file is cached until the fundraiser gets new contributions. On a cache miss the
+    render runs in the background report pool; if it does not finish within REPORT_PDF_WAIT seconds
+    the route answers 202 with a Retry-After header and the client asks again.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser to report on.
+
+    Returns:
+        The PDF as an attachment with an ETag for the cached version (304 if the client already has it),
+        or a JSON response with status 202 while the report is still rendering.
+    """
+    from reports import get_report_pdf
+
+    fundraiser = owned_fundraiser_or_404(fundraiser_id)
+    key, path, future = get_report_pdf(
+        current_app._get_current_object(),
+        fundraiser,
+        latest_contribution_id(fundraiser.id, archived=fundraiser.archived_at is not None),
+    )
+    if path is None:
+        try:
+            path = future.result(timeout=REPORT_PDF_WAIT)
+        except TimeoutError:
+            logging.info("Report PDF for fundraiser ID %s is still rendering", fundraiser.id)
+            response = jsonify({"status": "pending", "message": "The report is being prepared."})
+            response.status_code = 202
+            response.headers["Retry-After"] = "2"
+            return response
+        except Exception as e:
+            logging.error("Error rendering report PDF for fundraiser ID %s: %s", fundraiser.id, str(e))
+            return jsonify({"status": "error", "message": "An error occurred while preparing the report."}), 500
+
+    response = send_file(
+        path,
+        mimetype="application/pdf",
+        as_attachment=True,
+        download_name=f"Fundraiser_Report_{fundraiser.name}.pdf",
+        etag=key,
+        max_age=0,
+    )
+    response.cache_control.private = True
+    response.cache_control.must_revalidate = True
+    return response
+
+
+@main.route("/delete_fundraiser", methods=["POST"])
 def delete_fundraiser():
     if "user_id" not in session:
         logging.warning("Attempt to delete fundraiser without being logged in.")
         return jsonify(success=False, message="User not logged in.")
 
     user_id = session["user_id"]
-    fundraiser = Fundraiser.query.filter_by(user_id=user_id).first()
-
+    # a user may have several fundraisers, so the one to delete must always be named
+    body = request.get_json(silent=True) or request.form
+    requested_id = body.get("fundraiser_id")
+    if requested_id is None or not str(requested_id).isdigit():
+        logging.warning("Delete request without a valid fundraiser ID from user ID %s.", user_id)
+        return jsonify(success=False, message="A fundraiser ID is required."), 400
+
+    fundraiser = Fundraiser.query.filter_by(id=int(requested_id), user_id=user_id).first()
     if not fundraiser:
-        logging.warning("No active fundraiser found for user ID %s.", user_id)
-        return jsonify(success=False, message="No active fundraiser found.")
+        logging.warning("No fundraiser %s found for user ID %s.", requested_id, user_id)
+        return jsonify(success=False, message="Fundraiser not found."), 404
 
+    fundraiser_id = fundraiser.id
     try:
-        # Fetch contributions
-        contributions = Contribution.query.filter_by(fundraiser_id=fundraiser.id).all()
-
-        # Delete contributions
-        for contribution in contributions:
-            db.session.delete(contribution)
-        logging.info("All contributions for fundraiser ID %s deleted.", fundraiser.id)
-
-        # Delete fundraiser
-        db.session.delete(fundraiser)
-        db.session.commit()
-        logging.info("Fundraiser ID %s deleted successfully.", fundraiser.id)
+        deleted = purge_fundraiser(fundraiser_id)
+        logging.info(
+            "Fundraiser ID %s deleted successfully with %s contributions.", fundraiser_id, deleted
+        )
 
         return jsonify(
             success=True, message="Fundraiser and contributions deleted successfully."
@@ -720,7 +1252,7 @@ def delete_fundraiser():
     except Exception as e:
         db.session.rollback()
         logging.error(
-            "Error occurred while deleting fundraiser ID %s: %s", fundraiser.id, str(e)
+            "Error occurred while deleting fundraiser ID %s: %s", fundraiser_id, str(e)
         )
         return jsonify(
             success=False,
@@ -728,5 +1260,83 @@ def delete_fundraiser():
         )
 
 
+@main.cli.command("build-assets")
+def build_static_assets():
+    """Fingerprint and precompress the static files for long-lived caching."""
+    from assets import build_assets
+
+    manifest = build_assets(current_app.static_folder)
+    click.echo(f"Built {len(manifest)} static assets.")
+
+
+# Days after its end date before a fundraiser is archived
+ARCHIVE_AFTER_DAYS = int(os.environ.get("ARCHIVE_AFTER_DAYS", 30))
+
+
+@main.cli.command("archive-fundraisers")
+@click.option("--days", default=ARCHIVE_AFTER_DAYS, help="Archive fundraisers that ended more than this many days ago.")
+@click.option("--once", is_flag=True, help="Archive once and exit.")
+@click.option("--interval", default=3600.0, help="Seconds between two runs.")
+def archive_fundraisers(days, once, interval):
+    """Move the contributions of ended fundraisers to the archive tables."""
+    while True:
+        try:
+            archived = archive_ended_fundraisers(datetime.utcnow() - timedelta(days=days))
+        except Exception as e:
+            db.session.rollback()
+            logging.error("Archiving fundraisers failed: %s", str(e))
+            archived = []
+        for fundraiser_id, moved in archived:
+            click.echo(f"Archived fundraiser {fundraiser_id}, {moved} contributions moved.")
+        if once:
+            return
+        time.sleep(interval)
+
+
+@main.cli.command("reconcile-totals")
+@click.option("--fix", is_flag=True, help="Rewrite the stored totals that are wrong.")
+def reconcile_totals(fix):
+    """Check the stored fundraiser totals against the live and archived contributions."""
+    mismatches = reconcile_fundraiser_totals(fix=fix)
+    for fundraiser_id, stored_total, stored_count, actual_total, actual_count in mismatches:
+        click.echo(
+            f"Fundraiser {fundraiser_id}: stored {stored_total} ({stored_count} contributions), "
+            f"actual {actual_total} ({actual_count} contributions)"
+        )
+
+    if not mismatches:
+        click.echo("All fundraiser totals are correct.")
+    elif fix:
+        click.echo(f"Rebuilt totals for {len(mismatches)} fundraisers.")
+    else:
+        raise SystemExit(1)
+
+
+@main.cli.command("rebuild-rollups")
+@click.option("--fundraiser-id", type=int, help="Only rebuild this fundraiser's rollups.")
+def rebuild_rollups(fundraiser_id):
+    """Recompute the contribution rollups from the live and archived contributions."""
+    rebuild_contribution_rollups(fundraiser_id)
+    click.echo("Rebuilt contribution rollups.")
+
+
+@main.cli.command("check-query-plans")
+@click.option("--fundraiser-id", default=1, help="Fundraiser to run the queries against.")
+@click.option("--user-id", default=1, help="User to run the queries against.")
+def check_plans(fundraiser_id, user_id):
+    """Fail if any hot query falls back to a full table scan."""
+    from query_plans import check_query_plans
+
+    failed = False
+    for name, statement, plan, problems in check_query_plans(fundraiser_id, user_id):
+        click.echo(f"{'FAIL' if problems else 'ok'}  {name}: {'; '.join(plan)}")
+        if problems:
+            failed = True
+            click.echo(f"      {statement}")
+
+    if failed:
+        raise SystemExit(1)
+
+
 if __name__ == "__main__":
-    app.run(debug=True)
+    create_app().run(debug=True)
@@ -0,0 +1,140 @@
+"""
+Fingerprinted, precompressed static assets.
+
+`flask build-assets` copies every file under static/ to static/dist/ with a hash of its
+content in the name, so js/scripts.js becomes dist/js/scripts.<hash>.js. It writes gzip
+and brotli variants of the text files next to the copies and records the names in
+static/dist/manifest.json.
+
+When the manifest exists, url_for("static", ...) emits the fingerprinted names, and those
+are served with a one-year max-age and Cache-Control: immutable, so a browser that already
+has a page's assets loads them without a request. A changed file gets a new name. Clients
+that accept br or gzip get the precompressed variant without any compression at request
+time.
+
+Run the build again after changing a static file. Without a manifest, the static files
+are served by Flask as usual.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import shutil
+
+from flask import request, send_from_directory
+
+# Folder under static/ that receives the build, and the manifest in it
+ASSET_DIR = "dist"
+MANIFEST = "manifest.json"
+# Files worth compressing; images and fonts are compressed already
+COMPRESSIBLE = (".css", ".js", ".json", ".svg", ".ico", ".txt", ".map")
+# Precompressed variants in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+
+def fingerprinted_name(filename, content):
+    stem, extension = os.path.splitext(filename)
+    return f"{stem}.{hashlib.sha256(content).hexdigest()[:12]}{extension}"
+
+
+def build_assets(static_folder):
+    """
+    Writes the fingerprinted copies, their compressed variants and the manifest.
+
+    Parameters:
+        static_folder (str): The app's static folder.
+
+    Returns:
+        dict: The manifest, mapping each static filename to its fingerprinted name.
+    """
+    import brotli
+
+    output = os.path.join(static_folder, ASSET_DIR)
+    shutil.rmtree(output, ignore_errors=True)
+    manifest = {}
+    for directory, subdirectories, files in os.walk(static_folder):
+        if directory == static_folder and ASSET_DIR in subdirectories:
+            subdirectories.remove(ASSET_DIR)
+        for file in sorted(files):
+            # skip dotfiles and the empty "Icon\r" files left by macOS
+            if file.startswith(".") or file == "Icon\r":
+                continue
+            source = os.path.join(directory, file)
+            filename = os.path.relpath(source, static_folder).replace(os.sep, "/")
+            with open(source, "rb") as f:
+                content = f.read()
+            name = f"{ASSET_DIR}/{fingerprinted_name(filename, content)}"
+            target = os.path.join(static_folder, name)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as f:
+                f.write(content)
+            if filename.endswith(COMPRESSIBLE):
+                for suffix, compressed in (
+                    (".br", brotli.compress(content, quality=11)),
+                    (".gz", gzip.compress(content, compresslevel=9, mtime=0)),
+                ):
+                    if len(compressed) < len(content):
+                        with open(target + suffix, "wb") as f:
+                            f.write(compressed)
+            manifest[filename] = name
+
+    with open(os.path.join(output, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def send_asset(static_folder, filename, encodings):
+    """Sends a fingerprinted file, precompressed if the client accepts one of its variants."""
+    for encoding, suffix in ENCODINGS:
+        if encoding in encodings and request.accept_encodings[encoding]:
+            response = send_from_directory(
+                static_folder,
+                filename + suffix,
+                mimetype=mimetypes.guess_type(filename)[0],
+                max_age=IMMUTABLE_MAX_AGE,
+            )
+            response.content_encoding = encoding
+            break
+    else:
+        response = send_from_directory(static_folder, filename, max_age=IMMUTABLE_MAX_AGE)
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+
+def init_assets(app):
+    """Makes url_for("static", ...) emit fingerprinted names and serves them, if a build exists."""
+    try:
+        with open(os.path.join(app.static_folder, ASSET_DIR, MANIFEST)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return
+
+    # the compressed variants that were written, for each fingerprinted name
+    variants = {
+        name: {
+            encoding
+            for encoding, suffix in ENCODINGS
+            if os.path.exists(os.path.join(app.static_folder, name + suffix))
+        }
+        for name in manifest.values()
+    }
+
+    @app.url_defaults
+    def fingerprint_static_url(endpoint, values):
+        if endpoint == "static" and values.get("filename") in manifest:
+            values["filename"] = manifest[values["filename"]]
+
+    send_static_file = app.view_functions["static"]
+
+    def static(filename):
+        if filename in variants:
+            return send_asset(app.static_folder, filename, variants[filename])
+        return send_static_file(filename=filename)
+
+    app.view_functions["static"] = static
+    logging.info("Serving %s fingerprinted static assets", len(manifest))
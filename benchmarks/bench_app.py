@@ -0,0 +1,217 @@
+"""
+Micro-benchmarks of the hot paths, against a database filled by seed_data.py.
+
+    funds raised         the stored running total against SUM() over the contributions
+    parse message        mpesa.parse_message() on one confirmation message
+    save contribution    a full POST to save_contribution through the test client
+    report rows          contributions_page() and report_row() for one page, serialized
+    report request       a full GET of the report JSON through the test client
+    report revalidate    the same GET with a current If-None-Match, answered 304
+    render report page   report.html rendered from scratch, and served from the page cache
+    dashboard            a full GET of the dashboard of a user with --campaigns fundraisers
+    search               full GETs of the report search on the busiest fundraiser: an exact
+                         phone number, a common first name, and that name within one month
+
+Each benchmark runs for a fixed number of iterations, repeated, and the best repeat
+is reported. Pass --database to reuse a seeded file, otherwise a temporary one is
+seeded with --contributions rows. The save benchmark adds its contributions to the
+database it runs against.
+
+    python benchmarks/bench_app.py [--database /tmp/bench.db] [--contributions 100000]
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import seed_data  # noqa: E402
+from mpesa_corpus import make_corpus, make_message  # noqa: E402
+
+
+def timeit(function, iterations, repeats):
+    """Returns the best time per call over the repeats, in seconds."""
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            function()
+        elapsed = (time.perf_counter() - start) / iterations
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def dashboard_user(campaigns, contributions=20):
+    """
+    Returns the username of an organiser running `campaigns` fundraisers, each with a few
+    contributions. The user is created on first use and kept in the database.
+    """
+    from werkzeug.security import generate_password_hash
+
+    from models import db, Fundraiser, User, insert_contributions
+
+    name = f"organiser{campaigns}@example.com"
+    if User.query.filter_by(username=name).first() is None:
+        rng = random.Random(campaigns)
+        user = User(username=name, password=generate_password_hash(seed_data.PASSWORD))
+        db.session.add(user)
+        db.session.flush()
+        for index in range(campaigns):
+            fundraiser = Fundraiser(user.id, f"Campaign {index}", "Synthetic fundraiser", seed_data.START, 100000)
+            db.session.add(fundraiser)
+            db.session.flush()
+            insert_contributions(
+                fundraiser.id,
+                [seed_data.make_contribution(rng, fundraiser.id, i) for i in range(contributions)],
+            )
+        db.session.commit()
+    return name
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database", help="A database seeded by seed_data.py.")
+    parser.add_argument("--contributions", type=int, default=100000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--page-size", type=int, default=50)
+    parser.add_argument("--campaigns", type=int, default=300, help="Fundraisers of the dashboard user.")
+    args = parser.parse_args()
+
+    if args.database and os.path.exists(args.database):
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.abspath(args.database)}"
+        from app import create_app
+
+        app = create_app()
+    else:
+        path = args.database or os.path.join(tempfile.mkdtemp(prefix="nijenge-bench-"), "bench.db")
+        app = seed_data.create_database(path)
+        with app.app_context():
+            seed_data.seed(contributions=args.contributions, echo=lambda line: None)
+
+    from sqlalchemy import func
+
+    from flask import render_template
+
+    from app import report_row
+    from models import db, Fundraiser, Contribution, User, contributions_page
+    from mpesa import parse_message
+    from page_cache import cache, render_fundraiser_page
+
+    with app.app_context():
+        busiest = Fundraiser.query.order_by(Fundraiser.contribution_count.desc()).first()
+        fundraiser_id = busiest.id
+        owner = db.session.get(User, busiest.user_id).username
+        # references stay unique when the benchmark is run again on the same database
+        first_reference = db.session.query(func.max(Contribution.contribution_id)).scalar() or 0
+        print(f"fundraiser {fundraiser_id}: {busiest.contribution_count:,} contributions")
+        sample = db.session.execute(
+            db.select(Contribution.phone_number, Contribution.contributor_name, Contribution.contribution_date)
+            .filter_by(fundraiser_id=fundraiser_id)
+            .limit(1)
+        ).one()
+
+    with app.app_context():
+        organiser = dashboard_user(args.campaigns)
+
+    client = app.test_client()
+    client.post("/login", data={"username": owner, "password": seed_data.PASSWORD})
+    dashboard_client = app.test_client()
+    dashboard_client.post("/login", data={"username": organiser, "password": seed_data.PASSWORD})
+    rng = random.Random(1)
+    corpus = make_corpus(1000)
+    messages = itertools.cycle(corpus)
+    submitted = itertools.count(first_reference)
+
+    def stored_total():
+        db.session.get(Fundraiser, fundraiser_id, populate_existing=True).funds_raised
+        db.session.rollback()
+
+    def summed_total():
+        db.session.query(func.sum(Contribution.amount)).filter_by(fundraiser_id=fundraiser_id).scalar()
+        db.session.rollback()
+
+    def report_rows():
+        contributions, _ = contributions_page(fundraiser_id, args.page_size)
+        json.dumps([report_row(contribution) for contribution in contributions])
+        db.session.rollback()
+
+    def save_contribution():
+        message = make_message(rng, reference=f"B{next(submitted):09d}")
+        response = client.post(f"/fundraiser_success/{fundraiser_id}", data={"message": message})
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+    def report_request():
+        response = client.get(f"/report/{fundraiser_id}?format=json&limit={args.page_size}")
+        assert response.status_code == 200, response.get_data(as_text=True)
+        return response
+
+    def report_revalidate():
+        response = client.get(
+            f"/report/{fundraiser_id}?format=json&limit={args.page_size}",
+            headers={"If-None-Match": etag},
+        )
+        assert response.status_code == 304, response.status
+
+    def render_page():
+        with app.test_request_context(f"/report/{fundraiser_id}"):
+            fundraiser = db.session.get(Fundraiser, fundraiser_id)
+            cache.clear()
+            render_template("report.html", fundraiser=fundraiser)
+
+    def dashboard():
+        response = dashboard_client.get("/dashboard")
+        assert response.status_code == 200, response.status
+
+    def search(query):
+        def request():
+            response = client.get(f"/report/{fundraiser_id}/search?{query}")
+            assert response.status_code == 200, response.get_data(as_text=True)
+
+        return request
+
+    first_name = sample.contributor_name.split()[0]
+    month = sample.contribution_date.replace(day=1)
+    month_end = (month + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+
+    def cached_page():
+        with app.test_request_context(f"/report/{fundraiser_id}"):
+            render_fundraiser_page("report.html", db.session.get(Fundraiser, fundraiser_id))
+
+    benchmarks = (
+        ("funds raised (stored)", stored_total, True),
+        ("funds raised (SUM)", summed_total, True),
+        ("parse message", lambda: parse_message(next(messages)), False),
+        ("save contribution", save_contribution, False),
+        (f"report rows ({args.page_size})", report_rows, True),
+        (f"report request ({args.page_size})", report_request, False),
+        (f"report revalidate ({args.page_size})", report_revalidate, False),
+        ("render report page", render_page, True),
+        ("render report page (cached)", cached_page, True),
+        (f"dashboard ({args.campaigns} campaigns)", dashboard, False),
+        ("search phone", search(f"q={sample.phone_number}"), False),
+        ("search name", search(f"q={first_name}"), False),
+        ("search name + month", search(f"q={first_name}&from={month}&to={month_end}"), False),
+    )
+    etag = None
+    for name, function, needs_context in benchmarks:
+        if function is report_revalidate:
+            etag = report_request().headers["ETag"]
+        iterations = args.iterations * (50 if name == "parse message" else 1)
+        if needs_context:
+            with app.app_context():
+                elapsed = timeit(function, iterations, args.repeats)
+        else:
+            elapsed = timeit(function, iterations, args.repeats)
+        print(f"{name:28} {elapsed * 1e6:10.1f} us/op {1 / elapsed:12,.0f} ops/s")
+
+
+if __name__ == "__main__":
+    main()
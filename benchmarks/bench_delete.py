@@ -0,0 +1,123 @@
+"""
+Fundraiser deletion benchmark.
+
+Seeds one fundraiser with --contributions rows in a temporary database and deletes it,
+once for each mode:
+
+    orm        the previous delete_fundraiser: load every Contribution, session.delete()
+               each one and the fundraiser, one commit
+    chunked    purge_fundraiser(), set-based DELETEs of --chunk-size rows per transaction
+
+and reports the total time and the longest transaction, which is how long other writers
+were locked out at most. With --memory it also reports the peak Python memory allocated
+while deleting; tracing allocations slows everything down, so compare times from runs
+without it.
+
+    python benchmarks/bench_delete.py [--contributions 10000] [--chunk-size 5000] [--memory]
+        [--modes orm,chunked]
+
+The orm mode slows down faster than the fundraiser grows; time larger fundraisers with
+--modes chunked.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import seed_data  # noqa: E402
+
+
+def delete_orm(fundraiser_id, chunk_size):
+    from models import db, Contribution, Fundraiser
+
+    deleted = 0
+    for contribution in Contribution.query.filter_by(fundraiser_id=fundraiser_id).all():
+        db.session.delete(contribution)
+        deleted += 1
+    db.session.delete(db.session.get(Fundraiser, fundraiser_id))
+    db.session.commit()
+    return deleted
+
+
+def delete_chunked(fundraiser_id, chunk_size):
+    from models import purge_fundraiser
+
+    return purge_fundraiser(fundraiser_id, chunk_size)
+
+
+MODES = {"orm": delete_orm, "chunked": delete_chunked}
+
+
+def transaction_timer(engine):
+    """Records the duration of every transaction on the engine into the returned list."""
+    from sqlalchemy import event
+
+    durations, started = [], {}
+
+    @event.listens_for(engine, "begin")
+    def begin(connection):
+        started[id(connection)] = time.perf_counter()
+
+    @event.listens_for(engine, "commit")
+    def commit(connection):
+        durations.append(time.perf_counter() - started.pop(id(connection), time.perf_counter()))
+
+    return durations
+
+
+def run(mode, args, workdir):
+    app = seed_data.create_database(os.path.join(workdir, f"{mode}.db"))
+    with app.app_context():
+        from models import db, Contribution, ContributionDailyRollup, Fundraiser
+
+        (fundraiser_id,) = seed_data.seed(1, args.contributions, echo=lambda line: None)
+        db.session.remove()
+        durations = transaction_timer(db.engine)
+
+        if args.memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        deleted = MODES[mode](fundraiser_id, args.chunk_size)
+        elapsed = time.perf_counter() - start
+        peak = None
+        if args.memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        left = (
+            db.session.query(Contribution).count()
+            + db.session.query(ContributionDailyRollup).count()
+            + db.session.query(Fundraiser).count()
+        )
+        if left:
+            sys.exit(f"{mode}: {left} rows left after deleting the fundraiser")
+    return deleted, elapsed, max(durations), len(durations), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--contributions", type=int, default=10000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--modes", default="orm,chunked", help="Comma-separated modes to run.")
+    parser.add_argument("--memory", action="store_true", help="Trace the peak Python memory.")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="nijenge-delete-")
+    os.environ.setdefault("LOG_FILE", os.path.join(workdir, "app.log"))
+    print(f"deleting a fundraiser with {args.contributions:,} contributions")
+    results = [(mode, *run(mode, args, workdir)) for mode in args.modes.split(",")]
+    header = f"{'mode':8} {'total s':>9} {'longest tx ms':>14} {'commits':>8}"
+    print(header + (f" {'peak MB':>9}" if args.memory else ""))
+    for mode, deleted, elapsed, longest, commits, peak in results:
+        line = f"{mode:8} {elapsed:9.2f} {longest * 1000:14.1f} {commits:8}"
+        if peak is not None:
+            line += f" {peak / 2**20:9.1f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
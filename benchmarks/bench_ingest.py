@@ -0,0 +1,149 @@
+"""
+Sustained contribution ingestion through gunicorn.
+
+Submits new M-Pesa messages to save_contribution open-loop, at --rate requests per second
+times each of --multipliers in turn (1x and 10x by default), and reports for each rate the
+contributions saved per second and the p50/p95/p99 request latency. Requests that have to
+wait for a busy server are still sent on schedule, so a server that cannot keep up shows
+it as a lower saved rate and a growing latency rather than as a slower client.
+
+Without --url the test seeds a temporary database and serves it with gunicorn, 4 workers
+by default, as load_test.py does. Run it with WRITE_BATCH_MAX_ROWS=1 in the environment to
+compare against one commit per contribution.
+
+    python benchmarks/bench_ingest.py [--rate 50] [--multipliers 1,10] [--duration 20] [--workers 4]
+"""
+import argparse
+import http.cookiejar
+import os
+import random
+import string
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import seed_data  # noqa: E402
+from load_test import NoRedirect, percentile, start_server  # noqa: E402
+from mpesa_corpus import make_message  # noqa: E402
+
+
+class Client:
+    """One logged-in cookie session shared by the sending threads."""
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+        self.opener = urllib.request.build_opener(
+            NoRedirect, urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+        self.fundraiser_id = None
+
+    def login(self, user):
+        form = {"username": seed_data.username(user), "password": seed_data.PASSWORD}
+        try:
+            self.opener.open(self.base_url + "/login", urllib.parse.urlencode(form).encode(), timeout=30)
+        except urllib.error.HTTPError:
+            pass
+        try:
+            self.opener.open(self.base_url + "/report_index", timeout=30)
+        except urllib.error.HTTPError as e:
+            location = urllib.parse.urlparse(e.headers.get("Location", ""))
+            if location.path.startswith("/report/"):
+                self.fundraiser_id = int(location.path.rsplit("/", 1)[1])
+        if self.fundraiser_id is None:
+            sys.exit("could not log in and find the fundraiser of the seeded user")
+
+    def submit(self, message):
+        """Posts one message. Returns (seconds, saved)."""
+        body = urllib.parse.urlencode({"message": message}).encode()
+        start = time.perf_counter()
+        try:
+            response = self.opener.open(
+                f"{self.base_url}/fundraiser_success/{self.fundraiser_id}", body, timeout=60
+            )
+            response.read()
+            saved = response.status == 200
+        except (urllib.error.HTTPError, OSError):
+            saved = False
+        return time.perf_counter() - start, saved
+
+
+def run_rate(client, rate, duration, concurrency, prefix):
+    """Sends rate requests per second for duration seconds. Returns (elapsed, latencies, errors)."""
+    rng = random.Random(prefix)
+    messages = [
+        make_message(rng, reference=f"{prefix}{i:07d}") for i in range(int(rate * duration))
+    ]
+    latencies, errors = [], 0
+    lock = threading.Lock()
+
+    def send(message):
+        nonlocal errors
+        seconds, saved = client.submit(message)
+        with lock:
+            if saved:
+                latencies.append(seconds)
+            else:
+                errors += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for i, message in enumerate(messages):
+            delay = start + i / rate - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(send, message)
+    return time.perf_counter() - start, sorted(latencies), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="A running server whose database was filled by seed_data.py.")
+    parser.add_argument("--rate", type=float, default=50, help="The 1x rate, in requests per second.")
+    parser.add_argument("--multipliers", default="1,10", help="Comma-separated multiples of --rate.")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds at each rate.")
+    parser.add_argument("--concurrency", type=int, default=256, help="Requests in flight at most.")
+    parser.add_argument("--contributions", type=int, default=20000, help="Rows seeded without --url.")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn workers without --url.")
+    parser.add_argument("--threads", type=int, default=64, help="gunicorn threads without --url.")
+    args = parser.parse_args()
+    args.users = 10
+
+    process = None
+    url = args.url
+    if url is None:
+        url, process = start_server(args)
+    try:
+        client = Client(url)
+        client.login(1)
+        # a fresh reference prefix per run, so a rerun against --url is not all duplicates
+        run = "".join(random.choices(string.ascii_uppercase, k=2))
+        batch_rows = os.environ.get("WRITE_BATCH_MAX_ROWS", "default")
+        print(f"{url}, WRITE_BATCH_MAX_ROWS={batch_rows}")
+        print(
+            f"{'rate':>6} {'offered/s':>10} {'saved/s':>9} {'errors':>7} "
+            f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+        )
+        for multiplier in (float(value) for value in args.multipliers.split(",")):
+            rate = args.rate * multiplier
+            elapsed, latencies, errors = run_rate(
+                client, rate, args.duration, args.concurrency, f"{run}{int(multiplier) % 10}"
+            )
+            line = f"{multiplier:5g}x {rate:10.1f} {len(latencies) / elapsed:9.1f} {errors:7}"
+            if latencies:
+                p50, p95, p99 = (percentile(latencies, f) * 1000 for f in (0.5, 0.95, 0.99))
+                line += f" {p50:8.1f} {p95:8.1f} {p99:8.1f}"
+            print(line)
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Per-request logging overhead: the old synchronous DEBUG file handler against the
+queue-based JSON pipeline in log_config.py.
+
+Each mode runs in its own process against a fresh database, times a batch of
+contribution submissions and report fetches through the test client, and also
+times bare logging calls made from the request thread.
+
+    python benchmarks/bench_logging.py [--requests 500]
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_mode(mode, requests):
+    workdir = tempfile.mkdtemp(prefix="nijenge-logging-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+    os.environ["LOG_FILE"] = os.path.join(workdir, "app.log")
+
+    import random
+
+    from werkzeug.security import generate_password_hash
+
+    from app import create_app
+    from models import db, User, Fundraiser
+    from mpesa_corpus import make_message
+
+    app = create_app()
+    if mode == "legacy":
+        # what logging.basicConfig(filename=..., level=logging.DEBUG) set up
+        root = logging.getLogger()
+        root.handlers[:] = [logging.FileHandler(os.environ["LOG_FILE"])]
+        root.setLevel(logging.DEBUG)
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(User(username="bench@example.com", password=generate_password_hash("bench")))
+        db.session.add(Fundraiser(1, "Bench", "", datetime(2030, 1, 1), 1000000))
+        db.session.commit()
+
+    client = app.test_client()
+    client.post("/login", data={"username": "bench@example.com", "password": "bench"})
+    rng = random.Random(1)
+
+    start = time.perf_counter()
+    for i in range(requests):
+        client.post("/fundraiser_success/1", data={"message": make_message(rng, reference=f"L{i:09d}")})
+        client.get("/report/1?format=json")
+    request_time = (time.perf_counter() - start) / (2 * requests)
+
+    start = time.perf_counter()
+    for i in range(20000):
+        logging.info("Fetched contributions for fundraiser ID: %s", i)
+    call_time = (time.perf_counter() - start) / 20000
+
+    if mode == "queue":
+        import log_config
+
+        log_config._listener.stop()  # drain the queue before measuring the file
+    logging.shutdown()
+    return {
+        "request_ms": request_time * 1000,
+        "log_call_us": call_time * 1e6,
+        "log_bytes": os.path.getsize(os.environ["LOG_FILE"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--mode", choices=("legacy", "queue"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.requests)))
+        return
+
+    for mode in ("legacy", "queue"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--mode", mode, "--requests", str(args.requests)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{mode:7} {result['request_ms']:7.3f} ms/request  "
+            f"{result['log_call_us']:6.2f} us/log call  {result['log_bytes']:>10,} bytes logged"
+        )
+
+
+if __name__ == "__main__":
+    main()
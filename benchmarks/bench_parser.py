@@ -0,0 +1,62 @@
+"""
+Benchmark of the M-Pesa message parser.
+
+Compares mpesa.parse_message() with the six uncompiled re.search calls and two
+strptime calls the contribution view used before, over a corpus of synthetic
+messages, and checks that both produce the same fields.
+
+    python benchmarks/bench_parser.py [--messages 50000]
+"""
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mpesa import parse_message  # noqa: E402
+from mpesa_corpus import make_corpus  # noqa: E402
+
+
+def legacy_parse(message):
+    """The field-by-field parsing previously done inline in save_contribution."""
+    return {
+        "contribution_reference": re.search(r"\b[A-Z0-9]{10}\b", message).group(),
+        "amount": re.search(r"Ksh([\d,]+)\.", message).group(1).replace(",", ""),
+        "contributor_name": re.search(r"from ([A-Z\s]+) \d", message).group(1),
+        "phone_number": re.search(r"(\d+) on", message).group(1),
+        "contribution_date": datetime.strptime(
+            re.search(r"on (\d{1,2}/\d{1,2}/\d{2}) at", message).group(1), "%d/%m/%y"
+        ).date(),
+        "contribution_time": datetime.strptime(
+            re.search(r"at (\d{1,2}:\d{2} (?:AM|PM))", message).group(1), "%I:%M %p"
+        ).time(),
+    }
+
+
+def run(parse, corpus):
+    start = time.perf_counter()
+    for message in corpus:
+        parse(message)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=50000)
+    args = parser.parse_args()
+
+    corpus = make_corpus(args.messages)
+    for message in corpus[:1000]:
+        assert parse_message(message) == legacy_parse(message), message
+
+    for name, parse in (("legacy", legacy_parse), ("mpesa.parse_message", parse_message)):
+        elapsed = run(parse, corpus)
+        print(f"{name:22} {len(corpus) / elapsed:12,.0f} messages/s  ({elapsed:.3f}s)")
+
+
+if __name__ == "__main__":
+    main()
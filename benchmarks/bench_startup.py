@@ -0,0 +1,144 @@
+"""
+Import-time and cold-start benchmark.
+
+Each repeat starts a fresh interpreter and measures, in order:
+
+    import app       importing the app module and everything it imports
+    create_app()     building and configuring the application
+    first request    the first GET / through the test client, including template compilation
+
+and, with --gunicorn, the time from launching gunicorn with --workers workers to the
+first answered request. --top lists the modules that take longest to import, from
+python -X importtime, to see what a new import costs every worker.
+
+    python benchmarks/bench_startup.py [--repeats 5] [--top 15] [--gunicorn --workers 4]
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the fresh interpreter and prints its timings as JSON
+PROBE = """
+import json, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+application = app.create_app()
+created = time.perf_counter()
+application.test_client().get("/")
+served = time.perf_counter()
+print(json.dumps({
+    "import app": imported - start,
+    "create_app()": created - imported,
+    "first request": served - created,
+}))
+"""
+
+
+def probe(env):
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=ROOT, env=env, check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def slowest_imports(env, top):
+    """Returns (cumulative seconds, module) for the slowest modules imported directly by app."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # two spaces of indent are the modules imported by app itself
+        if name.startswith("   ") and not name.startswith("    "):
+            modules.append((int(cumulative) / 1e6, name.strip()))
+    return sorted(modules, reverse=True)[:top]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def gunicorn_boot(env, workers):
+    """Seconds from launching gunicorn to its first answered request."""
+    port = free_port()
+    url = f"http://127.0.0.1:{port}/"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        ["gunicorn", "--workers", str(workers), "--bind", f"127.0.0.1:{port}"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while True:
+            try:
+                urllib.request.urlopen(url, timeout=1).read()
+                return time.perf_counter() - start
+            except OSError:
+                if process.poll() is not None or time.perf_counter() - start > 60:
+                    sys.exit("gunicorn did not start")
+                time.sleep(0.01)
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0, help="List the N slowest imports of app.")
+    parser.add_argument("--gunicorn", action="store_true", help="Also time a gunicorn boot.")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn workers with --gunicorn.")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="nijenge-startup-")
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{os.path.join(workdir, 'startup.db')}",
+        LOG_FILE=os.path.join(workdir, "app.log"),
+        PROMETHEUS_MULTIPROC_DIR=os.path.join(workdir, "metrics"),
+    )
+    os.makedirs(env["PROMETHEUS_MULTIPROC_DIR"])
+
+    timings = {}
+    for _ in range(args.repeats):
+        for name, seconds in probe(env).items():
+            timings.setdefault(name, []).append(seconds)
+    if args.gunicorn:
+        timings[f"gunicorn boot ({args.workers} workers)"] = [
+            gunicorn_boot(env, args.workers) for _ in range(args.repeats)
+        ]
+
+    print(f"{'phase':28} {'median ms':>10} {'min ms':>10}")
+    for name, values in timings.items():
+        print(f"{name:28} {statistics.median(values) * 1000:10.1f} {min(values) * 1000:10.1f}")
+
+    if args.top:
+        print("\nslowest imports of app (cumulative):")
+        for seconds, module in slowest_imports(env, args.top):
+            print(f"  {module:28} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+Local HTTP load test: login, contribution submit and report fetch.
+
+Each virtual user is a thread with its own cookie session. It logs in as one of the
+users created by seed_data.py, finds its fundraiser through /report_index, then
+alternates submitting a new M-Pesa message and fetching the first report page,
+logging in again every --actions-per-login rounds. Latencies are reported per step
+as p50/p95/p99.
+
+Without --url the test seeds a temporary database and serves it with gunicorn on a
+free local port. --max-p95 makes the run fail when any step is slower than the
+given number of milliseconds at p95, so it can gate a deploy.
+
+    python benchmarks/load_test.py [--users 8] [--duration 30] [--url http://127.0.0.1:8000]
+"""
+import argparse
+import http.cookiejar
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import seed_data  # noqa: E402
+from mpesa_corpus import make_message  # noqa: E402
+
+STEPS = ("login", "submit contribution", "report page")
+
+
+class NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class VirtualUser(threading.Thread):
+    def __init__(self, index, base_url, deadline, actions_per_login, results):
+        super().__init__(daemon=True)
+        self.index = index
+        self.base_url = base_url.rstrip("/")
+        self.deadline = deadline
+        self.actions_per_login = actions_per_login
+        self.results = results
+        self.rng = random.Random(index)
+        self.opener = urllib.request.build_opener(
+            NoRedirect, urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar())
+        )
+        self.fundraiser_id = None
+        self.submitted = 0
+
+    def request(self, step, path, data=None, expect=(200,)):
+        """Times one request and records it under step. Returns the response, or None if it failed."""
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        start = time.perf_counter()
+        try:
+            response = self.opener.open(self.base_url + path, body, timeout=30)
+            response.read()
+        except urllib.error.HTTPError as e:
+            # redirects are not followed and surface here
+            response = e
+            response.read()
+        except OSError:
+            response = None
+        elapsed = time.perf_counter() - start
+        ok = response is not None and response.status in expect
+        self.results.record(step, elapsed, ok)
+        return response if ok else None
+
+    def find_fundraiser(self):
+        try:
+            self.opener.open(self.base_url + "/report_index", timeout=30)
+        except urllib.error.HTTPError as e:
+            location = urllib.parse.urlparse(e.headers.get("Location", ""))
+            if location.path.startswith("/report/"):
+                self.fundraiser_id = int(location.path.rsplit("/", 1)[1])
+
+    def run(self):
+        while time.perf_counter() < self.deadline:
+            response = self.request(
+                "login",
+                "/login",
+                {"username": seed_data.username(self.index + 1), "password": seed_data.PASSWORD},
+                expect=(302,),
+            )
+            if response is None or "login_error" in response.headers.get("Location", ""):
+                time.sleep(0.1)
+                continue
+            if self.fundraiser_id is None:
+                self.find_fundraiser()
+                if self.fundraiser_id is None:
+                    return
+            for _ in range(self.actions_per_login):
+                if time.perf_counter() >= self.deadline:
+                    return
+                self.submitted += 1
+                reference = f"L{self.index:03d}{self.submitted:06d}"
+                self.request(
+                    "submit contribution",
+                    f"/fundraiser_success/{self.fundraiser_id}",
+                    {"message": make_message(self.rng, reference=reference)},
+                )
+                self.request("report page", f"/report/{self.fundraiser_id}?format=json&limit=50")
+
+
+class Results:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def record(self, step, elapsed, ok):
+        with self.lock:
+            if ok:
+                self.latencies[step].append(elapsed)
+            else:
+                self.errors[step] += 1
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list."""
+    return values[min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))]
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args):
+    """Seeds a temporary database and serves it with gunicorn. Returns (url, process)."""
+    workdir = tempfile.mkdtemp(prefix="nijenge-load-")
+    database = os.path.join(workdir, "load.db")
+    env = dict(
+        os.environ,
+        DATABASE_URL=f"sqlite:///{database}",
+        LOG_FILE=os.path.join(workdir, "app.log"),
+        PROMETHEUS_MULTIPROC_DIR=os.path.join(workdir, "metrics"),
+    )
+    os.makedirs(env["PROMETHEUS_MULTIPROC_DIR"])
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed_data.py"),
+            "--database",
+            database,
+            "--users",
+            str(max(args.users, 10)),
+            "--contributions",
+            str(args.contributions),
+        ],
+        check=True,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            "gunicorn",
+            "--workers",
+            str(args.workers),
+            "--threads",
+            str(args.threads),
+            "--bind",
+            f"127.0.0.1:{port}",
+            "app:create_app()",
+        ],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(url + "/", timeout=1).read()
+            return url, process
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    sys.exit("gunicorn did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="A running server whose database was filled by seed_data.py.")
+    parser.add_argument("--users", type=int, default=8, help="Concurrent virtual users.")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds to run.")
+    parser.add_argument("--actions-per-login", type=int, default=10)
+    parser.add_argument("--contributions", type=int, default=100000, help="Rows seeded without --url.")
+    parser.add_argument("--workers", type=int, default=4, help="gunicorn workers without --url.")
+    parser.add_argument("--threads", type=int, default=8, help="gunicorn threads without --url.")
+    parser.add_argument("--max-p95", type=float, help="Fail if a step's p95 exceeds this many ms.")
+    args = parser.parse_args()
+
+    process = None
+    url = args.url
+    if url is None:
+        url, process = start_server(args)
+    try:
+        results = Results()
+        start = time.perf_counter()
+        deadline = start + args.duration
+        users = [
+            VirtualUser(index, url, deadline, args.actions_per_login, results)
+            for index in range(args.users)
+        ]
+        for user in users:
+            user.start()
+        for user in users:
+            user.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    total = sum(len(values) for values in results.latencies.values())
+    print(f"{args.users} users for {elapsed:.1f}s against {url}: {total / elapsed:,.1f} requests/s")
+    print(f"{'step':22} {'count':>7} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    slow = []
+    for step in STEPS:
+        values = sorted(results.latencies[step])
+        if not values:
+            print(f"{step:22} {0:7} {results.errors[step]:7}")
+            continue
+        p50, p95, p99 = (percentile(values, fraction) * 1000 for fraction in (0.5, 0.95, 0.99))
+        print(f"{step:22} {len(values):7} {results.errors[step]:7} {p50:8.1f} {p95:8.1f} {p99:8.1f}")
+        if args.max_p95 is not None and p95 > args.max_p95:
+            slow.append(step)
+    if sum(results.errors.values()) or slow:
+        if slow:
+            print(f"p95 above {args.max_p95} ms: {', '.join(slow)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
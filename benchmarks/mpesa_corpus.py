@@ -0,0 +1,48 @@
+"""Realistic synthetic M-Pesa confirmation messages for the benchmarks."""
+import random
+import string
+
+FIRST_NAMES = (
+    "JOHN", "MARY", "PETER", "GRACE", "JAMES", "FAITH", "DAVID", "MERCY", "JOSEPH", "ANN",
+    "SAMUEL", "JANE", "BRIAN", "ESTHER", "KEVIN", "LUCY", "DENNIS", "CAROLINE", "MOSES", "NANCY",
+)
+LAST_NAMES = (
+    "KAMAU", "WANJIKU", "OTIENO", "ACHIENG", "MWANGI", "NJOROGE", "KIPROTICH", "CHEBET", "OMONDI",
+    "WAMBUI", "MUTUA", "NDUTA", "KARIUKI", "AKINYI", "KIMANI", "WAFULA", "NJERI", "ODHIAMBO",
+)
+REFERENCE_ALPHABET = string.ascii_uppercase + string.digits
+
+
+def make_reference(rng):
+    return "S" + "".join(rng.choices(REFERENCE_ALPHABET, k=9))
+
+
+def make_phone(rng):
+    return rng.choice(("07", "01")) + "".join(rng.choices(string.digits, k=8))
+
+
+def make_name(rng):
+    names = [rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)]
+    if rng.random() < 0.3:
+        names.insert(1, rng.choice(LAST_NAMES))
+    return " ".join(names)
+
+
+def make_message(rng, reference=None):
+    """Builds one "money received" confirmation message."""
+    amount = rng.choice((50, 100, 200, 250, 500, 1000, 1500, 2000, 5000, 10000, 25000))
+    if rng.random() < 0.2:
+        amount = rng.randint(10, 150000)
+    hour = rng.randint(1, 12)
+    return (
+        f"{reference or make_reference(rng)} Confirmed. You have received Ksh{amount:,}.00 "
+        f"from {make_name(rng)} {make_phone(rng)} on {rng.randint(1, 28)}/{rng.randint(1, 12)}/"
+        f"{rng.randint(22, 25)} at {hour}:{rng.randint(0, 59):02d} {rng.choice(('AM', 'PM'))} "
+        f"New M-PESA balance is Ksh{rng.randint(1000, 500000):,}.00. "
+        f"Separate personal and business funds through Pochi la Biashara on *334#."
+    )
+
+
+def make_corpus(size, seed=1):
+    rng = random.Random(seed)
+    return [make_message(rng) for _ in range(size)]
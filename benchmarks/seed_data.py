@@ -0,0 +1,188 @@
+"""
+Synthetic data generator for the benchmarks and load tests.
+
+Fills the user, fundraiser and contributions tables of a database at a chosen scale.
+Every user owns one fundraiser, and contributions are spread over the fundraisers
+unevenly, a few large campaigns and a long tail of small ones. References, names,
+phone numbers and amounts come from mpesa_corpus. Rows are written with batched
+executemany inserts and the running totals and rollups are computed once at the end,
+so millions of contributions take minutes rather than hours.
+
+All users have the password "bench" and are named user<N>@example.com.
+
+    python benchmarks/seed_data.py --database /tmp/bench.db [--users 100] [--contributions 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, time as time_of_day, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mpesa_corpus import REFERENCE_ALPHABET, make_name, make_phone  # noqa: E402
+
+PASSWORD = "bench"
+BATCH_SIZE = 10000
+AMOUNTS = (50, 100, 200, 250, 500, 1000, 1500, 2000, 5000, 10000, 25000)
+START = datetime(2023, 1, 1)
+
+
+def username(index):
+    return f"user{index}@example.com"
+
+
+def fundraiser_weights(count, rng):
+    """Pareto-distributed shares so that a few fundraisers get most contributions."""
+    weights = [rng.paretovariate(1.2) for _ in range(count)]
+    total = sum(weights)
+    return [weight / total for weight in weights]
+
+
+def make_contribution(rng, fundraiser_id, sequence):
+    amount = rng.choice(AMOUNTS) if rng.random() < 0.8 else rng.randint(10, 150000)
+    when = START + timedelta(seconds=rng.randint(0, 3 * 365 * 24 * 3600))
+    # the sequence number keeps references unique without tracking the ones handed out
+    reference = "S" + "".join(rng.choices(REFERENCE_ALPHABET, k=2)) + f"{sequence:07d}"
+    return {
+        "fundraiser_id": fundraiser_id,
+        "contribution_reference": reference,
+        "contributor_name": make_name(rng),
+        "phone_number": make_phone(rng),
+        "amount": amount,
+        "contribution_date": date(when.year, when.month, when.day),
+        "contribution_time": time_of_day(when.hour, when.minute),
+        "timestamp": when,
+    }
+
+
+def seed(users=100, contributions=100000, seed=1, batch_size=BATCH_SIZE, echo=print):
+    """
+    Inserts synthetic users, fundraisers and contributions through the app's engine.
+
+    Must run inside an app context, against a database with the current schema.
+
+    Returns:
+        list: The IDs of the created fundraisers, busiest first.
+    """
+    from sqlalchemy import func, insert, select, update
+    from werkzeug.security import generate_password_hash
+
+    from models import db, User, Fundraiser, Contribution, rebuild_contribution_rollups
+
+    rng = random.Random(seed)
+    password = generate_password_hash(PASSWORD)
+    first_user = (db.session.query(func.max(User.id)).scalar() or 0) + 1
+    db.session.execute(
+        insert(User),
+        [{"username": username(first_user + i), "password": password} for i in range(users)],
+    )
+    user_ids = db.session.scalars(select(User.id).where(User.id >= first_user).order_by(User.id)).all()
+    db.session.execute(
+        insert(Fundraiser),
+        [
+            {
+                "user_id": user_id,
+                "name": f"Harambee {user_id}",
+                "description": "Synthetic fundraiser",
+                "end_date": datetime(2030, 1, 1),
+                "target_funds": rng.choice((50000, 100000, 500000, 1000000)),
+                "funds_raised": 0,
+                "contribution_count": 0,
+            }
+            for user_id in user_ids
+        ],
+    )
+    fundraiser_ids = db.session.scalars(
+        select(Fundraiser.id).where(Fundraiser.user_id.in_(user_ids)).order_by(Fundraiser.id)
+    ).all()
+    db.session.commit()
+
+    weights = fundraiser_weights(len(fundraiser_ids), rng)
+    first_sequence = (db.session.query(func.max(Contribution.contribution_id)).scalar() or 0) + 1
+    contributions_table = Contribution.__table__
+    start = time.perf_counter()
+    for offset in range(0, contributions, batch_size):
+        size = min(batch_size, contributions - offset)
+        owners = rng.choices(fundraiser_ids, weights=weights, k=size)
+        db.session.execute(
+            insert(contributions_table),
+            [
+                make_contribution(rng, fundraiser_id, first_sequence + offset + i)
+                for i, fundraiser_id in enumerate(owners)
+            ],
+        )
+        db.session.commit()
+        done = offset + size
+        echo(f"  {done:,} contributions ({done / (time.perf_counter() - start):,.0f}/s)")
+
+    # the bulk inserts bypass the ORM events that keep the running totals
+    totals = (
+        select(func.coalesce(func.sum(Contribution.amount), 0))
+        .where(Contribution.fundraiser_id == Fundraiser.id)
+        .scalar_subquery()
+    )
+    counts = (
+        select(func.count(Contribution.contribution_id))
+        .where(Contribution.fundraiser_id == Fundraiser.id)
+        .scalar_subquery()
+    )
+    db.session.execute(
+        update(Fundraiser)
+        .where(Fundraiser.id.in_(fundraiser_ids))
+        .values(funds_raised=totals, contribution_count=counts)
+    )
+    db.session.commit()
+    rebuild_contribution_rollups()
+    return [
+        fundraiser_id
+        for _, fundraiser_id in sorted(zip(weights, fundraiser_ids), reverse=True)
+    ]
+
+
+def create_database(path):
+    """Points the app at a new database file and migrates it to the current schema."""
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.abspath(path)}"
+    from flask_migrate import Migrate, upgrade
+
+    from app import create_app
+    from models import db
+
+    app = create_app()
+    Migrate(app, db)
+    with app.app_context():
+        upgrade(directory=os.path.join(ROOT, "migrations"))
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database", required=True, help="SQLite file to create or extend.")
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--contributions", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    app = create_database(args.database)
+    start = time.perf_counter()
+    with app.app_context():
+        fundraiser_ids = seed(args.users, args.contributions, args.seed)
+        from models import db, Fundraiser, User
+
+        busiest = db.session.get(Fundraiser, fundraiser_ids[0])
+        owner = db.session.get(User, busiest.user_id)
+        print(
+            f"seeded {args.users} users and {args.contributions:,} contributions "
+            f"in {time.perf_counter() - start:.1f}s"
+        )
+        print(
+            f"busiest fundraiser: {busiest.id} with {busiest.contribution_count:,} contributions "
+            f"(user {owner.username}, password {PASSWORD!r})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Multi-process SQLite stress test.
+
+Forks writer processes that submit contributions through save_contribution and
+reader processes that page through report(), all against one database file, the
+way gunicorn workers share it. Reports throughput and any failed requests, such
+as "database is locked".
+
+    python benchmarks/stress_sqlite.py [--writers 4] [--readers 4] [--requests 200]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DATABASE = os.path.join(tempfile.mkdtemp(prefix="nijenge-stress-"), "stress.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DATABASE}"
+
+from flask_migrate import Migrate, upgrade  # noqa: E402
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+from app import create_app  # noqa: E402
+from models import db, User, Fundraiser  # noqa: E402
+from mpesa_corpus import make_message  # noqa: E402
+
+app = create_app()
+Migrate(app, db)
+
+
+def setup():
+    with app.app_context():
+        upgrade(directory=os.path.join(ROOT, "migrations"))
+        user = User(username="stress@example.com", password=generate_password_hash("stress"))
+        db.session.add(user)
+        db.session.commit()
+        fundraiser = Fundraiser(user.id, "Stress", "", datetime(2030, 1, 1), 1000000)
+        db.session.add(fundraiser)
+        db.session.commit()
+        fundraiser_id = fundraiser.id
+        db.engine.dispose()
+    return fundraiser_id
+
+
+def client():
+    test_client = app.test_client()
+    test_client.post("/login", data={"username": "stress@example.com", "password": "stress"})
+    return test_client
+
+
+def writer(worker, fundraiser_id, requests):
+    rng = random.Random(worker)
+    test_client = client()
+    failures = 0
+    for i in range(requests):
+        response = test_client.post(
+            f"/fundraiser_success/{fundraiser_id}",
+            data={"message": make_message(rng, reference=f"W{worker:02d}{i:07d}")},
+        )
+        if response.status_code != 200 or response.get_json().get("status") != "success":
+            failures += 1
+    return failures
+
+
+def reader(worker, fundraiser_id, requests):
+    test_client = client()
+    failures = 0
+    for _ in range(requests):
+        response = test_client.get(f"/report/{fundraiser_id}?format=json&limit=50")
+        if response.status_code != 200 or "items" not in (response.get_json() or {}):
+            failures += 1
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200, help="Requests per process.")
+    args = parser.parse_args()
+
+    fundraiser_id = setup()
+    jobs = [(writer, i) for i in range(args.writers)] + [(reader, i) for i in range(args.readers)]
+    start = time.perf_counter()
+    with multiprocessing.get_context("fork").Pool(len(jobs)) as pool:
+        results = [
+            pool.apply_async(job, (worker, fundraiser_id, args.requests)) for job, worker in jobs
+        ]
+        failures = [result.get() for result in results]
+    elapsed = time.perf_counter() - start
+
+    writes = args.writers * args.requests
+    reads = args.readers * args.requests
+    print(f"database: {DATABASE}")
+    print(f"{writes} writes and {reads} reads in {elapsed:.2f}s ({(writes + reads) / elapsed:,.0f} requests/s)")
+    print(f"failed writes: {sum(failures[:args.writers])}, failed reads: {sum(failures[args.writers:])}")
+    with app.app_context():
+        print(f"stored contribution count: {db.session.get(Fundraiser, fundraiser_id).contribution_count}")
+    if any(failures):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
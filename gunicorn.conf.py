@@ -0,0 +1,45 @@
+"""
+gunicorn settings.
+
+Workers are threaded: a live-update stream (see live.py) keeps one sleeping thread
+busy rather than a whole worker, so a worker can hold hundreds of idle streams next
+to its regular requests. Set WEB_THREADS to change the threads per worker.
+
+The app is built once in the master (preload_app) and the workers are forked from it,
+so they start without importing anything and share its SECRET_KEY even when none is
+configured. create_app() makes the forked workers open their own database connections,
+and log_config gives each worker its own log file, LOG_FILE with the worker's pid added.
+
+Each worker process keeps its own Prometheus metrics, so the workers share a
+directory where they write their samples and /metrics merges them (see metrics.py).
+"""
+import os
+import shutil
+import tempfile
+
+# must be set before prometheus_client is imported, which picks its value store on import
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "nijenge-metrics")
+)
+
+from prometheus_client import multiprocess  # noqa: E402
+
+wsgi_app = "app:create_app()"
+preload_app = True
+worker_class = "gthread"
+threads = int(os.environ.get("WEB_THREADS", 256))
+# live-update streams hold no database connection, so the pool is sized for the
+# requests that do rather than for every thread
+os.environ.setdefault("DB_POOL_SIZE", "16")
+
+
+def on_starting(server):
+    # samples left by a previous run of the server would be counted again
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    # drop the live gauges of a worker that exited, its counters are kept
+    multiprocess.mark_process_dead(worker.pid)
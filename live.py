@@ -0,0 +1,217 @@
+"""
+Live fundraiser updates pushed to browsers over Server-Sent Events.
+
+Each worker process runs one poller thread, started with the first listener. Every
+LIVE_POLL_INTERVAL seconds it reads the stored totals of the fundraisers that have
+listeners in this process, in one query, and fetches the contributions added since
+the last poll for those whose totals moved. The resulting events are fanned out to
+the listeners' in-memory queues. Commits from any worker are seen on the next poll;
+a commit in the same process wakes the poller at once.
+
+A listener is only a queue. The request thread that streams it sleeps on the queue
+and holds no database connection, so hundreds of idle listeners cost one query per
+poll in each worker.
+"""
+import json
+import logging
+import os
+import queue
+import threading
+from decimal import Decimal
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from models import db, Fundraiser, contributions_after, latest_contribution_id
+
+# Seconds between two reads of the totals of the fundraisers being watched
+LIVE_POLL_INTERVAL = float(os.environ.get("LIVE_POLL_INTERVAL", 0.5))
+# Seconds of silence after which a comment is sent to keep proxies from closing the stream
+LIVE_KEEPALIVE = 15
+# Listeners allowed per worker process, so streams cannot take every request thread
+LIVE_MAX_LISTENERS = int(os.environ.get("LIVE_MAX_LISTENERS", 200))
+# Events kept for a listener that is not reading; older ones are dropped
+LIVE_QUEUE_SIZE = 100
+# New contributions sent per fundraiser per poll; the totals event covers the rest
+LIVE_MAX_CONTRIBUTIONS = 50
+
+
+class TooManyListeners(Exception):
+    pass
+
+
+def money(value):
+    return str(Decimal(str(value or 0)).quantize(Decimal("0.01")))
+
+
+def totals_event(fundraiser_id, funds_raised, contribution_count):
+    return {
+        "fundraiser_id": fundraiser_id,
+        "funds_raised": money(funds_raised),
+        "contribution_count": contribution_count,
+    }
+
+
+def format_event(name, data, event_id=None):
+    """Encodes one Server-Sent Event."""
+    lines = [f"event: {name}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(data, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+class Broadcaster:
+    """Fans fundraiser updates out to the listeners of this process."""
+
+    def __init__(self):
+        self.app = None
+        self.listeners = {}
+        self.seen = {}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.thread = None
+
+    def init_app(self, app):
+        self.app = app
+
+    def wake(self, session):
+        """Wakes the poller after a commit in this process, when anyone is listening."""
+        if self.listeners:
+            self.wakeup.set()
+
+    def subscribe(self, fundraiser):
+        """
+        Registers a listener for a fundraiser.
+
+        Returns:
+            Queue: Receives (event name, data, event id) tuples.
+
+        Raises:
+            TooManyListeners: If this process already streams LIVE_MAX_LISTENERS listeners.
+        """
+        listener = queue.Queue(maxsize=LIVE_QUEUE_SIZE)
+        seen = (
+            fundraiser.funds_raised,
+            fundraiser.contribution_count,
+            latest_contribution_id(fundraiser.id) or 0,
+        )
+        with self.lock:
+            if sum(len(listeners) for listeners in self.listeners.values()) >= LIVE_MAX_LISTENERS:
+                raise TooManyListeners()
+            if fundraiser.id not in self.listeners:
+                self.listeners[fundraiser.id] = set()
+                self.seen[fundraiser.id] = seen
+            self.listeners[fundraiser.id].add(listener)
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="live-poller", daemon=True)
+                self.thread.start()
+        return listener
+
+    def unsubscribe(self, fundraiser_id, listener):
+        with self.lock:
+            listeners = self.listeners.get(fundraiser_id)
+            if listeners is None:
+                return
+            listeners.discard(listener)
+            if not listeners:
+                del self.listeners[fundraiser_id]
+                del self.seen[fundraiser_id]
+
+    def publish(self, fundraiser_id, name, data, event_id=None):
+        with self.lock:
+            listeners = list(self.listeners.get(fundraiser_id, ()))
+        for listener in listeners:
+            try:
+                listener.put_nowait((name, data, event_id))
+            except queue.Full:
+                # a stalled client misses contributions but still gets the next totals
+                pass
+
+    def run(self):
+        while True:
+            self.wakeup.wait(LIVE_POLL_INTERVAL)
+            self.wakeup.clear()
+            try:
+                with self.app.app_context():
+                    self.poll()
+            except Exception as e:
+                logging.error("Live update poll failed: %s", str(e))
+
+    def poll(self):
+        with self.lock:
+            watched = dict(self.seen)
+        if not watched:
+            return
+        rows = db.session.query(
+            Fundraiser.id, Fundraiser.funds_raised, Fundraiser.contribution_count
+        ).filter(Fundraiser.id.in_(watched))
+        for fundraiser_id, funds_raised, contribution_count in rows:
+            seen_total, seen_count, last_id = watched[fundraiser_id]
+            if (funds_raised, contribution_count) == (seen_total, seen_count):
+                continue
+            contributions = contributions_after(fundraiser_id, last_id, LIVE_MAX_CONTRIBUTIONS)
+            for contribution in contributions:
+                self.publish(
+                    fundraiser_id,
+                    "contribution",
+                    {
+                        "contribution_reference": contribution.contribution_reference,
+                        "contributor_name": contribution.contributor_name,
+                        "amount": money(contribution.amount),
+                        "contribution_date": contribution.contribution_date.strftime("%Y-%m-%d"),
+                        "contribution_time": contribution.contribution_time.strftime("%H:%M:%S"),
+                    },
+                    contribution.contribution_id,
+                )
+            if contributions:
+                last_id = contributions[-1].contribution_id
+            self.publish(
+                fundraiser_id, "totals", totals_event(fundraiser_id, funds_raised, contribution_count)
+            )
+            with self.lock:
+                if fundraiser_id in self.seen:
+                    self.seen[fundraiser_id] = (funds_raised, contribution_count, last_id)
+
+
+broadcaster = Broadcaster()
+# registered once per process rather than in init_app(), which runs for every app built
+event.listen(Session, "after_commit", broadcaster.wake)
+
+
+def stream_events(fundraiser):
+    """
+    Subscribes to a fundraiser and returns the generator of its event stream.
+
+    The subscription is taken before the response starts, so a commit made while the
+    stream is being set up is not missed. The first event carries the current totals.
+
+    Returns:
+        tuple: The generator, and a function that ends the subscription. The generator
+        ends it when it finishes, but one that never runs, such as the body of a HEAD
+        request or of a response the server never sent, would hold the listener for the
+        life of the process; the caller must also call the function when the response
+        is closed. Calling it more than once is harmless.
+    """
+    initial = totals_event(fundraiser.id, fundraiser.funds_raised, fundraiser.contribution_count)
+    listener = broadcaster.subscribe(fundraiser)
+    fundraiser_id = fundraiser.id
+
+    def unsubscribe():
+        broadcaster.unsubscribe(fundraiser_id, listener)
+
+    def generate():
+        try:
+            yield f"retry: {int(LIVE_POLL_INTERVAL * 2000)}\n"
+            yield format_event("totals", initial)
+            while True:
+                try:
+                    name, data, event_id = listener.get(timeout=LIVE_KEEPALIVE)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_event(name, data, event_id)
+        finally:
+            unsubscribe()
+
+    return generate(), unsubscribe
@@ -0,0 +1,172 @@
+"""
+Non-blocking structured logging.
+
+Request threads only put records on an in-memory queue through a QueueHandler; a
+QueueListener thread formats them as JSON lines and writes them to a size-rotated
+file. Records carry the id of the request that produced them, and INFO and DEBUG
+records can be sampled to keep high-volume lines in check.
+
+Each process rotates a file of its own: a process forked from one that was already
+logging, such as a gunicorn worker forked from the preloaded app, writes to LOG_FILE
+with its pid added to the name (Nijenge_app.1234.log), so no process renames a file
+another is still writing.
+
+Configuration comes from the environment:
+    LOG_FILE          log file path of the first process (default Nijenge_app.log)
+    LOG_LEVEL         root level (default INFO)
+    LOG_LEVELS        per-logger levels, e.g. "sqlalchemy.engine=INFO,werkzeug=ERROR"
+    LOG_MAX_BYTES     size at which the file rotates (default 10 MB)
+    LOG_BACKUP_COUNT  rotated files kept (default 5)
+    LOG_SAMPLE_RATE   fraction of INFO/DEBUG records kept (default 1.0, keep all)
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import uuid
+from datetime import datetime, timezone
+
+from flask import g, has_request_context, request
+
+# Loggers that are too chatty at the root level unless configured otherwise;
+# sqlalchemy.engine logs every statement at INFO
+DEFAULT_LOG_LEVELS = {"sqlalchemy.engine": "WARNING"}
+
+_listener = None
+
+
+class RequestIdFilter(logging.Filter):
+    """Stamps each record with the id of the request being handled, if any."""
+
+    def filter(self, record):
+        record.request_id = g.get("request_id") if has_request_context() else None
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keeps every WARNING and above, and a random `rate` fraction of lower records."""
+
+    def __init__(self, rate):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+
+class LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a queue that stays inside the process.
+
+    The stock handler formats and copies every record in the calling thread so it can
+    be pickled; here the record only needs its message merged, and the JSON formatting
+    is left to the listener thread.
+    """
+
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def parse_levels(value):
+    """Parses "name=LEVEL,name=LEVEL" into a dict."""
+    levels = {}
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        name, _, level = item.partition("=")
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def init_logging(app):
+    """Routes all logging through a queue to a rotating JSON log file and tags records with request ids."""
+    start_listener()
+
+    @app.before_request
+    def assign_request_id():
+        g.request_id = request.headers.get("X-Request-ID") or uuid.uuid4().hex
+
+    @app.after_request
+    def send_request_id(response):
+        if "request_id" in g:
+            response.headers["X-Request-ID"] = g.request_id
+        return response
+
+
+def log_file(pid=None):
+    """Returns LOG_FILE, with `pid` added before the extension when given."""
+    path = os.environ.get("LOG_FILE", "Nijenge_app.log")
+    if pid is None:
+        return path
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.{pid}{ext}"
+
+
+def start_listener(path=None):
+    global _listener
+    if _listener is not None:
+        return
+
+    file_handler = logging.handlers.RotatingFileHandler(
+        path or log_file(),
+        maxBytes=int(os.environ.get("LOG_MAX_BYTES", 10 * 1024 * 1024)),
+        backupCount=int(os.environ.get("LOG_BACKUP_COUNT", 5)),
+        delay=True,
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = LocalQueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    sample_rate = float(os.environ.get("LOG_SAMPLE_RATE", 1.0))
+    if sample_rate < 1.0:
+        queue_handler.addFilter(SamplingFilter(sample_rate))
+
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(os.environ.get("LOG_LEVEL", "INFO").upper())
+    levels = dict(DEFAULT_LOG_LEVELS, **parse_levels(os.environ.get("LOG_LEVELS", "")))
+    for name, level in levels.items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def restart_listener_after_fork():
+    """
+    Starts a new listener in a forked child, such as a gunicorn worker forked from a
+    preloaded app. Threads do not survive a fork, so the child would otherwise queue
+    records that nothing writes.
+
+    The child writes to a file named after its pid: a RotatingFileHandler renames its
+    file when it fills, and handlers in several processes sharing one file would each
+    rotate it, losing or splitting the others' records.
+    """
+    global _listener
+    if _listener is not None:
+        for handler in _listener.handlers:
+            handler.close()  # the parent's file, inherited open
+        _listener = None
+        start_listener(log_file(os.getpid()))
+
+
+os.register_at_fork(after_in_child=restart_listener_after_fork)
@@ -0,0 +1,148 @@
+"""
+Email outbox and its background sender.
+
+Requests only queue mail with enqueue_mail(). `flask send-outbox` runs OutboxSender,
+which delivers queued messages in batches over one authenticated SMTP connection and
+retries failures with exponential backoff.
+"""
+import logging
+import os
+import smtplib
+import time
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+
+from models import db, OutboxEmail
+
+# Messages sent per batch, and attempts before a message is marked failed
+BATCH_SIZE = 50
+MAX_ATTEMPTS = 6
+# Retry delay after the first failure, doubled after each further failure
+RETRY_BACKOFF = timedelta(seconds=30)
+# Seconds without queued mail after which the SMTP connection is closed
+IDLE_TIMEOUT = 60
+# SMTP errors caused by the message itself rather than by the server or connection
+MESSAGE_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+
+
+def enqueue_mail(subject, recipient, body):
+    """Queues an email for the background sender. The caller commits."""
+    email = OutboxEmail(subject=subject, recipient=recipient, body=body)
+    db.session.add(email)
+    return email
+
+
+class OutboxSender:
+    """
+    Delivers queued outbox emails over a single reused SMTP connection.
+
+    The connection settings come from the MAIL_SERVER, MAIL_PORT, MAIL_USE_SSL,
+    MAIL_TIMEOUT, MAIL_USERNAME and MAIL_PASSWORD environment variables, so a local
+    SMTP stand-in can be used in development.
+    """
+
+    def __init__(self):
+        self.server = os.getenv("MAIL_SERVER", "smtp.mail.yahoo.com")
+        self.port = int(os.getenv("MAIL_PORT", 465))
+        self.use_ssl = os.getenv("MAIL_USE_SSL", "true").lower() == "true"
+        self.timeout = float(os.getenv("MAIL_TIMEOUT", 10))
+        self.username = os.getenv("MAIL_USERNAME")
+        self.password = os.getenv("MAIL_PASSWORD")
+        self.smtp = None
+
+    def connect(self):
+        if self.smtp is None:
+            smtp_class = smtplib.SMTP_SSL if self.use_ssl else smtplib.SMTP
+            smtp = smtp_class(self.server, self.port, timeout=self.timeout)
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+            self.smtp = smtp
+            logging.info("Connected to mail server %s:%s", self.server, self.port)
+        return self.smtp
+
+    def close(self):
+        if self.smtp is not None:
+            try:
+                self.smtp.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.smtp = None
+
+    def deliver(self, email):
+        message = EmailMessage()
+        message["Subject"] = email.subject
+        message["From"] = self.username
+        message["To"] = email.recipient
+        message.set_content(email.body)
+        try:
+            self.connect().send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            # the server dropped the idle connection, reconnect once
+            self.smtp = None
+            self.connect().send_message(message)
+
+    def send_batch(self):
+        """
+        Sends the queued emails that are due, up to BATCH_SIZE of them.
+
+        A failed message is rescheduled with backoff. If the failure is not specific to
+        the message, the rest of the batch is left for the next poll.
+
+        Returns:
+            int: The number of emails sent.
+        """
+        now = datetime.utcnow()
+        batch = (
+            OutboxEmail.query.filter(
+                OutboxEmail.status == "pending", OutboxEmail.next_attempt_at <= now
+            )
+            .order_by(OutboxEmail.next_attempt_at, OutboxEmail.id)
+            .limit(BATCH_SIZE)
+            .all()
+        )
+        sent = 0
+        for email in batch:
+            email.attempts += 1
+            try:
+                self.deliver(email)
+            except (smtplib.SMTPException, OSError) as e:
+                self.close()
+                email.last_error = str(e)
+                if email.attempts >= MAX_ATTEMPTS:
+                    email.status = "failed"
+                    logging.error("Giving up on outbox email %s: %s", email.id, str(e))
+                else:
+                    email.next_attempt_at = now + RETRY_BACKOFF * 2 ** (email.attempts - 1)
+                    logging.warning(
+                        "Outbox email %s failed (attempt %s): %s", email.id, email.attempts, str(e)
+                    )
+                if not isinstance(e, MESSAGE_ERRORS):
+                    break
+            else:
+                email.status = "sent"
+                email.sent_at = datetime.utcnow()
+                sent += 1
+        db.session.commit()
+        if batch:
+            logging.info("Sent %s of %s due outbox emails", sent, len(batch))
+        return sent
+
+    def run(self, poll_interval=2.0, once=False):
+        """Sends queued mail until interrupted, or until the queue is drained if once is set."""
+        idle_since = time.monotonic()
+        try:
+            while True:
+                if self.send_batch():
+                    idle_since = time.monotonic()
+                    continue
+                if once:
+                    return
+                if self.smtp is not None and time.monotonic() - idle_since > IDLE_TIMEOUT:
+                    self.close()
+                time.sleep(poll_interval)
+        finally:
+            self.close()
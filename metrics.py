@@ -0,0 +1,155 @@
+"""
+Prometheus metrics for requests, SQL statements and contribution ingestion.
+
+init_metrics() times every request per endpoint, counts the SQL statements each
+request issues, and serves everything on /metrics in the Prometheus text format.
+
+Under gunicorn every worker keeps its own counters. When PROMETHEUS_MULTIPROC_DIR is
+set (gunicorn.conf.py sets it) the workers write their samples to files in that
+directory and /metrics merges the files of all workers, so whichever worker answers
+the scrape reports the totals of the whole server.
+"""
+import os
+import time
+
+from flask import Response, g, has_request_context, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+
+REQUEST_COUNT = Counter(
+    "nijenge_http_requests_total",
+    "HTTP requests handled, by endpoint and status code.",
+    ["method", "endpoint", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "nijenge_http_request_duration_seconds",
+    "Time spent handling HTTP requests, by endpoint.",
+    ["method", "endpoint"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "nijenge_http_requests_in_progress",
+    "HTTP requests being handled.",
+    ["method", "endpoint"],
+    multiprocess_mode="livesum",
+)
+DB_STATEMENTS = Counter(
+    "nijenge_db_statements_total",
+    "SQL statements executed, by the endpoint that issued them.",
+    ["endpoint"],
+)
+DB_STATEMENT_LATENCY = Histogram(
+    "nijenge_db_statement_duration_seconds",
+    "Time spent executing single SQL statements.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1),
+)
+DB_STATEMENTS_PER_REQUEST = Histogram(
+    "nijenge_db_statements_per_request",
+    "SQL statements executed while handling one request.",
+    ["endpoint"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100),
+)
+DB_TIME_PER_REQUEST = Histogram(
+    "nijenge_db_time_per_request_seconds",
+    "Time spent in SQL statements while handling one request.",
+    ["endpoint"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1),
+)
+CONTRIBUTIONS_INGESTED = Counter(
+    "nijenge_contributions_ingested_total",
+    "Contributions saved from M-Pesa messages.",
+    ["source"],
+)
+CONTRIBUTION_DUPLICATES = Counter(
+    "nijenge_contribution_duplicates_total",
+    "M-Pesa messages whose reference was already recorded.",
+    ["source"],
+)
+PARSE_FAILURES = Counter(
+    "nijenge_contribution_parse_failures_total",
+    "M-Pesa messages that could not be parsed.",
+    ["source"],
+)
+WRITE_BATCH_SIZE = Histogram(
+    "nijenge_write_batch_size",
+    "Contributions committed together by the group-commit writer.",
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+)
+PAGE_CACHE_LOOKUPS = Counter(
+    "nijenge_page_cache_lookups_total",
+    "Lookups in the rendered page and fragment cache, by kind and result.",
+    ["kind", "result"],
+)
+
+
+def request_endpoint():
+    """The matched endpoint of the current request, so label values stay bounded."""
+    return request.endpoint or "unmatched"
+
+
+def init_metrics(app, engine):
+    """
+    Instruments the app's requests and the engine's statements and adds the /metrics route.
+
+    Parameters:
+        app (Flask): The application to instrument.
+        engine (Engine): The SQLAlchemy engine whose statements are counted.
+    """
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics_start = time.perf_counter()
+        g.db_statements = 0
+        g.db_time = 0.0
+        g.metrics_endpoint = request_endpoint()
+        REQUESTS_IN_PROGRESS.labels(request.method, g.metrics_endpoint).inc()
+
+    @app.teardown_request
+    def finish_request_metrics(exc):
+        if "metrics_start" not in g:
+            return
+        endpoint = g.metrics_endpoint
+        REQUESTS_IN_PROGRESS.labels(request.method, endpoint).dec()
+        REQUEST_LATENCY.labels(request.method, endpoint).observe(time.perf_counter() - g.metrics_start)
+        status = 500 if exc is not None else g.get("metrics_status", 500)
+        REQUEST_COUNT.labels(request.method, endpoint, str(status)).inc()
+        DB_STATEMENTS_PER_REQUEST.labels(endpoint).observe(g.db_statements)
+        DB_TIME_PER_REQUEST.labels(endpoint).observe(g.db_time)
+
+    @app.after_request
+    def record_status(response):
+        g.metrics_status = response.status_code
+        return response
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_statement_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info["metrics_statement_start"] = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["metrics_statement_start"]
+        DB_STATEMENT_LATENCY.observe(elapsed)
+        if has_request_context() and "db_statements" in g:
+            g.db_statements += 1
+            g.db_time += elapsed
+            DB_STATEMENTS.labels(g.metrics_endpoint).inc()
+        else:
+            DB_STATEMENTS.labels("background").inc()
+
+    @app.route("/metrics")
+    def metrics():
+        if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+        else:
+            registry = REGISTRY
+        return Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
@@ -0,0 +1,91 @@
+"""Add contribution rollups
+
+Revision ID: 3a6c1e8f5b90
+Revises: 7f3b0d9e6a24
+Create Date: 2026-10-18 16:48:21.530917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3a6c1e8f5b90'
+down_revision = '7f3b0d9e6a24'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('contribution_daily_rollup',
+    sa.Column('fundraiser_id', sa.Integer(), nullable=False),
+    sa.Column('contribution_date', sa.Date(), nullable=False),
+    sa.Column('amount_total', sa.DECIMAL(), server_default='0', nullable=False),
+    sa.Column('contribution_count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['fundraiser_id'], ['fundraiser.id'], ),
+    sa.PrimaryKeyConstraint('fundraiser_id', 'contribution_date')
+    )
+    op.create_table('contribution_hourly_rollup',
+    sa.Column('fundraiser_id', sa.Integer(), nullable=False),
+    sa.Column('contribution_hour', sa.Integer(), nullable=False),
+    sa.Column('amount_total', sa.DECIMAL(), server_default='0', nullable=False),
+    sa.Column('contribution_count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['fundraiser_id'], ['fundraiser.id'], ),
+    sa.PrimaryKeyConstraint('fundraiser_id', 'contribution_hour')
+    )
+    op.create_table('contributor_rollup',
+    sa.Column('fundraiser_id', sa.Integer(), nullable=False),
+    sa.Column('phone_number', sa.Text(), nullable=False),
+    sa.Column('contributor_name', sa.Text(), nullable=False),
+    sa.Column('amount_total', sa.DECIMAL(), server_default='0', nullable=False),
+    sa.Column('contribution_count', sa.Integer(), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['fundraiser_id'], ['fundraiser.id'], ),
+    sa.PrimaryKeyConstraint('fundraiser_id', 'phone_number')
+    )
+    with op.batch_alter_table('contributor_rollup', schema=None) as batch_op:
+        batch_op.create_index('ix_contributor_rollup_fundraiser_id_amount_total', ['fundraiser_id', 'amount_total'], unique=False)
+
+    # backfill the rollups from the existing contributions
+    op.execute(
+        """
+        INSERT INTO contribution_daily_rollup
+            (fundraiser_id, contribution_date, amount_total, contribution_count)
+        SELECT fundraiser_id, contribution_date, SUM(amount), COUNT(*)
+        FROM contributions
+        GROUP BY fundraiser_id, contribution_date
+        """
+    )
+    # contribution_time is stored as "HH:MM:SS.ffffff"
+    op.execute(
+        """
+        INSERT INTO contribution_hourly_rollup
+            (fundraiser_id, contribution_hour, amount_total, contribution_count)
+        SELECT fundraiser_id, CAST(substr(contribution_time, 1, 2) AS INTEGER), SUM(amount), COUNT(*)
+        FROM contributions
+        GROUP BY fundraiser_id, CAST(substr(contribution_time, 1, 2) AS INTEGER)
+        """
+    )
+    # the bare contributor_name comes from the row with the highest contribution_id
+    op.execute(
+        """
+        INSERT INTO contributor_rollup
+            (fundraiser_id, phone_number, contributor_name, amount_total, contribution_count)
+        SELECT fundraiser_id, phone_number, contributor_name, amount_total, contribution_count
+        FROM (
+            SELECT fundraiser_id, phone_number, contributor_name,
+                   SUM(amount) AS amount_total, COUNT(*) AS contribution_count,
+                   MAX(contribution_id)
+            FROM contributions
+            GROUP BY fundraiser_id, phone_number
+        )
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('contributor_rollup', schema=None) as batch_op:
+        batch_op.drop_index('ix_contributor_rollup_fundraiser_id_amount_total')
+
+    op.drop_table('contributor_rollup')
+    op.drop_table('contribution_hourly_rollup')
+    op.drop_table('contribution_daily_rollup')
@@ -0,0 +1,41 @@
+"""Add running totals to fundraiser
+
+Revision ID: 4b7e2f9a1c3d
+Revises: 00e05e228262
+Create Date: 2026-10-18 09:12:40.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4b7e2f9a1c3d'
+down_revision = '00e05e228262'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('fundraiser', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('funds_raised', sa.DECIMAL(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('contribution_count', sa.Integer(), server_default='0', nullable=False))
+
+    # backfill the totals of existing fundraisers
+    op.execute(
+        """
+        UPDATE fundraiser SET
+            funds_raised = COALESCE(
+                (SELECT SUM(amount) FROM contributions
+                 WHERE contributions.fundraiser_id = fundraiser.id), 0),
+            contribution_count = (
+                SELECT COUNT(*) FROM contributions
+                WHERE contributions.fundraiser_id = fundraiser.id)
+        """
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('fundraiser', schema=None) as batch_op:
+        batch_op.drop_column('contribution_count')
+        batch_op.drop_column('funds_raised')
@@ -0,0 +1,30 @@
+"""Add version stamp to fundraiser
+
+Revision ID: 5e0f3b7c9a12
+Revises: b2d84f07c1e5
+Create Date: 2026-10-18 19:05:37.402861
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e0f3b7c9a12'
+down_revision = 'b2d84f07c1e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('fundraiser', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    op.execute("UPDATE fundraiser SET updated_at = CURRENT_TIMESTAMP")
+
+
+def downgrade():
+    with op.batch_alter_table('fundraiser', schema=None) as batch_op:
+        batch_op.drop_column('updated_at')
+        batch_op.drop_column('version')
@@ -0,0 +1,35 @@
+"""Add indexes for hot queries
+
+Revision ID: 8d2c6a5e07f1
+Revises: 4b7e2f9a1c3d
+Create Date: 2026-10-18 11:02:17.534920
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8d2c6a5e07f1'
+down_revision = '4b7e2f9a1c3d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('contributions', schema=None) as batch_op:
+        batch_op.create_index('ix_contributions_fundraiser_id_timestamp', ['fundraiser_id', 'timestamp'], unique=False)
+        batch_op.create_index('ix_contributions_fundraiser_id_contribution_date', ['fundraiser_id', 'contribution_date'], unique=False)
+        batch_op.create_index('ix_contributions_fundraiser_id_amount', ['fundraiser_id', 'amount'], unique=False)
+
+    with op.batch_alter_table('fundraiser', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_fundraiser_user_id'), ['user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('fundraiser', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_fundraiser_user_id'))
+
+    with op.batch_alter_table('contributions', schema=None) as batch_op:
+        batch_op.drop_index('ix_contributions_fundraiser_id_amount')
+        batch_op.drop_index('ix_contributions_fundraiser_id_contribution_date')
+        batch_op.drop_index('ix_contributions_fundraiser_id_timestamp')
@@ -0,0 +1,42 @@
+"""Add contribution archive
+
+Revision ID: 9c4e7a2d1f36
+Revises: 5e0f3b7c9a12
+Create Date: 2026-10-18 21:12:44.508213
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e7a2d1f36'
+down_revision = '5e0f3b7c9a12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('archived_contributions',
+    sa.Column('fundraiser_id', sa.Integer(), nullable=False),
+    sa.Column('contribution_id', sa.Integer(), nullable=False),
+    sa.Column('contribution_reference', sa.Text(), nullable=False),
+    sa.Column('contributor_name', sa.Text(), nullable=False),
+    sa.Column('phone_number', sa.Text(), nullable=False),
+    sa.Column('amount', sa.DECIMAL(), nullable=False),
+    sa.Column('contribution_date', sa.Date(), nullable=False),
+    sa.Column('contribution_time', sa.Time(), nullable=False),
+    sa.Column('timestamp', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['fundraiser_id'], ['fundraiser.id'], ),
+    sa.PrimaryKeyConstraint('fundraiser_id', 'contribution_id'),
+    sqlite_with_rowid=False
+    )
+    with op.batch_alter_table('fundraiser', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('archived_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('fundraiser', schema=None) as batch_op:
+        batch_op.drop_column('archived_at')
+
+    op.drop_table('archived_contributions')
@@ -0,0 +1,25 @@
+"""Index contributions by fundraiser
+
+Revision ID: b2d84f07c1e5
+Revises: 3a6c1e8f5b90
+Create Date: 2026-10-18 17:31:09.214650
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b2d84f07c1e5'
+down_revision = '3a6c1e8f5b90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('contributions', schema=None) as batch_op:
+        batch_op.create_index('ix_contributions_fundraiser_id', ['fundraiser_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('contributions', schema=None) as batch_op:
+        batch_op.drop_index('ix_contributions_fundraiser_id')
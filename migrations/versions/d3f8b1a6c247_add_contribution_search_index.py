@@ -0,0 +1,52 @@
+"""Add full-text search index over contributions
+
+Revision ID: d3f8b1a6c247
+Revises: 9c4e7a2d1f36
+Create Date: 2026-10-18 23:02:15.771904
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3f8b1a6c247'
+down_revision = '9c4e7a2d1f36'
+branch_labels = None
+depends_on = None
+
+COLUMNS = "contributor_name, phone_number, contribution_reference"
+NEW_VALUES = "new.contribution_id, new.contributor_name, new.phone_number, new.contribution_reference"
+OLD_VALUES = "'delete', old.contribution_id, old.contributor_name, old.phone_number, old.contribution_reference"
+
+
+def upgrade():
+    # an external-content index: the text stays in contributions, the triggers keep
+    # the index in step with every insert, delete and update of a searched column
+    op.execute(
+        f"CREATE VIRTUAL TABLE contributions_fts USING fts5("
+        f"{COLUMNS}, content='contributions', content_rowid='contribution_id')"
+    )
+    op.execute(
+        f"""CREATE TRIGGER contributions_fts_insert AFTER INSERT ON contributions BEGIN
+            INSERT INTO contributions_fts(rowid, {COLUMNS}) VALUES ({NEW_VALUES});
+        END"""
+    )
+    op.execute(
+        f"""CREATE TRIGGER contributions_fts_delete AFTER DELETE ON contributions BEGIN
+            INSERT INTO contributions_fts(contributions_fts, rowid, {COLUMNS}) VALUES ({OLD_VALUES});
+        END"""
+    )
+    op.execute(
+        f"""CREATE TRIGGER contributions_fts_update AFTER UPDATE OF {COLUMNS} ON contributions BEGIN
+            INSERT INTO contributions_fts(contributions_fts, rowid, {COLUMNS}) VALUES ({OLD_VALUES});
+            INSERT INTO contributions_fts(rowid, {COLUMNS}) VALUES ({NEW_VALUES});
+        END"""
+    )
+    op.execute("INSERT INTO contributions_fts(contributions_fts) VALUES ('rebuild')")
+
+
+def downgrade():
+    op.execute("DROP TRIGGER contributions_fts_update")
+    op.execute("DROP TRIGGER contributions_fts_delete")
+    op.execute("DROP TRIGGER contributions_fts_insert")
+    op.execute("DROP TABLE contributions_fts")
@@ -0,0 +1,45 @@
+"""Unique contribution reference per fundraiser
+
+Revision ID: e5a19c4d8b62
+Revises: 8d2c6a5e07f1
+Create Date: 2026-10-18 12:26:51.207733
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5a19c4d8b62'
+down_revision = '8d2c6a5e07f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # keep the first copy of every M-Pesa transaction saved more than once
+    op.execute(
+        """
+        DELETE FROM contributions WHERE contribution_id NOT IN (
+            SELECT MIN(contribution_id) FROM contributions
+            GROUP BY fundraiser_id, contribution_reference)
+        """
+    )
+    op.execute(
+        """
+        UPDATE fundraiser SET
+            funds_raised = COALESCE(
+                (SELECT SUM(amount) FROM contributions
+                 WHERE contributions.fundraiser_id = fundraiser.id), 0),
+            contribution_count = (
+                SELECT COUNT(*) FROM contributions
+                WHERE contributions.fundraiser_id = fundraiser.id)
+        """
+    )
+
+    with op.batch_alter_table('contributions', schema=None) as batch_op:
+        batch_op.create_index('uq_contributions_fundraiser_id_reference', ['fundraiser_id', 'contribution_reference'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('contributions', schema=None) as batch_op:
+        batch_op.drop_index('uq_contributions_fundraiser_id_reference')
@@ -1,10 +1,16 @@
+import base64
+import json
 import logging
+import re
 from flask import render_template, session, redirect, url_for, g, request
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event, literal_column, tuple_, type_coerce
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.sql import func
 
 db = SQLAlchemy()
 
+from datetime import datetime
 from functools import wraps
 
 """
@@ -23,13 +29,25 @@ def login_required(func):
     @wraps(func)
     def decorated_function(*args, **kwargs):
         if "user_id" not in session:
-            return redirect(url_for("login"))
-        g.user = User.query.get(session["user_id"])  # Retrieve user information
+            return redirect(url_for("main.login"))
+        current_user()  # Retrieve user information once per request
         return func(*args, **kwargs)
 
     return decorated_function
 
 
+def current_user():
+    """
+    Returns the logged-in User, or None, loading it at most once per request.
+
+    The user is kept on `g.user`, so every caller within a request shares one lookup.
+    """
+    if "user" not in g:
+        user_id = session.get("user_id")
+        g.user = db.session.get(User, user_id) if user_id else None
+    return g.user
+
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String, unique=True, nullable=False)
@@ -67,11 +85,30 @@ def error(message, code=400):
 
 class Fundraiser(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id"), nullable=False, index=True)
     name = db.Column(db.String, nullable=False)
     description = db.Column(db.String)
     end_date = db.Column(db.DateTime, nullable=False)
     target_funds = db.Column(db.Integer, nullable=False)
+    # running totals, kept in step with the contributions table by
+    # apply_contribution_totals() in the same transaction as each insert/delete
+    funds_raised = db.Column(db.DECIMAL, nullable=False, default=0, server_default="0")
+    contribution_count = db.Column(
+        db.Integer, nullable=False, default=0, server_default="0"
+    )
+    # bumped by every UPDATE of the row, including the running totals, so the pair
+    # identifies the current state of the fundraiser's data for ETag / Last-Modified
+    version = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+        onupdate=literal_column("version + 1"),
+    )
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # set once the fundraiser has ended and archive_fundraiser() has taken it out of the
+    # hot tables; it then accepts no contributions and its report is read-only
+    archived_at = db.Column(db.DateTime)
 
     user = db.relationship("User", backref=db.backref("fundraisers", lazy=True))
 
@@ -81,6 +118,8 @@ class Fundraiser(db.Model):
         self.description = description
         self.end_date = end_date
         self.target_funds = target_funds
+        self.funds_raised = 0
+        self.contribution_count = 0
 
     def __repr__(self):
         return f"<Fundraiser {self.name}>"
@@ -96,21 +135,9 @@ class Fundraiser(db.Model):
             ),  # convert datetime to string
             "target_funds": self.target_funds,
             "funds_raised": self.funds_raised,
+            "contribution_count": self.contribution_count,
         }
 
-    @property
-    def funds_raised(self):
-        """
-        Calculates the total amount of funds raised for the fundraiser associated with the current instance.
-        Returns the total amount raised as an integer. If no funds are raised, returns 0.
-        """
-        total = (
-            db.session.query(func.sum(Contribution.amount)) # type: ignore
-            .filter_by(fundraiser_id=self.id)
-            .scalar()
-        )
-        return total or 0
-
 
 # Fundraiser checker function
 """This code snippet defines a function has_active_fundraiser that checks if the current user has an active fundraiser 
@@ -118,20 +145,70 @@ by querying the database for a fundraiser associated with the user ID stored in
 it returns True, otherwise it returns False."""
 
 
+def active_fundraiser():
+    """
+    Returns the current user's latest fundraiser that is not archived, or None, loading
+    it at most once per request.
+
+    The result is kept on `g.active_fundraiser`, so the routes and has_active_fundraiser()
+    share one query.
+    """
+    if "active_fundraiser" not in g:
+        g.active_fundraiser = None
+        if "user_id" in session:  # Ensure user is logged in
+            g.active_fundraiser = (
+                Fundraiser.query.filter_by(user_id=session["user_id"], archived_at=None)
+                .order_by(Fundraiser.id.desc())
+                .first()
+            )
+    return g.active_fundraiser
+
+
+def owned_fundraiser_or_404(fundraiser_id):
+    """
+    Returns the logged-in user's fundraiser with this ID, or aborts with 404.
+
+    Another user's fundraiser answers the same as a missing one, so its contributors'
+    names and phone numbers cannot be read and its IDs cannot be probed.
+    """
+    return Fundraiser.query.filter_by(id=fundraiser_id, user_id=session.get("user_id")).first_or_404()
+
+
 def has_active_fundraiser():
     """Checks if the current user has an active fundraiser and returns the fundraiser ID."""
-    if "user_id" in session:  # Ensure user is logged in
-        user_fundraiser = Fundraiser.query.filter_by(user_id=session["user_id"]).first()
-        if user_fundraiser:
-            return user_fundraiser.id
+    user_fundraiser = active_fundraiser()
+    if user_fundraiser:
+        return user_fundraiser.id
     return None
 
 
-from datetime import datetime
+from decimal import Decimal
 
 
 class Contribution(db.Model):
+    # contributor_name, phone_number and contribution_reference are also indexed in
+    # the contributions_fts full-text table, which triggers keep in step; both are
+    # created by hand in migration d3f8b1a6c247
     __tablename__ = "contributions"
+    __table_args__ = (
+        # with the implicit rowid, serves fundraiser_id = ? AND contribution_id > ?
+        db.Index("ix_contributions_fundraiser_id", "fundraiser_id"),
+        db.Index("ix_contributions_fundraiser_id_timestamp", "fundraiser_id", "timestamp"),
+        db.Index(
+            "ix_contributions_fundraiser_id_contribution_date",
+            "fundraiser_id",
+            "contribution_date",
+        ),
+        # covers SUM(amount) per fundraiser without touching the table
+        db.Index("ix_contributions_fundraiser_id_amount", "fundraiser_id", "amount"),
+        # an M-Pesa transaction can only be recorded once per fundraiser
+        db.Index(
+            "uq_contributions_fundraiser_id_reference",
+            "fundraiser_id",
+            "contribution_reference",
+            unique=True,
+        ),
+    )
 
     contribution_id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     fundraiser_id = db.Column(
@@ -205,3 +282,973 @@ class Contribution(db.Model):
         return (
             f"<Contribution {self.contribution_id} for Fundraiser {self.fundraiser_id}>"
         )
+
+
+class ArchivedContribution(db.Model):
+    """
+    A contribution to a fundraiser that has been archived.
+
+    Same columns as Contribution, stored WITHOUT ROWID and clustered on
+    (fundraiser_id, contribution_id), so an archived fundraiser's contributions sit
+    together in one b-tree with no secondary indexes to maintain. Rows are only ever
+    written by archive_fundraiser().
+    """
+
+    __tablename__ = "archived_contributions"
+    __table_args__ = (
+        db.PrimaryKeyConstraint("fundraiser_id", "contribution_id"),
+        {"sqlite_with_rowid": False},
+    )
+
+    fundraiser_id = db.Column(db.Integer, db.ForeignKey("fundraiser.id"), nullable=False)
+    contribution_id = db.Column(db.Integer, nullable=False)
+    contribution_reference = db.Column(db.Text, nullable=False)
+    contributor_name = db.Column(db.Text, nullable=False)
+    phone_number = db.Column(db.Text, nullable=False)
+    amount = db.Column(db.DECIMAL, nullable=False)
+    contribution_date = db.Column(db.Date, nullable=False)
+    contribution_time = db.Column(db.Time, nullable=False)
+    timestamp = db.Column(db.DateTime(timezone=True))
+
+
+def all_contributions():
+    """
+    Returns the live and archived contributions as one subquery.
+
+    The totals and rollups of a fundraiser cover its contributions wherever they
+    are stored, and the reports of an archived fundraiser read through this too, so
+    they stay complete while its rows are being moved.
+    """
+    names = [column.name for column in ArchivedContribution.__table__.columns]
+    return db.union_all(
+        db.select(*(Contribution.__table__.c[name] for name in names)),
+        db.select(*(ArchivedContribution.__table__.c[name] for name in names)),
+    ).subquery("all_contributions")
+
+
+def contribution_source(archived=False):
+    """Returns the table the contributions of a live or an archived fundraiser are read from."""
+    return all_contributions() if archived else Contribution.__table__
+
+
+class ContributionDailyRollup(db.Model):
+    """
+    Contribution totals of one fundraiser for one day.
+
+    Like the other rollups, kept up to date in the same transaction as every
+    contribution insert and delete, so analytics never read the contributions table.
+    """
+
+    __tablename__ = "contribution_daily_rollup"
+
+    fundraiser_id = db.Column(db.Integer, db.ForeignKey("fundraiser.id"), primary_key=True)
+    contribution_date = db.Column(db.Date, primary_key=True)
+    amount_total = db.Column(db.DECIMAL, nullable=False, default=0, server_default="0")
+    contribution_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+
+class ContributionHourlyRollup(db.Model):
+    """Contribution totals of one fundraiser for one hour of the day, over all days."""
+
+    __tablename__ = "contribution_hourly_rollup"
+
+    fundraiser_id = db.Column(db.Integer, db.ForeignKey("fundraiser.id"), primary_key=True)
+    contribution_hour = db.Column(db.Integer, primary_key=True)
+    amount_total = db.Column(db.DECIMAL, nullable=False, default=0, server_default="0")
+    contribution_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+
+class ContributorRollup(db.Model):
+    """Contribution totals of one contributor, by phone number, to one fundraiser."""
+
+    __tablename__ = "contributor_rollup"
+    __table_args__ = (
+        # top contributors are read straight off this index
+        db.Index("ix_contributor_rollup_fundraiser_id_amount_total", "fundraiser_id", "amount_total"),
+    )
+
+    fundraiser_id = db.Column(db.Integer, db.ForeignKey("fundraiser.id"), primary_key=True)
+    phone_number = db.Column(db.Text, primary_key=True)
+    # the name on the contributor's latest message
+    contributor_name = db.Column(db.Text, nullable=False)
+    amount_total = db.Column(db.DECIMAL, nullable=False, default=0, server_default="0")
+    contribution_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+
+
+class OutboxEmail(db.Model):
+    """An email waiting in the outbox for the background sender in mailer.py."""
+
+    __tablename__ = "outbox_email"
+    __table_args__ = (
+        db.Index("ix_outbox_email_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    recipient = db.Column(db.String, nullable=False)
+    subject = db.Column(db.String)
+    body = db.Column(db.Text, nullable=False)
+    # pending until sent, failed once every attempt is used up
+    status = db.Column(db.String, nullable=False, default="pending", server_default="pending")
+    attempts = db.Column(db.Integer, nullable=False, default=0, server_default="0")
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    last_error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    sent_at = db.Column(db.DateTime)
+
+    def __repr__(self):
+        return f"<OutboxEmail {self.id} to {self.recipient} ({self.status})>"
+
+
+def apply_contribution_totals(connection, fundraiser_id, amount, count):
+    """
+    Adds amount and count to the stored running totals of a fundraiser.
+
+    The update runs on the given connection, so it commits or rolls back together
+    with the contribution rows it accounts for. Pass negative values for deletes.
+    """
+    fundraiser = Fundraiser.__table__
+    connection.execute(
+        fundraiser.update()
+        .where(fundraiser.c.id == fundraiser_id)
+        .values(
+            funds_raised=fundraiser.c.funds_raised + amount,
+            contribution_count=fundraiser.c.contribution_count + count,
+        )
+    )
+
+
+def apply_contribution_rollups(connection, fundraiser_id, rows, sign=1):
+    """
+    Adds contributions to the daily, hourly and contributor rollups of a fundraiser.
+
+    Like apply_contribution_totals(), this runs on the given connection so the rollups
+    commit or roll back with the contribution rows. rows are dictionaries with the
+    Contribution fields; pass sign=-1 when the rows are being deleted. Rollup rows left
+    with no contributions are removed.
+    """
+    days, hours, contributors, names = {}, {}, {}, {}
+    for row in rows:
+        amount = sign * Decimal(str(row["amount"]))
+        for totals, key in (
+            (days, row["contribution_date"]),
+            (hours, row["contribution_time"].hour),
+            (contributors, row["phone_number"]),
+        ):
+            total, count = totals.get(key, (0, 0))
+            totals[key] = (total + amount, count + sign)
+        names[row["phone_number"]] = row["contributor_name"]
+    if not days:
+        return
+
+    for model, key, totals in (
+        (ContributionDailyRollup, "contribution_date", days),
+        (ContributionHourlyRollup, "contribution_hour", hours),
+        (ContributorRollup, "phone_number", contributors),
+    ):
+        table = model.__table__
+        upsert = sqlite_insert(table)
+        set_ = {
+            "amount_total": table.c.amount_total + upsert.excluded.amount_total,
+            "contribution_count": table.c.contribution_count + upsert.excluded.contribution_count,
+        }
+        values = [
+            {"fundraiser_id": fundraiser_id, key: value, "amount_total": total, "contribution_count": count}
+            for value, (total, count) in totals.items()
+        ]
+        if model is ContributorRollup:
+            for row in values:
+                row["contributor_name"] = names[row["phone_number"]]
+            if sign > 0:
+                set_["contributor_name"] = upsert.excluded.contributor_name
+        connection.execute(
+            upsert.on_conflict_do_update(index_elements=[table.c.fundraiser_id, table.c[key]], set_=set_),
+            values,
+        )
+        if sign < 0:
+            connection.execute(
+                table.delete().where(table.c.fundraiser_id == fundraiser_id, table.c.contribution_count <= 0)
+            )
+
+
+def contribution_fields(contribution):
+    return {
+        "amount": contribution.amount,
+        "contribution_date": contribution.contribution_date,
+        "contribution_time": contribution.contribution_time,
+        "phone_number": contribution.phone_number,
+        "contributor_name": contribution.contributor_name,
+    }
+
+
+@event.listens_for(Contribution, "after_insert")
+def contribution_inserted(mapper, connection, target):
+    apply_contribution_totals(
+        connection, target.fundraiser_id, Decimal(str(target.amount)), 1
+    )
+    apply_contribution_rollups(connection, target.fundraiser_id, [contribution_fields(target)])
+
+
+@event.listens_for(Contribution, "after_delete")
+def contribution_deleted(mapper, connection, target):
+    apply_contribution_totals(
+        connection, target.fundraiser_id, -Decimal(str(target.amount)), -1
+    )
+    apply_contribution_rollups(connection, target.fundraiser_id, [contribution_fields(target)], sign=-1)
+
+
+def insert_contributions(fundraiser_id, rows):
+    """
+    Inserts many contributions to one fundraiser with a single batched INSERT.
+
+    Rows whose M-Pesa reference is already recorded for the fundraiser are skipped by
+    the unique (fundraiser_id, contribution_reference) index through ON CONFLICT DO
+    NOTHING, so no lookup runs before the write. The running totals and rollups of the
+    fundraiser are updated in the same transaction for the rows actually inserted. The
+    caller commits.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser.
+        rows (list): Dictionaries with the Contribution fields other than fundraiser_id.
+
+    Returns:
+        tuple: (inserted, duplicates). inserted maps each new reference to its
+        contribution ID; duplicates maps each skipped reference to the Contribution
+        recorded earlier.
+    """
+    values = {}
+    for row in rows:
+        values.setdefault(
+            row["contribution_reference"],
+            dict(row, fundraiser_id=fundraiser_id, amount=Decimal(str(row["amount"]))),
+        )
+    if not values:
+        return {}, {}
+
+    contributions = Contribution.__table__
+    connection = db.session.connection()
+    result = connection.execute(
+        sqlite_insert(contributions)
+        .on_conflict_do_nothing(
+            index_elements=[contributions.c.fundraiser_id, contributions.c.contribution_reference]
+        )
+        .returning(contributions.c.contribution_reference, contributions.c.contribution_id),
+        list(values.values()),
+    )
+    inserted = dict(result.all())
+    if inserted:
+        apply_contribution_totals(
+            connection,
+            fundraiser_id,
+            sum(values[reference]["amount"] for reference in inserted),
+            len(inserted),
+        )
+        apply_contribution_rollups(
+            connection, fundraiser_id, [values[reference] for reference in inserted]
+        )
+
+    duplicates = {}
+    skipped = [reference for reference in values if reference not in inserted]
+    if skipped:
+        duplicates = {
+            contribution.contribution_reference: contribution
+            for contribution in Contribution.query.filter(
+                Contribution.fundraiser_id == fundraiser_id,
+                Contribution.contribution_reference.in_(skipped),
+            )
+        }
+    return inserted, duplicates
+
+
+# Contributions removed per transaction when a fundraiser is deleted
+DELETE_CHUNK_SIZE = 5000
+
+
+def purge_fundraiser(fundraiser_id, chunk_size=DELETE_CHUNK_SIZE):
+    """
+    Deletes a fundraiser with its contributions and rollups, committing as it goes.
+
+    Contributions are removed by a DELETE of at most chunk_size rows at a time, found
+    through the fundraiser_id index, and each chunk commits on its own, so the write
+    lock is released between chunks and memory use does not grow with the fundraiser.
+    Every chunk takes its rows off the running totals and rollups before it commits,
+    so the fundraiser reads consistently until it is gone. Archived contributions go
+    first; the last chunk of live ones deletes the remaining contributions, the rollups
+    and the fundraiser in one transaction, so a contribution saved meanwhile cannot be
+    left behind.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser.
+        chunk_size (int): Contributions deleted per transaction.
+
+    Returns:
+        int: The number of contributions deleted.
+    """
+    deleted = 0
+    for table in (ArchivedContribution.__table__, Contribution.__table__):
+        chunk = (
+            db.select(table.c.contribution_id)
+            .where(table.c.fundraiser_id == fundraiser_id)
+            .limit(chunk_size)
+        )
+        while True:
+            connection = db.session.connection()
+            rows = connection.execute(
+                table.delete()
+                .where(table.c.fundraiser_id == fundraiser_id, table.c.contribution_id.in_(chunk))
+                .returning(
+                    table.c.amount,
+                    table.c.contribution_date,
+                    table.c.contribution_time,
+                    table.c.phone_number,
+                    table.c.contributor_name,
+                )
+            ).mappings().all()
+            deleted += len(rows)
+            if len(rows) < chunk_size and table is Contribution.__table__:
+                break
+            if rows:
+                apply_contribution_totals(
+                    connection, fundraiser_id, -sum(Decimal(str(row["amount"])) for row in rows), -len(rows)
+                )
+                apply_contribution_rollups(connection, fundraiser_id, rows, sign=-1)
+            db.session.commit()
+            if len(rows) < chunk_size:
+                break
+
+    for model in (ContributionDailyRollup, ContributionHourlyRollup, ContributorRollup):
+        connection.execute(model.__table__.delete().where(model.__table__.c.fundraiser_id == fundraiser_id))
+    fundraiser = Fundraiser.__table__
+    connection.execute(fundraiser.delete().where(fundraiser.c.id == fundraiser_id))
+    db.session.commit()
+    return deleted
+
+
+# Contributions moved to the archive per transaction
+ARCHIVE_CHUNK_SIZE = 5000
+
+# Most top contributors the analytics of a fundraiser list; an archived fundraiser keeps
+# only this many rows of its contributor rollup
+ANALYTICS_MAX_TOP_CONTRIBUTORS = 100
+
+
+def trim_contributor_rollup(fundraiser_id, keep=ANALYTICS_MAX_TOP_CONTRIBUTORS):
+    """Deletes all but the `keep` largest contributors from a fundraiser's contributor rollup."""
+    table = ContributorRollup.__table__
+    top = (
+        db.select(table.c.phone_number)
+        .where(table.c.fundraiser_id == fundraiser_id)
+        .order_by(table.c.amount_total.desc())
+        .limit(keep)
+    )
+    db.session.execute(
+        table.delete().where(table.c.fundraiser_id == fundraiser_id, table.c.phone_number.not_in(top))
+    )
+
+
+def archive_fundraiser(fundraiser_id, chunk_size=ARCHIVE_CHUNK_SIZE):
+    """
+    Moves a fundraiser's contributions out of the contributions table into the archive.
+
+    The fundraiser is marked archived first, so it stops accepting contributions and
+    its reports read from both tables, then its contributions are copied to
+    archived_contributions and deleted from contributions chunk_size rows per
+    transaction. Each row is in exactly one of the two tables at every commit, and the
+    running totals and rollups, which count both, do not change. The fundraiser row
+    itself stays, with its final totals. Running it again moves any contribution that
+    arrived after the first run.
+
+    The contributor rollup, one row per phone number, is then cut down to the top
+    contributors the analytics can list, as no contribution will reorder them. The daily
+    and hourly rollups stay whole: they hold one row per day of the campaign and at most
+    24, whatever the number of contributions, and the read-only analytics draw on them.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser.
+        chunk_size (int): Contributions moved per transaction.
+
+    Returns:
+        int: The number of contributions moved.
+    """
+    fundraiser = Fundraiser.__table__
+    db.session.execute(
+        fundraiser.update()
+        .where(fundraiser.c.id == fundraiser_id, fundraiser.c.archived_at.is_(None))
+        .values(archived_at=datetime.utcnow())
+    )
+    db.session.commit()
+
+    contributions, archive = Contribution.__table__, ArchivedContribution.__table__
+    names = [column.name for column in archive.columns]
+    moved = 0
+    while True:
+        contribution_ids = db.session.scalars(
+            db.select(contributions.c.contribution_id)
+            .where(contributions.c.fundraiser_id == fundraiser_id)
+            .limit(chunk_size)
+        ).all()
+        if not contribution_ids:
+            break
+        chunk = contributions.c.contribution_id.in_(contribution_ids)
+        db.session.execute(
+            archive.insert().from_select(
+                names, db.select(*(contributions.c[name] for name in names)).where(chunk)
+            )
+        )
+        db.session.execute(contributions.delete().where(chunk))
+        db.session.commit()
+        moved += len(contribution_ids)
+    trim_contributor_rollup(fundraiser_id)
+    db.session.commit()
+    logging.info("Archived fundraiser ID %s, %s contributions moved", fundraiser_id, moved)
+    return moved
+
+
+def archive_ended_fundraisers(ended_before, chunk_size=ARCHIVE_CHUNK_SIZE):
+    """
+    Archives every fundraiser that ended before a cutoff.
+
+    Archived fundraisers that still have rows in the contributions table, from a run
+    that was interrupted or a contribution saved while it ran, are finished too.
+
+    Parameters:
+        ended_before (datetime): Fundraisers whose end_date is earlier are archived.
+        chunk_size (int): Contributions moved per transaction.
+
+    Returns:
+        list: (fundraiser_id, moved) tuples for the fundraisers archived.
+    """
+    has_live_contributions = (
+        db.select(Contribution.contribution_id)
+        .where(Contribution.fundraiser_id == Fundraiser.id)
+        .exists()
+    )
+    fundraiser_ids = db.session.scalars(
+        db.select(Fundraiser.id)
+        .where(
+            db.or_(
+                db.and_(Fundraiser.archived_at.is_(None), Fundraiser.end_date < ended_before),
+                db.and_(Fundraiser.archived_at.isnot(None), has_live_contributions),
+            )
+        )
+        .order_by(Fundraiser.id)
+    ).all()
+    return [
+        (fundraiser_id, archive_fundraiser(fundraiser_id, chunk_size))
+        for fundraiser_id in fundraiser_ids
+    ]
+
+
+def reconcile_fundraiser_totals(fix=False):
+    """
+    Checks the stored fundraiser totals against the live and archived contributions.
+
+    Parameters:
+        fix (bool): Rewrite the stored totals of every mismatched fundraiser.
+
+    Returns:
+        list: (fundraiser_id, stored_total, stored_count, actual_total, actual_count)
+        tuples for the fundraisers whose stored totals were wrong.
+    """
+    contributions = all_contributions()
+    sums = (
+        db.session.query(
+            contributions.c.fundraiser_id.label("fundraiser_id"),
+            func.sum(contributions.c.amount).label("total"),
+            func.count(contributions.c.contribution_id).label("count"),
+        )
+        .group_by(contributions.c.fundraiser_id)
+        .subquery()
+    )
+    rows = (
+        db.session.query(
+            Fundraiser.id,
+            Fundraiser.funds_raised,
+            Fundraiser.contribution_count,
+            func.coalesce(sums.c.total, 0),
+            func.coalesce(sums.c.count, 0),
+        )
+        .outerjoin(sums, sums.c.fundraiser_id == Fundraiser.id)
+        .all()
+    )
+
+    mismatches = [
+        (fundraiser_id, stored_total, stored_count, Decimal(actual_total), actual_count)
+        for fundraiser_id, stored_total, stored_count, actual_total, actual_count in rows
+        if Decimal(stored_total or 0) != Decimal(actual_total)
+        or stored_count != actual_count
+    ]
+
+    if fix and mismatches:
+        for fundraiser_id, _, _, actual_total, actual_count in mismatches:
+            db.session.query(Fundraiser).filter_by(id=fundraiser_id).update(
+                {
+                    Fundraiser.funds_raised: actual_total,
+                    Fundraiser.contribution_count: actual_count,
+                },
+                synchronize_session=False,
+            )
+        db.session.commit()
+        logging.info("Rebuilt running totals for %s fundraisers", len(mismatches))
+
+    return mismatches
+
+
+def rebuild_contribution_rollups(fundraiser_id=None):
+    """
+    Recomputes the daily, hourly and contributor rollups from the live and archived contributions.
+
+    Used to fill the rollups after contributions were written without the ORM, and
+    to repair them. The contributor rollups of archived fundraisers are trimmed again
+    as archive_fundraiser() leaves them. Commits.
+
+    Parameters:
+        fundraiser_id (int): Only rebuild this fundraiser's rollups; all when None.
+    """
+    contributions = all_contributions()
+    scope = [] if fundraiser_id is None else [contributions.c.fundraiser_id == fundraiser_id]
+    # contribution_time is stored as "HH:MM:SS.ffffff"
+    hour = db.cast(func.substr(contributions.c.contribution_time, 1, 2), db.Integer)
+    # with max() in the select list SQLite takes the bare contributor_name from the
+    # row holding the maximum, so each contributor gets the name on their latest message
+    latest_name = (contributions.c.contributor_name, func.max(contributions.c.contribution_id))
+
+    for model, key_name, key, extra in (
+        (ContributionDailyRollup, "contribution_date", contributions.c.contribution_date, ()),
+        (ContributionHourlyRollup, "contribution_hour", hour, ()),
+        (ContributorRollup, "phone_number", contributions.c.phone_number, latest_name),
+    ):
+        table = model.__table__
+        delete = table.delete()
+        if fundraiser_id is not None:
+            delete = delete.where(table.c.fundraiser_id == fundraiser_id)
+        db.session.execute(delete)
+
+        grouped = (
+            db.select(
+                contributions.c.fundraiser_id.label("fundraiser_id"),
+                key.label("key"),
+                func.sum(contributions.c.amount).label("amount_total"),
+                func.count().label("contribution_count"),
+                *extra,
+            )
+            .where(*scope)
+            .group_by(contributions.c.fundraiser_id, key)
+            .subquery()
+        )
+        columns = [grouped.c.fundraiser_id, grouped.c.key, grouped.c.amount_total, grouped.c.contribution_count]
+        names = ["fundraiser_id", key_name, "amount_total", "contribution_count"]
+        if extra:
+            columns.append(grouped.c.contributor_name)
+            names.append("contributor_name")
+        db.session.execute(table.insert().from_select(names, db.select(*columns)))
+    archived = db.select(Fundraiser.id).where(Fundraiser.archived_at.isnot(None))
+    if fundraiser_id is not None:
+        archived = archived.where(Fundraiser.id == fundraiser_id)
+    for archived_id in db.session.scalars(archived).all():
+        trim_contributor_rollup(archived_id)
+    db.session.commit()
+
+
+def fundraiser_analytics(fundraiser, top=10):
+    """
+    Builds the analytics of a fundraiser from its rollups and stored totals.
+
+    No query touches the contributions table: the daily series reads one row per day of
+    the campaign, the hourly one at most 24 rows, and the top contributors come off an
+    index, so the cost does not grow with the number of contributions.
+
+    Parameters:
+        fundraiser (Fundraiser): The fundraiser to describe.
+        top (int): The number of top contributors to list.
+
+    Returns:
+        dict: funds_raised, contribution_count, average_contribution, daily (totals per
+        day), hourly (totals per hour of the day) and top_contributors.
+    """
+    daily = (
+        db.session.query(
+            ContributionDailyRollup.contribution_date,
+            ContributionDailyRollup.amount_total,
+            ContributionDailyRollup.contribution_count,
+        )
+        .filter(ContributionDailyRollup.fundraiser_id == fundraiser.id)
+        .order_by(ContributionDailyRollup.contribution_date)
+        .all()
+    )
+    hourly = (
+        db.session.query(
+            ContributionHourlyRollup.contribution_hour,
+            ContributionHourlyRollup.amount_total,
+            ContributionHourlyRollup.contribution_count,
+        )
+        .filter(ContributionHourlyRollup.fundraiser_id == fundraiser.id)
+        .all()
+    )
+    contributors = (
+        ContributorRollup.query.filter_by(fundraiser_id=fundraiser.id)
+        .order_by(ContributorRollup.amount_total.desc())
+        .limit(top)
+        .all()
+    )
+
+    def money(value):
+        return Decimal(str(value or 0)).quantize(Decimal("0.01"))
+
+    by_hour = {hour: (total, count) for hour, total, count in hourly}
+    count = fundraiser.contribution_count
+    return {
+        "funds_raised": money(fundraiser.funds_raised),
+        "contribution_count": count,
+        "average_contribution": money(Decimal(str(fundraiser.funds_raised)) / count if count else 0),
+        "daily": [
+            {"date": day.strftime("%Y-%m-%d"), "amount": money(total), "count": day_count}
+            for day, total, day_count in daily
+        ],
+        "hourly": [
+            {"hour": hour, "amount": money(by_hour.get(hour, (0, 0))[0]), "count": by_hour.get(hour, (0, 0))[1]}
+            for hour in range(24)
+        ],
+        "top_contributors": [
+            {
+                "contributor_name": contributor.contributor_name,
+                "phone_number": contributor.phone_number,
+                "amount": money(contributor.amount_total),
+                "count": contributor.contribution_count,
+            }
+            for contributor in contributors
+        ],
+    }
+
+
+def encode_cursor(timestamp_key, contribution_id):
+    """Encodes a (timestamp, contribution_id) position as an opaque URL-safe cursor."""
+    raw = json.dumps([timestamp_key, contribution_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Decodes a cursor made by encode_cursor(). Raises ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp_key, contribution_id = json.loads(raw)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+    if not isinstance(timestamp_key, str) or not isinstance(contribution_id, int):
+        raise ValueError(f"Invalid cursor: {cursor}")
+    return timestamp_key, contribution_id
+
+
+def contributions_page(fundraiser_id, limit, after=None, archived=False):
+    """
+    Fetches one keyset page of a fundraiser's contributions ordered by (timestamp, contribution_id).
+
+    The cursor carries the timestamp exactly as SQLite stores it, so the comparison
+    runs on the raw column and stays an index range scan no matter how deep the page is.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser.
+        limit (int): The maximum number of contributions to return.
+        after (str): The cursor returned with the previous page, or None for the first page.
+        archived (bool): Whether the fundraiser is archived, so its contributions are
+            read from the archive as well.
+
+    Returns:
+        tuple: (contributions, next_cursor) where next_cursor is None on the last page.
+        The contributions are rows with the Contribution fields as attributes.
+    """
+    source = contribution_source(archived)
+    timestamp_key = type_coerce(source.c.timestamp, db.String).label("timestamp_key")
+    query = db.select(source, timestamp_key).where(source.c.fundraiser_id == fundraiser_id)
+    if after:
+        query = query.where(
+            tuple_(timestamp_key, source.c.contribution_id) > tuple_(*decode_cursor(after))
+        )
+    rows = db.session.execute(
+        query.order_by(timestamp_key, source.c.contribution_id).limit(limit + 1)
+    ).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].timestamp_key, rows[-1].contribution_id)
+    return rows, next_cursor
+
+
+def fts_match(text):
+    """
+    Turns free text into an FTS5 query matching rows that contain every word.
+
+    The last word matches as a prefix, so a name or number can be looked up while it
+    is still being typed. Each word is quoted, so operators and punctuation typed by
+    the user are never parsed as query syntax.
+
+    Parameters:
+        text (str): The search text.
+
+    Returns:
+        str: The FTS5 query, or None if the text has no words.
+    """
+    words = [f'"{word}"' for word in re.findall(r"\w+", text or "")]
+    if not words:
+        return None
+    return " ".join(words) + "*"
+
+
+# A search that one of its filters narrows to at most this many contributions looks
+# them up by ID and sorts the matches; a broader one walks the (fundraiser_id,
+# timestamp) index until it has a page of matches
+SEARCH_CANDIDATE_LIMIT = 10000
+
+
+def fts_rowids(match):
+    """Returns a subquery of the IDs of the contributions, of any fundraiser, matching an FTS5 query."""
+    return (
+        db.text("SELECT rowid FROM contributions_fts WHERE contributions_fts MATCH :match")
+        .bindparams(match=match)
+        .columns(db.column("rowid", db.Integer))
+    )
+
+
+def bounded_count(query):
+    """Counts the rows of a query up to SEARCH_CANDIDATE_LIMIT + 1 without reading any further."""
+    return db.session.execute(
+        db.select(func.count()).select_from(query.limit(SEARCH_CANDIDATE_LIMIT + 1).subquery())
+    ).scalar()
+
+
+def narrowest_filter(fundraiser_id, filters, text_filter=None):
+    """
+    Finds the search filter that matches the fewest of a live fundraiser's contributions.
+
+    Each filter is counted on its own index, up to SEARCH_CANDIDATE_LIMIT + 1 rows,
+    so a broad filter costs no more than a bounded index range. The text filter is
+    counted on the full-text index, which covers every fundraiser, so its count is
+    an upper bound.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser.
+        filters (list): The search conditions on the contributions table.
+        text_filter (tuple): (condition, match) for the full-text condition among the
+            filters and its FTS5 query, or None.
+
+    Returns:
+        The narrowest condition, or None if every filter matches more than
+        SEARCH_CANDIDATE_LIMIT contributions.
+    """
+    narrowest, fewest = None, SEARCH_CANDIDATE_LIMIT
+    for condition in filters:
+        if text_filter and condition is text_filter[0]:
+            matching = fts_rowids(text_filter[1]).subquery()
+            count = bounded_count(db.select(matching.c.rowid))
+        else:
+            count = bounded_count(
+                db.select(literal_column("1")).where(
+                    Contribution.fundraiser_id == fundraiser_id, condition
+                )
+            )
+        if count <= fewest:
+            narrowest, fewest = condition, count
+    return narrowest
+
+
+def search_contributions(
+    fundraiser_id,
+    text=None,
+    min_amount=None,
+    max_amount=None,
+    date_from=None,
+    date_to=None,
+    limit=50,
+    archived=False,
+):
+    """
+    Searches a fundraiser's contributions by name, phone number or reference and by amount and date.
+
+    Live contributions are matched through the contributions_fts index and the
+    (fundraiser_id, amount) and (fundraiser_id, contribution_date) indexes. Left to
+    itself SQLite walks the (fundraiser_id, timestamp) index for the ordering and
+    tests every contribution of the fundraiser, so when one filter is narrow the
+    matches are looked up through it by ID and sorted, and otherwise the filters are
+    marked as likely() so the walk stops after the first page of matches. The
+    archive has no full-text index, so an archived fundraiser is matched word by
+    word with LIKE.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser.
+        text (str): Words that must all appear in the name, phone number or reference.
+        min_amount (Decimal): The smallest amount to include.
+        max_amount (Decimal): The largest amount to include.
+        date_from (date): The first contribution date to include.
+        date_to (date): The last contribution date to include.
+        limit (int): The maximum number of contributions to return.
+        archived (bool): Whether the fundraiser is archived.
+
+    Returns:
+        tuple: (contributions, truncated), the most recent matches first and whether
+        there were more than limit of them.
+    """
+    source = contribution_source(archived)
+    filters = []
+    text_filter = None
+
+    match = fts_match(text)
+    if match and archived:
+        for word in re.findall(r"\w+", text):
+            pattern = f"%{word}%"
+            filters.append(
+                db.or_(
+                    source.c.contributor_name.ilike(pattern),
+                    source.c.phone_number.like(pattern),
+                    source.c.contribution_reference.ilike(pattern),
+                )
+            )
+    elif match:
+        text_filter = (source.c.contribution_id.in_(fts_rowids(match)), match)
+        filters.append(text_filter[0])
+
+    for column, low, high in (
+        (source.c.amount, min_amount, max_amount),
+        (source.c.contribution_date, date_from, date_to),
+    ):
+        if low is not None and high is not None:
+            filters.append(column.between(low, high))
+        elif low is not None:
+            filters.append(column >= low)
+        elif high is not None:
+            filters.append(column <= high)
+
+    query = db.select(source)
+    narrowest = None if archived else narrowest_filter(fundraiser_id, filters, text_filter)
+    if archived:
+        query = query.where(source.c.fundraiser_id == fundraiser_id, *filters)
+    elif narrowest is not None:
+        # fundraiser_id stays inside the subquery; next to the ORDER BY it would send
+        # SQLite back to the timestamp index
+        candidates = db.select(Contribution.contribution_id).where(
+            Contribution.fundraiser_id == fundraiser_id, narrowest
+        )
+        query = query.where(
+            source.c.contribution_id.in_(candidates),
+            *(condition for condition in filters if condition is not narrowest),
+        )
+    else:
+        query = query.where(
+            source.c.fundraiser_id == fundraiser_id, *(func.likely(condition) for condition in filters)
+        )
+
+    rows = db.session.execute(
+        query.order_by(source.c.timestamp.desc(), source.c.contribution_id.desc()).limit(limit + 1)
+    ).all()
+    return rows[:limit], len(rows) > limit
+
+
+# Columns streamed by iter_contribution_rows(), in output order
+EXPORT_COLUMNS = (
+    "contribution_reference",
+    "contributor_name",
+    "phone_number",
+    "amount",
+    "contribution_date",
+    "contribution_time",
+    "timestamp",
+)
+
+
+def iter_contribution_rows(fundraiser_id, chunk_size=1000, archived=False):
+    """
+    Streams a fundraiser's contributions as chunks of plain rows.
+
+    Rows are read from the cursor chunk_size at a time instead of being loaded as
+    ORM objects, so memory stays flat however many contributions there are.
+
+    Parameters:
+        fundraiser_id (int): The ID of the fundraiser.
+        chunk_size (int): The number of rows fetched and yielded per chunk.
+        archived (bool): Whether the fundraiser is archived.
+
+    Yields:
+        list: Up to chunk_size rows with the fields named in EXPORT_COLUMNS.
+    """
+    source = contribution_source(archived)
+    columns = [source.c[name] for name in EXPORT_COLUMNS]
+    result = db.session.execute(
+        db.select(*columns)
+        .where(source.c.fundraiser_id == fundraiser_id)
+        .order_by(source.c.timestamp, source.c.contribution_id)
+        .execution_options(yield_per=chunk_size)
+    )
+    for rows in result.partitions():
+        yield rows
+
+
+def fundraiser_dashboard(user_id):
+    """
+    Lists a user's fundraisers with their progress, in one query.
+
+    The totals and counts are the stored running totals, and the time of the latest
+    contribution of every fundraiser is a correlated MAX() answered from the
+    (fundraiser_id, timestamp) index, or, for an archived fundraiser, the last row of
+    its archive. Every row costs a couple of index lookups, however many contributions
+    the fundraisers have.
+
+    Parameters:
+        user_id (int): The ID of the user.
+
+    Returns:
+        list: Rows with the Fundraiser columns the dashboard shows, progress (the
+        percent of the target raised, at most 100) and last_contribution_at, newest
+        fundraiser first. last_contribution_at is None for a fundraiser without
+        contributions.
+    """
+    latest_live = (
+        db.select(func.max(Contribution.timestamp))
+        .where(Contribution.fundraiser_id == Fundraiser.id)
+        .scalar_subquery()
+    )
+    latest_archived = (
+        db.select(ArchivedContribution.timestamp)
+        .where(ArchivedContribution.fundraiser_id == Fundraiser.id)
+        .order_by(ArchivedContribution.contribution_id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    # plain rows rather than Fundraiser objects; hundreds of them are read per page
+    return db.session.execute(
+        db.select(
+            Fundraiser.id,
+            Fundraiser.name,
+            Fundraiser.end_date,
+            Fundraiser.target_funds,
+            Fundraiser.funds_raised,
+            Fundraiser.contribution_count,
+            Fundraiser.archived_at,
+            # percent of the target raised, capped at 100 for the progress bar
+            func.coalesce(
+                func.min(Fundraiser.funds_raised * 100.0 / Fundraiser.target_funds, 100), 0
+            ).label("progress"),
+            func.coalesce(latest_live, latest_archived).label("last_contribution_at"),
+        )
+        .where(Fundraiser.user_id == user_id)
+        .order_by(Fundraiser.id.desc())
+    ).all()
+
+
+def latest_contribution_id(fundraiser_id, archived=False):
+    """Returns the ID of the most recent contribution to a fundraiser, or None if it has none."""
+    source = contribution_source(archived)
+    return db.session.scalar(
+        db.select(func.max(source.c.contribution_id)).where(source.c.fundraiser_id == fundraiser_id)
+    )
+
+
+def contributions_after(fundraiser_id, contribution_id, limit):
+    """Returns up to limit contributions to a fundraiser added after contribution_id, oldest first."""
+    return (
+        Contribution.query.filter(
+            Contribution.fundraiser_id == fundraiser_id,
+            Contribution.contribution_id > contribution_id,
+        )
+        .order_by(Contribution.contribution_id)
+        .limit(limit)
+        .all()
+    )
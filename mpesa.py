@@ -0,0 +1,104 @@
+"""
+Parsing of M-Pesa "money received" confirmation messages.
+
+A message looks like:
+
+    SBK1AB2CD3 Confirmed. You have received Ksh1,500.00 from JOHN KAMAU 0712345678
+    on 12/3/24 at 10:15 AM New M-PESA balance is Ksh7,300.00.
+
+parse_message() reads all the fields with one precompiled pattern and builds the date
+and time directly from the captured digits. Only a message that does not match falls
+back to the per-field patterns, to report which field is missing.
+"""
+import re
+from datetime import date, time
+
+MESSAGE_PATTERN = re.compile(
+    r"\b(?P<reference>[A-Z0-9]{10})\b"
+    r".*?Ksh(?P<amount>[\d,]+)\."
+    r".*?from (?P<name>[A-Z\s]+) (?P<phone>\d+) on "
+    r"(?P<day>\d{1,2})/(?P<month>\d{1,2})/(?P<year>\d{2}) at "
+    r"(?P<hour>\d{1,2}):(?P<minute>\d{2}) (?P<meridiem>AM|PM)",
+    re.DOTALL,
+)
+
+# Per-field patterns, in the order the fields are checked, with the error for a missing field
+FIELD_PATTERNS = (
+    ("contribution_reference", re.compile(r"\b([A-Z0-9]{10})\b"), "Invalid contribution reference"),
+    ("amount", re.compile(r"Ksh([\d,]+)\."), "Invalid amount"),
+    ("contributor_name", re.compile(r"from ([A-Z\s]+) \d"), "Invalid contributor name"),
+    ("phone_number", re.compile(r"(\d+) on"), "Invalid phone number"),
+    ("contribution_date", re.compile(r"on (\d{1,2})/(\d{1,2})/(\d{2}) at"), "Invalid contribution date"),
+    ("contribution_time", re.compile(r"at (\d{1,2}):(\d{2}) (AM|PM)"), "Invalid contribution time"),
+)
+
+# Splits pasted text into messages at blank lines or at each "<reference> Confirmed"
+MESSAGE_BOUNDARY = re.compile(r"\n\s*\n|(?=\b[A-Z0-9]{10} Confirmed)")
+
+
+def parse_message(message):
+    """
+    Extracts the contribution fields from an M-Pesa confirmation message.
+
+    Parameters:
+        message (str): The M-Pesa SMS text.
+
+    Returns:
+        dict: contribution_reference, amount, contributor_name, phone_number,
+        contribution_date and contribution_time, ready to build a Contribution.
+
+    Raises:
+        ValueError: If a field is missing or invalid; the error names the field.
+    """
+    match = MESSAGE_PATTERN.search(message)
+    if match is None:
+        return parse_message_fields(message)
+    reference, amount, name, phone, day, month, year, hour, minute, meridiem = match.groups()
+    return {
+        "contribution_reference": reference,
+        "amount": amount.replace(",", ""),
+        "contributor_name": name,
+        "phone_number": phone,
+        "contribution_date": make_date(day, month, year),
+        "contribution_time": make_time(hour, minute, meridiem),
+    }
+
+
+def parse_message_fields(message):
+    """Slow path of parse_message(): searches for each field on its own."""
+    found = {}
+    for field, pattern, error in FIELD_PATTERNS:
+        match = pattern.search(message)
+        if match is None:
+            raise ValueError(error)
+        found[field] = match.groups()
+    return {
+        "contribution_reference": found["contribution_reference"][0],
+        "amount": found["amount"][0].replace(",", ""),
+        "contributor_name": found["contributor_name"][0],
+        "phone_number": found["phone_number"][0],
+        "contribution_date": make_date(*found["contribution_date"]),
+        "contribution_time": make_time(*found["contribution_time"]),
+    }
+
+
+def make_date(day, month, year):
+    """Builds a date from d/m/yy digits, reading two-digit years the way strptime's %y does."""
+    year = int(year)
+    try:
+        return date(year + (2000 if year < 69 else 1900), int(month), int(day))
+    except ValueError:
+        raise ValueError("Invalid contribution date") from None
+
+
+def make_time(hour, minute, meridiem):
+    """Builds a time from 12-hour clock digits and AM/PM."""
+    hour, minute = int(hour), int(minute)
+    if not 1 <= hour <= 12 or minute > 59:
+        raise ValueError("Invalid contribution time")
+    return time(hour % 12 + (12 if meridiem == "PM" else 0), minute)
+
+
+def split_messages(text):
+    """Splits a block of pasted M-Pesa messages into the individual messages."""
+    return [message.strip() for message in MESSAGE_BOUNDARY.split(text) if message and message.strip()]
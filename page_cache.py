@@ -0,0 +1,121 @@
+"""
+In-process cache of rendered pages and template fragments.
+
+Entries are stored with the version stamp of the data they were rendered from,
+normally the fundraiser's (version, updated_at). A contribution committed by any
+worker bumps that stamp, so the next lookup with the fresh stamp misses and the
+re-rendered text replaces the stale entry. The cache is an LRU bounded by
+PAGE_CACHE_MAX_BYTES of rendered text in each worker process.
+
+Templates cache a fragment with a call block:
+
+    {% call cached_fragment("summary", fundraiser.id, version=fundraiser_stamp(fundraiser)) %}
+      ...
+    {% endcall %}
+"""
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+from flask import render_template, session
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
+
+from metrics import PAGE_CACHE_LOOKUPS
+
+# Memory allowed for cached pages and fragments in one worker process
+PAGE_CACHE_MAX_BYTES = int(os.environ.get("PAGE_CACHE_MAX_BYTES", 8 * 1024 * 1024))
+
+
+class PageCache:
+    """A thread-safe LRU of rendered text, bounded by the memory the text takes."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, version=None):
+        """Returns the text stored under key for this version, or None."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] == version:
+                self.entries.move_to_end(key)
+                PAGE_CACHE_LOOKUPS.labels(key[0], "hit").inc()
+                return entry[1]
+        PAGE_CACHE_LOOKUPS.labels(key[0], "miss").inc()
+        return None
+
+    def set(self, key, value, version=None):
+        """Stores value under key, replacing any other version and evicting the least recently used."""
+        size = sys.getsizeof(value)
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[2]
+            self.entries[key] = (version, value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, _, evicted) = self.entries.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+cache = PageCache(PAGE_CACHE_MAX_BYTES)
+
+
+def fundraiser_stamp(fundraiser):
+    """
+    The version stamp of a fundraiser's data.
+
+    updated_at is part of it because SQLite may hand the ID of a deleted fundraiser to the
+    next one created, which starts again at version 0.
+    """
+    return (fundraiser.version, fundraiser.updated_at)
+
+
+def cached_fragment(name, *key, version=None, caller=None):
+    """Template global that renders the body of a call block once per key and version."""
+    cache_key = ("fragment", name) + key
+    fragment = cache.get(cache_key, version)
+    if fragment is None:
+        fragment = Markup(caller())
+        cache.set(cache_key, fragment, version)
+    return fragment
+
+
+def render_fundraiser_page(template, fundraiser):
+    """
+    Renders a template whose only inputs are a fundraiser and whether the visitor is logged in.
+
+    Parameters:
+        template (str): The template name.
+        fundraiser (Fundraiser): The fundraiser passed to the template.
+
+    Returns:
+        str: The page, served from the cache while the fundraiser is unchanged.
+    """
+    key = ("page", template, fundraiser.id, "user_id" in session)
+    version = fundraiser_stamp(fundraiser)
+    page = cache.get(key, version)
+    if page is None:
+        page = render_template(template, fundraiser=fundraiser)
+        cache.set(key, page, version)
+    return page
+
+
+def init_page_cache(app):
+    """Registers the template helpers and gives Jinja a bytecode cache under the instance folder."""
+    directory = os.path.join(app.instance_path, "jinja_cache")
+    os.makedirs(directory, exist_ok=True)
+    # compiled templates survive worker restarts instead of being recompiled by each new worker
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory)
+    app.jinja_env.globals.update(cached_fragment=cached_fragment, fundraiser_stamp=fundraiser_stamp)
@@ -0,0 +1,146 @@
+"""
+Query plan checks for the hot queries.
+
+Each entry in HOT_QUERIES runs the same code the routes run. The SQL it issues is
+captured and fed back through EXPLAIN QUERY PLAN, and any step that scans a whole
+table or sorts through a temporary b-tree is reported. `flask check-query-plans`
+exits non-zero when a hot query loses its index, so it can guard deploys.
+"""
+from datetime import date
+
+from sqlalchemy import event
+from sqlalchemy.sql import func
+
+from models import (
+    db,
+    User,
+    Fundraiser,
+    Contribution,
+    contributions_after,
+    contributions_page,
+    encode_cursor,
+    fundraiser_analytics,
+    fundraiser_dashboard,
+    iter_contribution_rows,
+    latest_contribution_id,
+    search_contributions,
+)
+
+def fundraiser_or_stand_in(fundraiser_id):
+    """
+    Returns the fundraiser, or an unsaved one with its ID when there is none, so the
+    plans of a fresh database can be checked too.
+    """
+    fundraiser = db.session.get(Fundraiser, fundraiser_id)
+    if fundraiser is None:
+        fundraiser = Fundraiser(user_id=None, name="", description="", end_date=None, target_funds=0)
+        fundraiser.id = fundraiser_id
+    return fundraiser
+
+
+HOT_QUERIES = (
+    ("report first page", lambda fundraiser_id, user_id: contributions_page(fundraiser_id, 10)),
+    (
+        "report next page",
+        lambda fundraiser_id, user_id: contributions_page(
+            fundraiser_id, 10, after=encode_cursor("2024-01-01 00:00:00", 1)
+        ),
+    ),
+    ("report export", lambda fundraiser_id, user_id: list(iter_contribution_rows(fundraiser_id))),
+    (
+        "live updates",
+        lambda fundraiser_id, user_id: contributions_after(fundraiser_id, 1, 50),
+    ),
+    ("latest contribution", lambda fundraiser_id, user_id: latest_contribution_id(fundraiser_id)),
+    (
+        "contribution total",
+        lambda fundraiser_id, user_id: db.session.query(func.sum(Contribution.amount))
+        .filter_by(fundraiser_id=fundraiser_id)
+        .scalar(),
+    ),
+    (
+        "fundraiser contributions",
+        lambda fundraiser_id, user_id: Contribution.query.filter_by(fundraiser_id=fundraiser_id).all(),
+    ),
+    (
+        "user fundraiser",
+        lambda fundraiser_id, user_id: Fundraiser.query.filter_by(user_id=user_id, archived_at=None)
+        .order_by(Fundraiser.id.desc())
+        .first(),
+    ),
+    ("analytics", lambda fundraiser_id, user_id: fundraiser_analytics(fundraiser_or_stand_in(fundraiser_id))),
+    ("dashboard", lambda fundraiser_id, user_id: fundraiser_dashboard(user_id)),
+    (
+        "report search",
+        lambda fundraiser_id, user_id: search_contributions(fundraiser_id, text="0700000000"),
+    ),
+    (
+        "report search filters",
+        lambda fundraiser_id, user_id: search_contributions(
+            fundraiser_id, text="a", min_amount=100, date_from=date(2024, 1, 1)
+        ),
+    ),
+    ("login", lambda fundraiser_id, user_id: User.query.filter_by(username="").first()),
+)
+
+
+# Hot queries that sort a bounded set of candidates on purpose; see search_contributions()
+BOUNDED_SORTS = {"report search", "report search filters"}
+
+
+def is_full_scan(detail, sorts=False):
+    """
+    Tells whether an EXPLAIN QUERY PLAN step reads a whole table or sorts in a temp b-tree.
+
+    Scans of a virtual table go through its own index (MATCH for the full-text index),
+    and scans of a subquery read only the rows it returns, so neither is reported.
+    With sorts, sorting is expected and only full scans are reported.
+    """
+    if detail.startswith("SCAN "):
+        return "VIRTUAL TABLE" not in detail and not detail.startswith(("SCAN (subquery", "SCAN anon_"))
+    return not sorts and "USE TEMP B-TREE" in detail
+
+
+def check_query_plans(fundraiser_id=1, user_id=1):
+    """
+    Explains the statements issued by each hot query.
+
+    Parameters:
+        fundraiser_id (int): The fundraiser the queries run against.
+        user_id (int): The user the queries run against.
+
+    Returns:
+        list: (name, statement, plan, problems) tuples, where plan is the list of
+        plan steps and problems the steps that fall back to a full scan or sort.
+    """
+    results = []
+    for name, run in HOT_QUERIES:
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(db.engine, "before_cursor_execute", capture)
+        try:
+            run(fundraiser_id, user_id)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", capture)
+
+        connection = db.session.connection()
+        for statement, parameters in statements:
+            plan = [
+                row[3]
+                for row in connection.exec_driver_sql(
+                    "EXPLAIN QUERY PLAN " + statement, parameters
+                )
+            ]
+            results.append(
+                (
+                    name,
+                    statement,
+                    plan,
+                    [step for step in plan if is_full_scan(step, sorts=name in BOUNDED_SORTS)],
+                )
+            )
+    db.session.rollback()
+    return results
@@ -0,0 +1,141 @@
+"""
+Server-side rendering of the contribution report PDF.
+
+Reports are rendered by a small thread pool and cached on disk under the instance
+folder, keyed on the fundraiser and the state of its contributions. A download between
+two new contributions is served straight from the cached file.
+"""
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+
+from models import Fundraiser, iter_contribution_rows
+
+# Number of report renders that may run at the same time in one worker process
+REPORT_WORKERS = int(os.environ.get("REPORT_WORKERS", 2))
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 15 * mm
+ROW_HEIGHT = 14
+TABLE_HEADINGS = ("Reference", "Name", "Amount", "Date", "Time", "Timestamp")
+# x offset of each table column from the left margin
+TABLE_COLUMNS = (0, 70, 215, 300, 355, 400)
+
+_executor = None
+_pending = {}
+_lock = threading.Lock()
+
+
+def report_cache_dir(app):
+    path = os.path.join(app.instance_path, "report_cache")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def report_cache_key(fundraiser, latest_contribution_id):
+    """Builds the cache key of a fundraiser's report from the state of its contributions."""
+    return f"fundraiser_{fundraiser.id}_{latest_contribution_id or 0}_{fundraiser.contribution_count}"
+
+
+def get_report_pdf(app, fundraiser, latest_contribution_id):
+    """
+    Returns the cached report PDF of a fundraiser, scheduling a render if there is none.
+
+    Parameters:
+        app (Flask): The application, used to give the render thread an app context.
+        fundraiser (Fundraiser): The fundraiser to report on.
+        latest_contribution_id (int): The ID of the fundraiser's latest contribution.
+
+    Returns:
+        tuple: (key, path, future). path is set when the PDF is already cached,
+        otherwise future resolves to the path once the render finishes.
+    """
+    key = report_cache_key(fundraiser, latest_contribution_id)
+    path = os.path.join(report_cache_dir(app), f"{key}.pdf")
+    if os.path.exists(path):
+        return key, path, None
+
+    global _executor
+    with _lock:
+        future = _pending.get(key)
+        if future is None:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=REPORT_WORKERS, thread_name_prefix="report-pdf"
+                )
+            future = _executor.submit(render_report_pdf, app, fundraiser.id, key, path)
+            future.add_done_callback(lambda _: _pending.pop(key, None))
+            _pending[key] = future
+    return key, None, future
+
+
+def render_report_pdf(app, fundraiser_id, key, path):
+    """
+    Renders the contribution report of a fundraiser to path.
+
+    The PDF is written to a temporary file and moved into place once complete, and
+    older cached reports of the same fundraiser are removed.
+    """
+    with app.app_context():
+        fundraiser = Fundraiser.query.get(fundraiser_id)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        pdf = canvas.Canvas(tmp_path, pagesize=A4)
+        pdf.setTitle(f"Fundraiser Report {fundraiser.name}")
+
+        y = PAGE_HEIGHT - MARGIN
+        pdf.setFont("Times-Bold", 16)
+        pdf.drawString(MARGIN, y, "Nijenge")
+        pdf.setFont("Times-Roman", 12)
+        for line in (
+            f"Fundraiser: {fundraiser.name}",
+            f"Description: {fundraiser.description or ''}",
+            f"End Date: {fundraiser.end_date.strftime('%B %d, %Y')}",
+            f"Target Funds: KES {fundraiser.target_funds:,.2f}",
+            f"Funds Raised: KES {fundraiser.funds_raised:,.2f}",
+        ):
+            y -= 18
+            pdf.drawString(MARGIN, y, line)
+        y = draw_table_heading(pdf, y - 30)
+
+        for rows in iter_contribution_rows(fundraiser_id, archived=fundraiser.archived_at is not None):
+            for reference, name, _, amount, date, time, timestamp in rows:
+                if y < MARGIN:
+                    pdf.showPage()
+                    y = draw_table_heading(pdf, PAGE_HEIGHT - MARGIN)
+                cells = (
+                    reference,
+                    name[:28],
+                    f"KES {amount:,.2f}",
+                    date.strftime("%d-%m-%Y"),
+                    time.strftime("%H:%M:%S"),
+                    timestamp.strftime("%d-%m-%Y %H:%M:%S") if timestamp else "",
+                )
+                for x, cell in zip(TABLE_COLUMNS, cells):
+                    pdf.drawString(MARGIN + x, y, cell)
+                y -= ROW_HEIGHT
+
+        pdf.save()
+        os.replace(tmp_path, path)
+
+    prefix = f"fundraiser_{fundraiser_id}_"
+    for name in os.listdir(os.path.dirname(path)):
+        if name.startswith(prefix) and name.endswith(".pdf") and name != f"{key}.pdf":
+            try:
+                os.remove(os.path.join(os.path.dirname(path), name))
+            except OSError:
+                pass
+    logging.info("Rendered report PDF for fundraiser ID %s", fundraiser_id)
+    return path
+
+
+def draw_table_heading(pdf, y):
+    pdf.setFont("Helvetica-Bold", 9)
+    for x, heading in zip(TABLE_COLUMNS, TABLE_HEADINGS):
+        pdf.drawString(MARGIN + x, y, heading)
+    pdf.setFont("Helvetica", 9)
+    return y - ROW_HEIGHT
@@ -0,0 +1,77 @@
+"""
+Production engine profile for SQLite.
+
+Every new DBAPI connection gets the pragmas in SQLITE_PRAGMAS: WAL so readers never
+block behind the writer, synchronous=NORMAL (safe with WAL), a busy timeout so
+concurrent writers from other gunicorn workers queue for the lock instead of failing
+with "database is locked", and a larger page cache and memory map for reads.
+Each pragma can be overridden with an environment variable of the same name in
+upper case, e.g. SQLITE_BUSY_TIMEOUT=10000.
+"""
+import logging
+import os
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,  # milliseconds
+    "cache_size": -20000,  # negative means KiB, so 20 MB per connection
+    "mmap_size": 268435456,  # 256 MB
+    "temp_store": "MEMORY",
+}
+
+
+def sqlite_pragmas():
+    return {
+        name: os.environ.get(f"SQLITE_{name.upper()}", default)
+        for name, default in SQLITE_PRAGMAS.items()
+    }
+
+
+def engine_options(database_uri):
+    """
+    Builds SQLALCHEMY_ENGINE_OPTIONS for the given database URI.
+
+    The pool holds one connection per request thread of a worker process: set
+    DB_POOL_SIZE, or WEB_THREADS when gunicorn runs threaded workers. An in-memory
+    database gets no pool sizing, since Flask-SQLAlchemy keeps it on a single shared
+    connection (StaticPool), which takes no size.
+    """
+    url = make_url(database_uri)
+    if url.get_backend_name() != "sqlite":
+        return {}
+    options = {
+        "connect_args": {
+            # pysqlite's own lock wait, in seconds, matching busy_timeout
+            "timeout": int(sqlite_pragmas()["busy_timeout"]) / 1000,
+            "check_same_thread": False,
+        },
+    }
+    if url.database in (None, "", ":memory:") or url.query.get("mode") == "memory":
+        return options
+    pool_size = int(os.environ.get("DB_POOL_SIZE", os.environ.get("WEB_THREADS", 5)))
+    options.update(
+        pool_size=pool_size,
+        max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", 2)),
+        pool_timeout=30,
+    )
+    return options
+
+
+def init_sqlite_profile(engine):
+    """Applies the SQLite pragmas to every connection the engine opens."""
+    if engine.dialect.name != "sqlite":
+        return
+    pragmas = sqlite_pragmas()
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    logging.info("SQLite engine profile: %s", pragmas)
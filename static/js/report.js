@@ -1,9 +1,13 @@
 document.addEventListener("DOMContentLoaded", function () {
   const rowsPerPage = 10;
   let currentPage = 1;
-  let contributions = [];
+  let totalContributions = 0;
+  // cursors[i] is the `after` value that fetches page i + 1
+  const cursors = [null];
+  const pages = new Map();
 
-  fetchReportData(getFundraiserId());
+  const fundraiserId = getFundraiserId();
+  showPage(1);
 
   function getFundraiserId() {
     const fundraiserIdElement = document.getElementById("fundraiser-id");
@@ -20,32 +24,44 @@ document.addEventListener("DOMContentLoaded", function () {
     return null;
   }
 
-  // Fetch report data from the server
-  function fetchReportData(fundraiserId) {
-    fetch(`/report/${fundraiserId}?format=json`)
-      .then((response) => {
-        if (!response.ok) {
-          throw new Error(
-            `Network response was not ok: ${response.statusText}`
-          );
-        }
-        return response.json();
-      })
+  // Fetch one page of report data from the server
+  function fetchReportPage(fundraiserId, after, limit) {
+    const params = new URLSearchParams({ format: "json", limit: limit });
+    if (after) {
+      params.set("after", after);
+    }
+    // revalidate the browser's cached copy; the server answers 304 when nothing changed
+    return fetch(`/report/${fundraiserId}?${params}`, { cache: "no-cache" }).then((response) => {
+      if (!response.ok) {
+        throw new Error(`Network response was not ok: ${response.statusText}`);
+      }
+      return response.json();
+    });
+  }
+
+  function showPage(page) {
+    if (pages.has(page)) {
+      currentPage = page;
+      updateContributionsTable(pages.get(page));
+      return;
+    }
+    fetchReportPage(fundraiserId, cursors[page - 1], rowsPerPage)
       .then((data) => {
-        contributions = data.items;
-        updateContributionsTable();
+        totalContributions = data.total;
+        pages.set(page, data.items);
+        if (data.next_cursor) {
+          cursors[page] = data.next_cursor;
+        }
+        currentPage = page;
+        updateContributionsTable(data.items);
       })
       .catch((error) => console.error("Error:", error));
   }
 
-  function updateContributionsTable() {
+  function updateContributionsTable(pageContributions) {
     const tableBody = document.querySelector("#contributions-table-body");
     tableBody.innerHTML = ""; // Clear the table body
 
-    const start = (currentPage - 1) * rowsPerPage;
-    const end = start + rowsPerPage;
-    const pageContributions = contributions.slice(start, end);
-
     pageContributions.forEach((contribution) => {
       const row = tableBody.insertRow();
       row.insertCell().textContent = contribution.reference;
@@ -60,68 +76,125 @@ document.addEventListener("DOMContentLoaded", function () {
   }
 
   function updatePaginationControls() {
-    const totalPages = Math.ceil(contributions.length / rowsPerPage);
+    const totalPages = Math.max(1, Math.ceil(totalContributions / rowsPerPage));
     document.getElementById(
       "page-info"
     ).textContent = `Page ${currentPage} of ${totalPages}`;
     document.getElementById("prev-page").disabled = currentPage === 1;
-    document.getElementById("next-page").disabled = currentPage === totalPages;
+    document.getElementById("next-page").disabled = !cursors[currentPage];
   }
 
   document.getElementById("prev-page").addEventListener("click", () => {
     if (currentPage > 1) {
-      currentPage--;
-      updateContributionsTable();
+      showPage(currentPage - 1);
     }
   });
 
   document.getElementById("next-page").addEventListener("click", () => {
-    const totalPages = Math.ceil(contributions.length / rowsPerPage);
-    if (currentPage < totalPages) {
-      currentPage++;
-      updateContributionsTable();
+    if (cursors[currentPage]) {
+      showPage(currentPage + 1);
+    }
+  });
+
+  // Search the contributions; the matches replace the paged report until the search is cleared
+  function fetchSearchResults(fundraiserId, params) {
+    return fetch(`/report/${fundraiserId}/search?${params}`, { cache: "no-cache" }).then((response) => {
+      if (!response.ok) {
+        return response.json().then(
+          (data) => {
+            throw new Error(data.message || response.statusText);
+          },
+          () => {
+            throw new Error(response.statusText);
+          }
+        );
+      }
+      return response.json();
+    });
+  }
+
+  function searchParams() {
+    const params = new URLSearchParams();
+    const fields = {
+      q: "search-text",
+      min_amount: "search-min-amount",
+      max_amount: "search-max-amount",
+      from: "search-from",
+      to: "search-to",
+    };
+    Object.entries(fields).forEach(([name, id]) => {
+      const value = document.getElementById(id).value.trim();
+      if (value) {
+        params.set(name, value);
+      }
+    });
+    return params;
+  }
+
+  document.getElementById("search-form").addEventListener("submit", (event) => {
+    event.preventDefault();
+    const params = searchParams();
+    if ([...params.keys()].length === 0) {
+      clearSearch();
+      return;
     }
+    fetchSearchResults(fundraiserId, params)
+      .then((data) => {
+        updateContributionsTable(data.items);
+        document.getElementById("pagination-controls").hidden = true;
+        const count = data.items.length;
+        document.getElementById("search-info").textContent = data.truncated
+          ? `Showing the latest ${count} matches; narrow the search to see the rest.`
+          : `${count} ${count === 1 ? "match" : "matches"}`;
+      })
+      .catch((error) => {
+        console.error("Error:", error);
+        toastr.error(`Search failed: ${error.message}`);
+      });
   });
 
+  function clearSearch() {
+    document.getElementById("search-form").reset();
+    document.getElementById("search-info").textContent = "";
+    document.getElementById("pagination-controls").hidden = false;
+    showPage(currentPage);
+  }
+
+  document.getElementById("clear-search").addEventListener("click", clearSearch);
+
   // Event listener for the download button
   document
     .getElementById("download-pdf")
-    .addEventListener("click", generatePDF);
-
-  // Generate PDF
-  function generatePDF() {
-    const { jsPDF } = window.jspdf;
-    const doc = new jsPDF();
-
-    // Add Nijenge and Fundraiser details
-    doc.setFont("Times");
-    doc.setFontSize(14);
-    doc.text("Nijenge", 20, 20);
-    doc.text(`Fundraiser: ${fundraiser.name}`, 20, 30);
-    doc.text(`Description: ${fundraiser.description}`, 20, 40);
-    doc.text(`End Date: ${fundraiser.end_date}`, 20, 50);
-    doc.text(`Target Funds: ${fundraiser.target_funds}`, 20, 60);
-    doc.text(`Funds Raised: ${fundraiser.funds_raised}`, 20, 70);
-
-    // Add some space before the table
-    doc.text("", 20, 80);
-
-    // Add contributions table
-    doc.autoTable({
-      startY: 90,
-      head: [["Reference", "Name", "Amount", "Date", "Time", "Timestamp"]],
-      body: contributions.map((contribution) => [
-        contribution.reference,
-        contribution.name,
-        contribution.amount,
-        contribution.date,
-        contribution.time,
-        contribution.timestamp,
-      ]),
-      margin: { top: 10 },
-    });
+    .addEventListener("click", downloadPDF);
 
-    // Save the PDF
-    doc.save(`Fundraiser_Report_${fundraiser.name}.pdf`);
+  // Download the PDF rendered by the server, retrying while it is being prepared
+  function downloadPDF() {
+    fetch(`/report/${fundraiserId}/pdf`)
+      .then((response) => {
+        if (response.status === 202) {
+          const retryAfter = Number(response.headers.get("Retry-After")) || 2;
+          toastr.info("Preparing the report...");
+          setTimeout(downloadPDF, retryAfter * 1000);
+          return null;
+        }
+        if (!response.ok) {
+          throw new Error(`Network response was not ok: ${response.statusText}`);
+        }
+        return response.blob();
+      })
+      .then((blob) => {
+        if (!blob) {
+          return;
+        }
+        const link = document.createElement("a");
+        link.href = URL.createObjectURL(blob);
+        link.download = `Fundraiser_Report_${fundraiserId}.pdf`;
+        link.click();
+        URL.revokeObjectURL(link.href);
+      })
+      .catch((error) => {
+        console.error("Error:", error);
+        toastr.error("An error occurred while downloading the report.");
+      });
   }
 });
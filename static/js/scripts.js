@@ -66,25 +66,28 @@ document.addEventListener("DOMContentLoaded", (event) => {
         });
     }
 
-    // Delete fundraiser functionality
+    // Delete fundraiser functionality, offered only on the pages of one fundraiser
     const deleteFundraiser = document.getElementById('deleteFundraiser');
-    if (deleteFundraiser) {
+    const fundraiserIdInput = document.getElementById('fundraiser-id');
+    if (deleteFundraiser && fundraiserIdInput && fundraiserIdInput.value) {
+        deleteFundraiser.hidden = false;
         deleteFundraiser.addEventListener('click', function() {
-            if (confirm('Are you sure you want to delete your fundraiser?')) {
-                // Make a request to the server to delete the fundraiser
+            if (confirm('Are you sure you want to delete this fundraiser?')) {
+                // Make a request to the server to delete the fundraiser shown on this page
                 fetch('/delete_fundraiser', {
                     method: 'POST',
                     headers: {
                         'Content-Type': 'application/json'
-                    }
-                }).then(response => {
-                    if (response.ok) {
+                    },
+                    body: JSON.stringify({ fundraiser_id: fundraiserIdInput.value })
+                }).then(response => response.json().then(data => {
+                    if (response.ok && data.success) {
                         toastr.success('Fundraiser deleted successfully.');
-                        window.location.href = '/';
+                        window.location.href = '/dashboard';
                     } else {
-                        toastr.error('Failed to delete fundraiser.');
+                        toastr.error(data.message || 'Failed to delete fundraiser.');
                     }
-                }).catch(error => {
+                })).catch(error => {
                     console.error('Error:', error);
                     toastr.error('An error occurred.');
                 });
@@ -124,6 +127,10 @@ function saveContribution(fundraiserId, message) {
       }
     },
     error: function (xhr, status, error) {
+      if (xhr.responseJSON && xhr.responseJSON.status === "duplicate") {
+        toastr.warning(xhr.responseJSON.message);
+        return;
+      }
       toastr.error("Error saving contribution: " + error);
     },
   });
@@ -209,3 +216,71 @@ document.addEventListener("DOMContentLoaded", function () {
     });
   }
 });
+
+// bulk contribution upload
+document.addEventListener("DOMContentLoaded", function () {
+  var bulkForm = document.getElementById("bulk-form");
+
+  if (bulkForm) {
+    bulkForm.addEventListener("submit", function (e) {
+      e.preventDefault();
+
+      fetch(bulkForm.action, {
+        method: "POST",
+        body: new FormData(bulkForm),
+      })
+        .then((response) => response.json())
+        .then((data) => {
+          if (data.status === "success") {
+            toastr.success(data.message);
+            data.data.results
+              .filter((result) => result.status !== "saved")
+              .forEach((result) =>
+                toastr.warning(`Message ${result.index + 1}: ${result.message}`)
+              );
+            var fundsRaised = document.getElementById("funds-raised");
+            if (fundsRaised) {
+              fundsRaised.textContent =
+                "KES " +
+                Number(data.data.funds_raised).toLocaleString("en-US", {
+                  minimumFractionDigits: 2,
+                  maximumFractionDigits: 2,
+                });
+            }
+            bulkForm.reset();
+          } else {
+            toastr.error(data.message);
+          }
+        })
+        .catch((error) => {
+          console.log("AJAX Error:", error);
+          toastr.error("An error occurred while uploading the messages");
+        });
+    });
+  }
+});
+
+// live funds raised, pushed by the server as contributions are committed
+document.addEventListener("DOMContentLoaded", function () {
+  var fundsRaised = document.getElementById("funds-raised");
+  var fundraiserId = document.getElementById("fundraiser-id");
+
+  if (fundsRaised && fundraiserId && window.EventSource) {
+    var source = new EventSource(`/fundraiser/${fundraiserId.value}/events`);
+
+    source.addEventListener("totals", function (event) {
+      var totals = JSON.parse(event.data);
+      fundsRaised.textContent =
+        "KES " +
+        Number(totals.funds_raised).toLocaleString("en-US", {
+          minimumFractionDigits: 2,
+          maximumFractionDigits: 2,
+        });
+    });
+
+    // the browser reconnects on its own after an error; close when leaving the page
+    window.addEventListener("beforeunload", function () {
+      source.close();
+    });
+  }
+});
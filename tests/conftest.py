@@ -0,0 +1,146 @@
+"""
+Fixtures shared by the tests.
+
+Every test gets its own SQLite file, copied from one migrated when the session starts,
+so the schema under test is the one the migrations build, full-text triggers included.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+# read once, when the first app starts the log listener
+LOG_DIR = tempfile.mkdtemp(prefix="nijenge-test-logs-")
+os.environ["LOG_FILE"] = os.path.join(LOG_DIR, "app.log")
+os.environ.setdefault("RECIPIENT", "organiser@example.com")
+
+PASSWORD = "secret"
+
+
+def make_app(path):
+    from app import create_app
+    from page_cache import cache
+
+    cache.clear()
+    return create_app(
+        {
+            "SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}",
+            "SECRET_KEY": "test",
+            "TESTING": True,
+        }
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def instance_folder():
+    """Removes the compiled templates and rendered PDFs the apps leave in the instance folder."""
+    instance = os.path.join(ROOT, "instance")
+    existed = os.path.exists(instance)
+    yield instance
+    if not existed:
+        shutil.rmtree(instance, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def migrated_database(tmp_path_factory):
+    """A database file migrated to the current schema, copied by each test."""
+    from flask_migrate import Migrate, upgrade
+
+    from models import db
+
+    path = str(tmp_path_factory.mktemp("schema") / "schema.db")
+    app = make_app(path)
+    Migrate(app, db)
+    with app.app_context():
+        upgrade(directory=os.path.join(ROOT, "migrations"))
+        db.engine.dispose()
+    return path
+
+
+@pytest.fixture
+def app(migrated_database, tmp_path):
+    path = str(tmp_path / "test.db")
+    shutil.copy(migrated_database, path)
+    app = make_app(path)
+    yield app
+    from models import db
+
+    with app.app_context():
+        db.session.remove()
+        db.engine.dispose()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def create_user(app, username="organiser@example.com"):
+    """Creates a user with PASSWORD and returns its ID."""
+    from werkzeug.security import generate_password_hash
+
+    from models import db, User
+
+    with app.app_context():
+        user = User(username=username, password=generate_password_hash(PASSWORD))
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+def create_fundraiser(app, user_id, name="Harambee"):
+    """Creates a fundraiser ending in the future and returns its ID."""
+    from datetime import datetime, timedelta
+
+    from models import db, Fundraiser
+
+    with app.app_context():
+        fundraiser = Fundraiser(
+            user_id=user_id,
+            name=name,
+            description="Test fundraiser",
+            end_date=datetime.utcnow() + timedelta(days=30),
+            target_funds=100000,
+        )
+        db.session.add(fundraiser)
+        db.session.commit()
+        return fundraiser.id
+
+
+def login(client, username="organiser@example.com"):
+    response = client.post("/login", data={"username": username, "password": PASSWORD})
+    assert response.status_code == 302, response.get_data(as_text=True)
+
+
+def contribute(client, fundraiser_id, reference, seed=1):
+    """Posts one synthetic M-Pesa confirmation to a fundraiser and returns the response."""
+    import random
+
+    from mpesa_corpus import make_message
+
+    message = make_message(random.Random(seed), reference=reference)
+    return client.post(f"/fundraiser_success/{fundraiser_id}", data={"message": message})
+
+
+@pytest.fixture
+def organiser(app, client):
+    """A logged-in user with one fundraiser, as (user_id, fundraiser_id)."""
+    user_id = create_user(app)
+    fundraiser_id = create_fundraiser(app, user_id)
+    login(client)
+    return user_id, fundraiser_id
+
+
+@pytest.fixture
+def seeded(app):
+    """Synthetic users, fundraisers and contributions; returns the fundraiser IDs, busiest first."""
+    import seed_data
+
+    with app.app_context():
+        return seed_data.seed(users=5, contributions=3000, echo=lambda line: None)
@@ -0,0 +1,39 @@
+from models import ANALYTICS_MAX_TOP_CONTRIBUTORS
+
+
+def contributor_rows(fundraiser_id):
+    from models import db, ContributorRollup
+
+    return db.session.query(ContributorRollup).filter_by(fundraiser_id=fundraiser_id).count()
+
+
+def test_archive_keeps_analytics_and_trims_the_contributor_rollup(app, seeded):
+    from models import (
+        archive_fundraiser,
+        db,
+        fundraiser_analytics,
+        rebuild_contribution_rollups,
+        Fundraiser,
+    )
+
+    fundraiser_id, live_id = seeded[0], seeded[1]
+    with app.app_context():
+        live_rows = contributor_rows(live_id)
+        before = fundraiser_analytics(db.session.get(Fundraiser, fundraiser_id), top=ANALYTICS_MAX_TOP_CONTRIBUTORS)
+        assert contributor_rows(fundraiser_id) > ANALYTICS_MAX_TOP_CONTRIBUTORS
+
+        assert archive_fundraiser(fundraiser_id) > 0
+        db.session.expire_all()
+        after = fundraiser_analytics(db.session.get(Fundraiser, fundraiser_id), top=ANALYTICS_MAX_TOP_CONTRIBUTORS)
+        assert contributor_rows(fundraiser_id) == ANALYTICS_MAX_TOP_CONTRIBUTORS
+
+        rebuild_contribution_rollups()
+        assert contributor_rows(fundraiser_id) == ANALYTICS_MAX_TOP_CONTRIBUTORS
+        assert contributor_rows(live_id) == live_rows
+
+    def amounts(analytics):
+        return sorted(row["amount"] for row in analytics["top_contributors"])
+
+    assert after["daily"] == before["daily"]
+    assert after["hourly"] == before["hourly"]
+    assert amounts(after) == amounts(before)
@@ -0,0 +1,78 @@
+import io
+import random
+
+from conftest import contribute
+from mpesa_corpus import make_message
+
+
+def test_bulk_upload_saves_each_message(client, organiser):
+    _, fundraiser_id = organiser
+    rng = random.Random(5)
+    text = "\n\n".join(make_message(rng, reference=f"BLK{i:07d}") for i in range(3))
+
+    response = client.post(
+        f"/fundraiser_success/{fundraiser_id}/bulk",
+        data={"file": (io.BytesIO(text.encode()), "messages.txt")},
+    )
+
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.get_json()["data"]["saved"] == 3
+
+
+def test_bulk_upload_over_the_size_limit_is_refused(app, client, organiser):
+    _, fundraiser_id = organiser
+    app.config["MAX_CONTENT_LENGTH"] = 1024 * 1024
+
+    response = client.post(
+        f"/fundraiser_success/{fundraiser_id}/bulk",
+        data={"file": (io.BytesIO(b"x" * (2 * 1024 * 1024)), "messages.txt")},
+    )
+
+    assert response.status_code == 413
+    assert response.get_json() == {"status": "error", "message": "The upload is larger than 1 MB"}
+
+
+def fundraiser_totals(app, fundraiser_id):
+    """The stored totals next to the ones summed from the contribution rows."""
+    from models import db, Contribution, Fundraiser
+
+    with app.app_context():
+        fundraiser = db.session.get(Fundraiser, fundraiser_id)
+        actual = db.session.execute(
+            db.select(db.func.sum(Contribution.amount), db.func.count())
+            .where(Contribution.fundraiser_id == fundraiser_id)
+        ).one()
+        return (float(fundraiser.funds_raised), fundraiser.contribution_count), (float(actual[0]), actual[1])
+
+
+def test_bulk_duplicates_are_reported_per_message(app, client, organiser):
+    _, fundraiser_id = organiser
+    assert contribute(client, fundraiser_id, "BLD0000000", seed=0).status_code == 200
+    single = fundraiser_totals(app, fundraiser_id)
+    rng = random.Random(9)
+    # an already recorded reference, two new ones and a repeat of a new one
+    messages = [make_message(rng, reference=reference) for reference in ("BLD0000000", "BLD0000001", "BLD0000002")]
+    messages.append(messages[1])
+
+    def submit():
+        response = client.post(
+            f"/fundraiser_success/{fundraiser_id}/bulk", data={"messages": "\n\n".join(messages)}
+        )
+        assert response.status_code == 200, response.get_data(as_text=True)
+        return response.get_json()["data"]
+
+    data = submit()
+    assert [result["status"] for result in data["results"]] == ["duplicate", "saved", "saved", "duplicate"]
+    assert (data["saved"], data["duplicates"], data["failed"]) == (2, 2, 0)
+    first, second, third, repeat = data["results"]
+    assert repeat["original_contribution_id"] == second["contribution_id"]
+    assert first["original_contribution_id"] not in (second["contribution_id"], third["contribution_id"])
+    stored, actual = fundraiser_totals(app, fundraiser_id)
+    assert stored == actual
+    assert stored[1] == single[0][1] + 2
+
+    # submitting the same messages again records nothing and leaves the totals alone
+    again = submit()
+    assert [result["status"] for result in again["results"]] == ["duplicate"] * 4
+    assert again["saved"] == 0
+    assert fundraiser_totals(app, fundraiser_id) == (stored, actual)
@@ -0,0 +1,62 @@
+import csv
+import io
+import json
+
+import pytest
+
+from conftest import contribute
+
+REFERENCES = [f"SAF{number:07d}" for number in range(5)]
+
+
+@pytest.fixture
+def exported(client, organiser, monkeypatch):
+    import app as app_module
+
+    # several chunks for a handful of rows
+    monkeypatch.setattr(app_module, "EXPORT_CHUNK_SIZE", 2)
+    _, fundraiser_id = organiser
+    for number, reference in enumerate(REFERENCES):
+        contribute(client, fundraiser_id, reference, seed=number)
+
+    def export(export_format):
+        return client.get(f"/report/{fundraiser_id}/export?format={export_format}")
+
+    return fundraiser_id, export
+
+
+def test_csv_export(exported):
+    from models import EXPORT_COLUMNS
+
+    fundraiser_id, export = exported
+    response = export("csv")
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/csv"
+    assert response.headers["Content-Disposition"] == (
+        f"attachment; filename=fundraiser_{fundraiser_id}_contributions.csv"
+    )
+    header, *rows = list(csv.reader(io.StringIO(response.get_data(as_text=True))))
+    assert tuple(header) == EXPORT_COLUMNS
+    assert len(rows) == len(REFERENCES)
+    assert sorted(row[0] for row in rows) == REFERENCES
+
+
+def test_ndjson_export(exported):
+    from models import EXPORT_COLUMNS
+
+    _, export = exported
+    response = export("ndjson")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert len(rows) == len(REFERENCES)
+    assert all(tuple(row) == EXPORT_COLUMNS for row in rows)
+    assert sorted(row["contribution_reference"] for row in rows) == REFERENCES
+
+
+def test_unknown_export_format(exported):
+    _, export = exported
+
+    assert export("xlsx").status_code == 400
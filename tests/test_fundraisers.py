@@ -0,0 +1,35 @@
+from conftest import contribute, create_fundraiser, create_user
+
+
+def fundraiser_ids(app):
+    from models import db, Fundraiser
+
+    with app.app_context():
+        return sorted(db.session.scalars(db.select(Fundraiser.id)))
+
+
+def test_delete_requires_a_fundraiser_id(app, client, organiser):
+    user_id, fundraiser_id = organiser
+    newest = create_fundraiser(app, user_id, name="Newest")
+
+    for body in ({}, {"fundraiser_id": None}, {"fundraiser_id": ""}, {"fundraiser_id": "latest"}):
+        response = client.post("/delete_fundraiser", json=body)
+        assert response.status_code == 400, body
+        assert response.get_json()["success"] is False
+    assert fundraiser_ids(app) == [fundraiser_id, newest]
+
+
+def test_delete_only_removes_the_named_fundraiser_of_the_user(app, client, organiser):
+    user_id, fundraiser_id = organiser
+    newest = create_fundraiser(app, user_id, name="Newest")
+    stranger = create_fundraiser(app, create_user(app, "stranger@example.com"), name="Other")
+    contribute(client, fundraiser_id, "SAE0000001")
+
+    response = client.post("/delete_fundraiser", json={"fundraiser_id": stranger})
+    assert response.status_code == 404
+    assert fundraiser_ids(app) == [fundraiser_id, newest, stranger]
+
+    response = client.post("/delete_fundraiser", json={"fundraiser_id": str(fundraiser_id)})
+    assert response.status_code == 200
+    assert response.get_json()["success"] is True
+    assert fundraiser_ids(app) == [newest, stranger]
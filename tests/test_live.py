@@ -0,0 +1,45 @@
+import time
+
+from conftest import contribute, login
+
+
+def listener_count():
+    from live import broadcaster
+
+    with broadcaster.lock:
+        return sum(len(listeners) for listeners in broadcaster.listeners.values())
+
+
+def test_stream_never_iterated_releases_its_listener(client, organiser):
+    _, fundraiser_id = organiser
+
+    response = client.head(f"/fundraiser/{fundraiser_id}/events")
+    assert response.status_code == 200
+    assert listener_count() == 1
+    # what the server does with every response, sent or not
+    response.close()
+    assert listener_count() == 0
+
+
+def test_update_arrives_within_a_second_of_the_commit(app, client, organiser):
+    _, fundraiser_id = organiser
+
+    response = client.get(f"/fundraiser/{fundraiser_id}/events", buffered=False)
+    events = iter(response.response)
+    assert next(events).startswith(b"retry:")
+    assert b'"contribution_count": 0' in next(events)
+
+    other = app.test_client()
+    login(other)
+    committed = time.monotonic()
+    assert contribute(other, fundraiser_id, "SAE0000001").status_code == 200
+    contribution = next(events)
+    elapsed = time.monotonic() - committed
+    totals = next(events)
+    response.close()
+
+    assert contribution.startswith(b"event: contribution")
+    assert b"SAE0000001" in contribution
+    assert b'"contribution_count": 1' in totals
+    assert elapsed < 1.0
+    assert listener_count() == 0
@@ -0,0 +1,27 @@
+import json
+import logging
+import os
+
+import log_config
+
+
+def test_forked_process_logs_to_its_own_file():
+    log_config.start_listener()
+    parent_file = log_config.log_file()
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            logging.warning("from the child")
+            log_config._listener.stop()
+        finally:
+            os._exit(0)
+    os.waitpid(pid, 0)
+
+    with open(log_config.log_file(pid)) as f:
+        messages = [json.loads(line)["message"] for line in f]
+    assert messages == ["from the child"]
+    assert log_config.log_file(pid) != parent_file
+    if os.path.exists(parent_file):
+        with open(parent_file) as f:
+            assert "from the child" not in f.read()
@@ -0,0 +1,194 @@
+"""OutboxSender against a local aiosmtpd server."""
+import socket
+from datetime import datetime, timedelta
+
+import pytest
+from aiosmtpd.controller import Controller
+
+import mailer
+
+BOUNCE = "bounce@example.com"
+
+
+class Recorder:
+    """An aiosmtpd handler that keeps every message and the sessions they came over."""
+
+    def __init__(self):
+        self.messages = []
+        self.sessions = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address == BOUNCE:
+            return "550 No such user"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(envelope.rcpt_tos[0])
+        if session not in self.sessions:
+            self.sessions.append(session)
+        return "250 Message accepted"
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Server:
+    """A local SMTP server on a fixed port that can be restarted."""
+
+    def __init__(self):
+        self.handler = Recorder()
+        self.port = free_port()
+        self.controller = None
+
+    def start(self):
+        self.controller = Controller(self.handler, hostname="127.0.0.1", port=self.port)
+        self.controller.start()
+
+    def stop(self):
+        self.controller.stop()
+
+
+@pytest.fixture
+def smtp_server(monkeypatch):
+    server = Server()
+    server.start()
+    monkeypatch.setenv("MAIL_SERVER", "127.0.0.1")
+    monkeypatch.setenv("MAIL_PORT", str(server.port))
+    monkeypatch.setenv("MAIL_USE_SSL", "false")
+    # the address messages are sent from; with no password the sender does not log in
+    monkeypatch.setenv("MAIL_USERNAME", "outbox@example.com")
+    monkeypatch.delenv("MAIL_PASSWORD", raising=False)
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def outbox(app):
+    from models import db
+
+    def enqueue(*recipients):
+        ids = []
+        for recipient in recipients:
+            email = mailer.enqueue_mail("Hello", recipient, "Body")
+            db.session.commit()
+            ids.append(email.id)
+        return ids
+
+    with app.app_context():
+        yield enqueue
+
+
+def emails(ids):
+    from models import db, OutboxEmail
+
+    db.session.expire_all()
+    return [db.session.get(OutboxEmail, email_id) for email_id in ids]
+
+
+def test_batches_share_one_connection(smtp_server, outbox, monkeypatch):
+    handler = smtp_server.handler
+    monkeypatch.setattr(mailer, "BATCH_SIZE", 3)
+    recipients = [f"user{i}@example.com" for i in range(7)]
+    ids = outbox(*recipients)
+
+    sender = mailer.OutboxSender()
+    assert [sender.send_batch() for _ in range(4)] == [3, 3, 1, 0]
+    sender.close()
+
+    assert handler.messages == recipients
+    assert len(handler.sessions) == 1
+    assert all(email.status == "sent" and email.attempts == 1 and email.sent_at for email in emails(ids))
+
+
+def test_reconnects_once_after_the_server_drops_the_connection(smtp_server, outbox):
+    handler = smtp_server.handler
+    sender = mailer.OutboxSender()
+    outbox("first@example.com")
+    assert sender.send_batch() == 1
+
+    # a restart drops the connection the sender still holds
+    smtp_server.stop()
+    smtp_server.start()
+    ids = outbox("second@example.com")
+    assert sender.send_batch() == 1
+    sender.close()
+
+    assert handler.messages == ["first@example.com", "second@example.com"]
+    assert len(handler.sessions) == 2
+    assert emails(ids)[0].status == "sent"
+
+
+def test_rejected_message_backs_off_until_it_fails(smtp_server, outbox, monkeypatch):
+    from models import db
+
+    handler = smtp_server.handler
+    monkeypatch.setattr(mailer, "MAX_ATTEMPTS", 3)
+    bounce_id, ok_id = outbox(BOUNCE, "ok@example.com")
+    sender = mailer.OutboxSender()
+
+    start = datetime.utcnow()
+    # a message the server refuses does not hold up the rest of the batch
+    assert sender.send_batch() == 1
+    bounce, ok = emails([bounce_id, ok_id])
+    assert ok.status == "sent"
+    assert (bounce.status, bounce.attempts) == ("pending", 1)
+    assert "No such user" in bounce.last_error
+    assert start + mailer.RETRY_BACKOFF <= bounce.next_attempt_at <= datetime.utcnow() + mailer.RETRY_BACKOFF
+
+    # not due yet
+    assert sender.send_batch() == 0
+    assert emails([bounce_id])[0].attempts == 1
+
+    def retry_now():
+        bounce = emails([bounce_id])[0]
+        bounce.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+        db.session.commit()
+        before = datetime.utcnow()
+        assert sender.send_batch() == 0
+        return before, emails([bounce_id])[0]
+
+    # the delay doubles with each failure
+    before, bounce = retry_now()
+    assert (bounce.status, bounce.attempts) == ("pending", 2)
+    assert before + mailer.RETRY_BACKOFF * 2 <= bounce.next_attempt_at <= datetime.utcnow() + mailer.RETRY_BACKOFF * 2
+
+    # the last attempt gives up
+    _, bounce = retry_now()
+    sender.close()
+    assert (bounce.status, bounce.attempts, bounce.sent_at) == ("failed", 3, None)
+    assert handler.messages == ["ok@example.com"]
+
+
+def test_unreachable_server_leaves_the_rest_of_the_batch(smtp_server, outbox, monkeypatch):
+    first_id, second_id = outbox("first@example.com", "second@example.com")
+    monkeypatch.setenv("MAIL_PORT", str(free_port()))
+    sender = mailer.OutboxSender()
+
+    assert sender.send_batch() == 0
+    first, second = emails([first_id, second_id])
+    assert (first.status, first.attempts) == ("pending", 1)
+    assert first.last_error
+    assert first.next_attempt_at > datetime.utcnow()
+    # the failure was the server's, so the second message was not tried
+    assert (second.status, second.attempts) == ("pending", 0)
+    assert sender.smtp is None
+
+
+def test_contact_form_queues_the_message(app, client):
+    from models import db, OutboxEmail
+
+    response = client.post(
+        "/contact", data={"name": "Wanjiku", "email": "wanjiku@example.com", "message": "Hello"}
+    )
+
+    data = response.get_json()
+    assert data["status"] == "success"
+    assert "received" in data["message"] and "sent" not in data["message"]
+    with app.app_context():
+        email = db.session.query(OutboxEmail).one()
+    assert (email.status, email.attempts) == ("pending", 0)
+    assert "Wanjiku" in email.body
@@ -0,0 +1,39 @@
+import io
+
+import pytest
+
+from conftest import contribute, create_user, login
+
+ROUTES = [
+    ("get", "/report/{id}"),
+    ("get", "/report/{id}?format=json"),
+    ("get", "/report/{id}/export?format=csv"),
+    ("get", "/report/{id}/analytics"),
+    ("get", "/report/{id}/search?q=a"),
+    ("get", "/report/{id}/pdf"),
+    ("get", "/fundraiser/{id}/events"),
+    ("get", "/fundraiser_success/{id}"),
+    ("post", "/fundraiser_success/{id}"),
+    ("post", "/fundraiser_success/{id}/bulk"),
+]
+
+
+@pytest.mark.parametrize("method, route", ROUTES)
+def test_another_user_is_refused(app, client, organiser, method, route):
+    _, fundraiser_id = organiser
+    assert contribute(client, fundraiser_id, "SAE0000001").status_code == 200
+
+    stranger = app.test_client()
+    create_user(app, "stranger@example.com")
+    login(stranger, "stranger@example.com")
+    url = route.format(id=fundraiser_id)
+    if method == "post":
+        data = {"message": "x", "file": (io.BytesIO(b"x"), "messages.txt")}
+        response = stranger.post(url, data=data)
+    else:
+        response = stranger.get(url)
+
+    assert response.status_code == 404
+    assert b"SAE0000001" not in response.get_data()
+    # the owner still gets through
+    assert getattr(client, method)(url, data={"message": "x"} if method == "post" else None).status_code != 404
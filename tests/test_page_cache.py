@@ -0,0 +1,39 @@
+import re
+
+from conftest import contribute
+
+
+def funds_raised(page):
+    """The funds raised shown on a report or fundraiser page."""
+    return re.search(r"Funds Raised:\s*(?:<span[^>]*>)?\s*(KES [\d,.]+)", page).group(1)
+
+
+def test_new_contribution_replaces_the_cached_pages(app, client, organiser):
+    from models import db, Fundraiser
+    from page_cache import cache
+
+    _, fundraiser_id = organiser
+    contribute(client, fundraiser_id, "SAG0000001", seed=1)
+    pages = {
+        url: client.get(url).get_data(as_text=True)
+        for url in (f"/report/{fundraiser_id}", f"/fundraiser_success/{fundraiser_id}", "/dashboard")
+    }
+    assert len(cache.entries) > 0
+    # served from the cache while nothing changes
+    for url, page in pages.items():
+        assert client.get(url).get_data(as_text=True) == page
+
+    contribute(client, fundraiser_id, "SAG0000002", seed=2)
+    with app.app_context():
+        fundraiser = db.session.get(Fundraiser, fundraiser_id)
+        total = f"KES {fundraiser.funds_raised:,.2f}"
+        count = fundraiser.contribution_count
+    assert count == 2
+
+    for url in (f"/report/{fundraiser_id}", f"/fundraiser_success/{fundraiser_id}"):
+        page = client.get(url).get_data(as_text=True)
+        assert funds_raised(pages[url]) != total
+        assert funds_raised(page) == total, url
+    dashboard = client.get("/dashboard").get_data(as_text=True)
+    assert total in dashboard and total not in pages["/dashboard"]
+    assert f"<td>{count}</td>" in dashboard
@@ -0,0 +1,79 @@
+import random
+
+from sqlalchemy import event
+
+from conftest import create_fundraiser
+from mpesa_corpus import make_message
+
+
+def count(sql, **params):
+    from models import db
+
+    return db.session.execute(db.text(sql), params).scalar()
+
+
+def test_purge_removes_every_row_and_deletes_the_fundraiser_with_the_last_chunk(app, client, organiser):
+    from mpesa import parse_message
+    from models import db, archive_fundraiser, insert_contributions, purge_fundraiser
+
+    user_id, fundraiser_id = organiser
+    other_id = create_fundraiser(app, user_id, name="Other")
+    rng = random.Random(4)
+    bulk = "\n\n".join(make_message(rng, reference=f"SPA{number:07d}") for number in range(9))
+    assert client.post(f"/fundraiser_success/{fundraiser_id}/bulk", data={"messages": bulk}).status_code == 200
+    other = "\n\n".join(make_message(rng, reference=f"SPO{number:07d}") for number in range(3))
+    assert client.post(f"/fundraiser_success/{other_id}/bulk", data={"messages": other}).status_code == 200
+
+    with app.app_context():
+        assert archive_fundraiser(fundraiser_id) == 9
+        # contributions saved while the archive ran stay in the live table
+        rows = [parse_message(make_message(rng, reference=f"SPL{number:07d}")) for number in range(8)]
+        insert_contributions(fundraiser_id, rows)
+        db.session.commit()
+
+        steps = []
+
+        def statement(conn, cursor, sql, parameters, context, executemany):
+            if sql.startswith("DELETE FROM"):
+                steps.append(sql.split()[2])
+
+        def commit(conn):
+            steps.append("COMMIT")
+
+        event.listen(db.engine, "before_cursor_execute", statement)
+        event.listen(db.engine, "commit", commit)
+        try:
+            assert purge_fundraiser(fundraiser_id, chunk_size=3) == 17
+        finally:
+            event.remove(db.engine, "before_cursor_execute", statement)
+            event.remove(db.engine, "commit", commit)
+
+        transactions = [chunk.split() for chunk in " ".join(steps).split("COMMIT")]
+        assert transactions.pop() == []
+        # three archived chunks and an empty one, then three live chunks
+        assert [chunk[0] for chunk in transactions] == ["archived_contributions"] * 4 + ["contributions"] * 3
+        # the last live chunk, the rollups and the fundraiser go in one transaction
+        assert transactions[-1] == [
+            "contributions",
+            "contribution_daily_rollup",
+            "contribution_hourly_rollup",
+            "contributor_rollup",
+            "fundraiser",
+        ]
+        assert all("fundraiser" not in chunk for chunk in transactions[:-1])
+
+        for table in (
+            "contributions",
+            "archived_contributions",
+            "contribution_daily_rollup",
+            "contribution_hourly_rollup",
+            "contributor_rollup",
+            "fundraiser",
+        ):
+            column = "id" if table == "fundraiser" else "fundraiser_id"
+            assert count(f"SELECT count(*) FROM {table} WHERE {column} = :id", id=fundraiser_id) == 0, table
+        assert count("SELECT count(*) FROM contributions_fts WHERE contributions_fts MATCH 'SPA* OR SPL*'") == 0
+        # the other fundraiser is untouched, and the full-text index still matches the table
+        assert count("SELECT count(*) FROM contributions WHERE fundraiser_id = :id", id=other_id) == 3
+        assert count("SELECT count(*) FROM contributions_fts WHERE contributions_fts MATCH 'SPO*'") == 3
+        db.session.execute(db.text("INSERT INTO contributions_fts(contributions_fts) VALUES ('integrity-check')"))
@@ -0,0 +1,115 @@
+"""
+Statement budgets of the hot routes.
+
+Each request is counted with a before_cursor_execute listener on the engine, so a
+route that starts loading per row or per fundraiser fails here. The budgets hold
+whatever the number of contributions and fundraisers, which each test varies.
+"""
+import contextlib
+import io
+import random
+
+import pytest
+from sqlalchemy import event
+
+from conftest import contribute, create_fundraiser
+
+from mpesa_corpus import make_message
+
+REPORT_PAGE_BUDGET = 2
+REPORT_JSON_BUDGET = 3
+ANALYTICS_BUDGET = 5
+DASHBOARD_BUDGET = 2
+SAVE_BUDGET = 8
+BULK_SAVE_BUDGET = 8
+
+
+@contextlib.contextmanager
+def count_statements(app):
+    """Collects the SQL of every statement run while the block executes, in any thread."""
+    from models import db
+    from page_cache import cache
+
+    # a cached page would answer without reaching the database
+    cache.clear()
+    with app.app_context():
+        engine = db.engine
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def add_contributions(client, fundraiser_id, count, start=0):
+    for i in range(start, start + count):
+        response = contribute(client, fundraiser_id, f"QB{i:08d}", seed=i)
+        assert response.status_code == 200, response.get_data(as_text=True)
+
+
+def assert_budget(app, request, budget):
+    with count_statements(app) as statements:
+        response = request()
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert len(statements) <= budget, "\n".join(statements)
+
+
+@pytest.mark.parametrize("contributions", [1, 40])
+def test_report_budget(app, client, organiser, contributions):
+    _, fundraiser_id = organiser
+    add_contributions(client, fundraiser_id, contributions)
+
+    assert_budget(app, lambda: client.get(f"/report/{fundraiser_id}"), REPORT_PAGE_BUDGET)
+    assert_budget(
+        app, lambda: client.get(f"/report/{fundraiser_id}?format=json&limit=500"), REPORT_JSON_BUDGET
+    )
+
+
+@pytest.mark.parametrize("contributions", [1, 40])
+def test_analytics_budget(app, client, organiser, contributions):
+    _, fundraiser_id = organiser
+    add_contributions(client, fundraiser_id, contributions)
+
+    assert_budget(
+        app, lambda: client.get(f"/report/{fundraiser_id}/analytics?top=100"), ANALYTICS_BUDGET
+    )
+
+
+@pytest.mark.parametrize("fundraisers", [1, 10])
+def test_dashboard_budget(app, client, organiser, fundraisers):
+    user_id, fundraiser_id = organiser
+    for i in range(fundraisers - 1):
+        other = create_fundraiser(app, user_id, name=f"Harambee {i}")
+        add_contributions(client, other, 2, start=100 * i)
+    add_contributions(client, fundraiser_id, 3, start=10000)
+
+    assert_budget(app, lambda: client.get("/dashboard"), DASHBOARD_BUDGET)
+
+
+@pytest.mark.parametrize("contributions", [1, 40])
+def test_save_budget(app, client, organiser, contributions):
+    _, fundraiser_id = organiser
+    add_contributions(client, fundraiser_id, contributions)
+
+    assert_budget(app, lambda: contribute(client, fundraiser_id, "QB99999999", seed=99), SAVE_BUDGET)
+
+
+@pytest.mark.parametrize("messages", [1, 50])
+def test_bulk_save_budget(app, client, organiser, messages):
+    _, fundraiser_id = organiser
+    rng = random.Random(7)
+    text = "\n\n".join(make_message(rng, reference=f"QBB{i:07d}") for i in range(messages))
+
+    assert_budget(
+        app,
+        lambda: client.post(
+            f"/fundraiser_success/{fundraiser_id}/bulk",
+            data={"file": (io.BytesIO(text.encode()), "messages.txt")},
+        ),
+        BULK_SAVE_BUDGET,
+    )
@@ -0,0 +1,22 @@
+from query_plans import check_query_plans
+
+
+def test_hot_queries_use_their_indexes(app, seeded):
+    from models import db, Fundraiser
+
+    with app.app_context():
+        fundraiser = db.session.get(Fundraiser, seeded[0])
+        results = check_query_plans(fundraiser.id, fundraiser.user_id)
+
+    assert results
+    problems = {
+        name: (statement, plan) for name, statement, plan, problems in results if problems
+    }
+    assert problems == {}
+
+
+def test_command_runs_on_an_empty_database(app):
+    result = app.test_cli_runner().invoke(args=["check-query-plans"])
+
+    assert result.exception is None, result.output
+    assert "ok  analytics" in result.output
@@ -0,0 +1,121 @@
+import time
+
+from conftest import contribute, create_fundraiser
+
+
+def start_of_second():
+    """Waits for the next second to begin, so a short test does not straddle two."""
+    time.sleep(1.01 - time.time() % 1)
+
+
+def test_report_revalidates_with_etag(client, organiser):
+    _, fundraiser_id = organiser
+    contribute(client, fundraiser_id, "SAA0000001")
+
+    first = client.get(f"/report/{fundraiser_id}?format=json")
+    assert first.status_code == 200
+    cached = client.get(
+        f"/report/{fundraiser_id}?format=json", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert cached.status_code == 304
+
+    contribute(client, fundraiser_id, "SAA0000002")
+    changed = client.get(
+        f"/report/{fundraiser_id}?format=json", headers={"If-None-Match": first.headers["ETag"]}
+    )
+    assert changed.status_code == 200
+    assert len(changed.get_json()["items"]) == 2
+
+
+def test_validators_differ_for_a_reused_fundraiser_id(app, client, organiser):
+    from models import purge_fundraiser
+
+    user_id, fundraiser_id = organiser
+    start_of_second()
+    for number in range(2):
+        contribute(client, fundraiser_id, f"SAB000000{number}", seed=number)
+    old = client.get(f"/report/{fundraiser_id}?format=json")
+    # changed within the current second, so a date could not tell this state from the next
+    assert "Last-Modified" not in old.headers
+
+    with app.app_context():
+        purge_fundraiser(fundraiser_id)
+    # SQLite hands the freed ID to the next fundraiser, whose version starts again at 0
+    assert create_fundraiser(app, user_id) == fundraiser_id
+    for number in range(2):
+        contribute(client, fundraiser_id, f"SAC000000{number}", seed=10 + number)
+
+    response = client.get(
+        f"/report/{fundraiser_id}?format=json", headers={"If-None-Match": old.headers["ETag"]}
+    )
+    assert response.status_code == 200
+    references = [item["reference"] for item in response.get_json()["items"]]
+    assert references == ["SAC0000000", "SAC0000001"]
+
+
+def test_last_modified_revalidates_once_its_second_has_passed(client, organiser):
+    _, fundraiser_id = organiser
+    contribute(client, fundraiser_id, "SAD0000001")
+    time.sleep(1.01)
+
+    first = client.get(f"/report/{fundraiser_id}?format=json")
+    cached = client.get(
+        f"/report/{fundraiser_id}?format=json",
+        headers={"If-Modified-Since": first.headers["Last-Modified"]},
+    )
+    assert cached.status_code == 304
+
+    contribute(client, fundraiser_id, "SAD0000002")
+    changed = client.get(
+        f"/report/{fundraiser_id}?format=json",
+        headers={"If-Modified-Since": first.headers["Last-Modified"]},
+    )
+    assert changed.status_code == 200
+
+
+def test_keyset_pages_cover_rows_sharing_a_timestamp_once(app, client, organiser):
+    from models import db
+
+    _, fundraiser_id = organiser
+    references = [f"SAD{number:07d}" for number in range(11)]
+    for number, reference in enumerate(references):
+        contribute(client, fundraiser_id, reference, seed=number)
+    with app.app_context():
+        # three rows on an earlier second and the other eight tied on one later second,
+        # so pages must break ties on contribution_id
+        db.session.execute(
+            db.text(
+                "UPDATE contributions SET timestamp = CASE WHEN contribution_reference < 'SAD0000003' "
+                "THEN '2024-01-01 10:00:00' ELSE '2024-01-02 10:00:00' END"
+            )
+        )
+        db.session.commit()
+
+    seen, after, pages = [], None, 0
+    while True:
+        url = f"/report/{fundraiser_id}?format=json&limit=3" + (f"&after={after}" if after else "")
+        page = client.get(url).get_json()
+        assert page["total"] == len(references)
+        seen += [item["reference"] for item in page["items"]]
+        pages += 1
+        after = page["next_cursor"]
+        if after is None:
+            break
+
+    assert seen == references
+    assert pages == 4
+
+
+def test_corrupted_cursor_is_rejected(client, organiser):
+    import base64
+
+    _, fundraiser_id = organiser
+    for number in range(3):
+        contribute(client, fundraiser_id, f"SAE000001{number}", seed=number)
+    cursor = client.get(f"/report/{fundraiser_id}?format=json&limit=1").get_json()["next_cursor"]
+    wrong_types = base64.urlsafe_b64encode(b'[1, "2"]').decode()
+
+    for after in (cursor[:-3] + "!!!", cursor[: len(cursor) // 2], "not-a-cursor", wrong_types):
+        response = client.get(f"/report/{fundraiser_id}?format=json&after={after}")
+        assert response.status_code == 400, after
+        assert response.get_json() == {"status": "error", "message": "Invalid cursor"}
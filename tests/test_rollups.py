@@ -0,0 +1,97 @@
+import random
+from decimal import Decimal
+
+from conftest import create_fundraiser
+
+PHONES = ("0711000001", "0711000002", "0711000003", "0711000004")
+
+
+def message(rng, reference):
+    """A confirmation whose contributor, day and hour repeat across messages."""
+    phone = rng.choice(PHONES)
+    return (
+        f"{reference} Confirmed. You have received Ksh{rng.choice((50, 120, 1000, 2500))}.00 "
+        f"from CONTRIBUTOR {phone[-1]} {phone} on {rng.randint(1, 3)}/6/24 at "
+        f"{rng.randint(1, 12)}:{rng.randint(0, 59):02d} {rng.choice(('AM', 'PM'))} "
+        f"New M-PESA balance is Ksh1,000.00."
+    )
+
+
+def rollups():
+    """The rows of the three rollups, keyed by rollup name."""
+    from models import db
+
+    queries = {
+        "daily": "SELECT fundraiser_id, contribution_date, amount_total, contribution_count "
+        "FROM contribution_daily_rollup",
+        "hourly": "SELECT fundraiser_id, contribution_hour, amount_total, contribution_count "
+        "FROM contribution_hourly_rollup",
+        "contributor": "SELECT fundraiser_id, phone_number, amount_total, contribution_count "
+        "FROM contributor_rollup",
+    }
+    return {name: normalise(db.session.execute(db.text(sql))) for name, sql in queries.items()}
+
+
+def grouped():
+    """The same figures, computed with GROUP BY over the contributions."""
+    from models import db
+
+    select = "SELECT fundraiser_id, {key}, SUM(amount), COUNT(*) FROM contributions GROUP BY fundraiser_id, {key}"
+    keys = {
+        "daily": "contribution_date",
+        "hourly": "CAST(substr(contribution_time, 1, 2) AS INTEGER)",
+        "contributor": "phone_number",
+    }
+    return {name: normalise(db.session.execute(db.text(select.format(key=key)))) for name, key in keys.items()}
+
+
+def normalise(rows):
+    return sorted(
+        (fundraiser_id, str(key), Decimal(str(total)).quantize(Decimal("0.01")), count)
+        for fundraiser_id, key, total, count in rows
+    )
+
+
+def test_rollups_match_the_contributions(app, client, organiser):
+    from models import db, Contribution, Fundraiser, fundraiser_analytics, purge_fundraiser
+
+    user_id, kept_id = organiser
+    purged_id = create_fundraiser(app, user_id, name="Purged")
+    rng = random.Random(3)
+    for fundraiser_id, prefix in ((kept_id, "SRA"), (purged_id, "SRB")):
+        # bulk inserts go through insert_contributions(), single saves through the writer
+        bulk = "\n\n".join(message(rng, f"{prefix}{number:07d}") for number in range(30))
+        assert client.post(f"/fundraiser_success/{fundraiser_id}/bulk", data={"messages": bulk}).status_code == 200
+        for number in range(30, 35):
+            response = client.post(
+                f"/fundraiser_success/{fundraiser_id}", data={"message": message(rng, f"{prefix}{number:07d}")}
+            )
+            assert response.status_code == 200
+
+    with app.app_context():
+        assert rollups() == grouped()
+        assert len(rollups()["contributor"]) == 2 * len(PHONES)
+
+        # a deleted contribution comes off the rollups
+        db.session.delete(db.session.query(Contribution).filter_by(fundraiser_id=kept_id).first())
+        db.session.commit()
+        assert rollups() == grouped()
+
+        purge_fundraiser(purged_id, chunk_size=7)
+        current = rollups()
+        assert current == grouped()
+        assert all(row[0] == kept_id for rows in current.values() for row in rows)
+        fundraiser = db.session.get(Fundraiser, kept_id)
+        analytics = fundraiser_analytics(fundraiser, top=len(PHONES))
+        for series in ("daily", "hourly", "top_contributors"):
+            assert sum(row["amount"] for row in analytics[series]) == analytics["funds_raised"]
+            assert sum(row["count"] for row in analytics[series]) == fundraiser.contribution_count == 34
+
+        for table in ("contribution_daily_rollup", "contribution_hourly_rollup", "contributor_rollup"):
+            db.session.execute(db.text(f"DELETE FROM {table}"))
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["rebuild-rollups"])
+    assert result.exit_code == 0, result.output
+    with app.app_context():
+        assert rollups() == current
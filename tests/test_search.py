@@ -0,0 +1,109 @@
+import contextlib
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+CONTRIBUTIONS = [
+    # reference, name, phone, amount, day, month
+    ("SSA0000001", "GRACE WANJIKU", "0711000001", 500, 3, 5),
+    ("SSA0000002", "GRACE AKINYI", "0722000002", 1500, 14, 5),
+    ("SSA0000003", "PETER KAMAU", "0711000003", 200, 2, 6),
+    ("SSA0000004", "MARY WANJIKU", "0733000004", 2500, 20, 6),
+    ("SSA0000005", "JOHN OTIENO", "0711000005", 50, 28, 6),
+    ("SSB0000006", "PETER OMONDI", "0144000006", 10000, 5, 7),
+]
+
+
+def message(reference, name, phone, amount, day, month):
+    return (
+        f"{reference} Confirmed. You have received Ksh{amount:,}.00 from {name} {phone} "
+        f"on {day}/{month}/24 at 10:15 AM New M-PESA balance is Ksh1,000.00."
+    )
+
+
+@pytest.fixture
+def searchable(app, client, organiser):
+    _, fundraiser_id = organiser
+    messages = "\n\n".join(message(*contribution) for contribution in CONTRIBUTIONS)
+    response = client.post(f"/fundraiser_success/{fundraiser_id}/bulk", data={"messages": messages})
+    assert response.get_json()["data"]["saved"] == len(CONTRIBUTIONS)
+    with app.app_context():
+        yield fundraiser_id
+
+
+@contextlib.contextmanager
+def statements_run():
+    """Collects the SQL run in the block; the search query is the last statement."""
+    from models import db
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, "before_cursor_execute", record)
+
+
+def search(fundraiser_id, **filters):
+    from models import search_contributions
+
+    rows, truncated = search_contributions(fundraiser_id, **filters)
+    assert not truncated
+    return sorted(row.contribution_reference for row in rows)
+
+
+def test_text_matches_names_references_and_phone_prefixes(searchable):
+    assert search(searchable, text="wanjiku") == ["SSA0000001", "SSA0000004"]
+    assert search(searchable, text="grace wanj") == ["SSA0000001"]
+    assert search(searchable, text="SSB") == ["SSB0000006"]
+    assert search(searchable, text="07110") == ["SSA0000001", "SSA0000003", "SSA0000005"]
+    # quoted, so FTS5 syntax typed by the user is only text
+    assert search(searchable, text='peter OR "mary') == []
+
+
+def test_amount_and_month_filters(searchable):
+    june = {"date_from": date(2024, 6, 1), "date_to": date(2024, 6, 30)}
+    assert search(searchable, **june) == ["SSA0000003", "SSA0000004", "SSA0000005"]
+    assert search(searchable, min_amount=Decimal(200), **june) == ["SSA0000003", "SSA0000004"]
+    assert search(searchable, text="0711", max_amount=Decimal(500), date_to=date(2024, 6, 30)) == [
+        "SSA0000001",
+        "SSA0000003",
+        "SSA0000005",
+    ]
+
+
+def test_candidate_limit_stops_the_narrowing(searchable, monkeypatch):
+    import models
+    from models import Contribution, narrowest_filter
+
+    monkeypatch.setattr(models, "SEARCH_CANDIDATE_LIMIT", 2)
+    narrow = Contribution.amount >= 10000
+    broad = Contribution.amount >= 100
+    assert narrowest_filter(searchable, [broad, narrow]) is narrow
+    # with every filter past the limit, no index is picked and the search walks the timestamps
+    assert narrowest_filter(searchable, [broad, Contribution.amount >= 50]) is None
+
+    with statements_run() as broad_search:
+        assert search(searchable, min_amount=Decimal(100)) == [
+            reference for reference, _, _, amount, _, _ in CONTRIBUTIONS if amount >= 100
+        ]
+    assert "likely(" in broad_search[-1]
+    with statements_run() as narrow_search:
+        assert search(searchable, min_amount=Decimal(10000)) == ["SSB0000006"]
+    assert "likely(" not in narrow_search[-1] and "IN (SELECT" in narrow_search[-1]
+
+
+def test_search_route(client, searchable):
+    response = client.get(f"/report/{searchable}/search?q=peter&from=2024-07-01&limit=10")
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert [item["reference"] for item in data["items"]] == ["SSB0000006"]
+    assert data["truncated"] is False
+    assert client.get(f"/report/{searchable}/search?min_amount=nan").status_code == 400
@@ -0,0 +1,24 @@
+import pytest
+
+from sqlite_profile import engine_options
+
+
+@pytest.mark.parametrize("uri", ["sqlite://", "sqlite:///:memory:"])
+def test_in_memory_database_gets_no_pool_sizing(uri):
+    from app import create_app
+    from models import db
+
+    assert "pool_size" not in engine_options(uri)
+    app = create_app({"SQLALCHEMY_DATABASE_URI": uri, "SECRET_KEY": "test", "TESTING": True})
+    with app.app_context():
+        db.create_all()
+        assert db.session.execute(db.text("SELECT count(*) FROM user")).scalar() == 0
+        db.session.remove()
+        db.engine.dispose()
+
+
+def test_file_database_gets_a_sized_pool(tmp_path):
+    options = engine_options(f"sqlite:///{tmp_path / 'test.db'}")
+
+    assert options["pool_size"] > 0
+    assert options["connect_args"]["check_same_thread"] is False
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from mpesa import parse_message
+from mpesa_corpus import make_message
+
+
+def parsed(reference, seed=1):
+    return parse_message(make_message(random.Random(seed), reference=reference))
+
+
+def test_group_commit_returns_each_result(app, organiser):
+    from write_queue import contribution_writer
+
+    _, fundraiser_id = organiser
+    futures = [
+        contribution_writer.submit(fundraiser_id, parsed(reference, seed))
+        for seed, reference in enumerate(("SAF0000001", "SAF0000002", "SAF0000001"))
+    ]
+    results = [future.result(timeout=5) for future in futures]
+
+    assert "contribution_id" in results[0] and "contribution_id" in results[1]
+    assert results[2]["duplicate"]["contribution_id"] == results[0]["contribution_id"]
+
+
+def test_writer_survives_an_error_outside_the_commit(app, organiser, monkeypatch):
+    from models import db
+    from write_queue import contribution_writer
+
+    _, fundraiser_id = organiser
+
+    def broken(batch):
+        raise RuntimeError("commit failed")
+
+    def broken_rollback():
+        raise RuntimeError("rollback failed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(contribution_writer, "commit", broken)
+        patch.setattr(db.session, "rollback", broken_rollback)
+        future = contribution_writer.submit(fundraiser_id, parsed("SAG0000001"))
+        with pytest.raises(RuntimeError, match="rollback failed"):
+            future.result(timeout=5)
+
+    # the same thread keeps serving the saves that follow
+    thread = contribution_writer.thread
+    result = contribution_writer.submit(fundraiser_id, parsed("SAG0000002")).result(timeout=5)
+    assert "contribution_id" in result
+    assert contribution_writer.thread is thread and thread.is_alive()
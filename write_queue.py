@@ -0,0 +1,166 @@
+"""
+Group commit for contributions saved one at a time.
+
+SQLite lets one connection write at a time and every commit pays for a sync of the
+write-ahead log, so saving each contribution in its own transaction caps ingestion at
+the rate the disk can commit. save_contribution instead hands its row to the writer of
+its process and waits for the result.
+
+A single writer thread takes the first queued row, gathers whatever else arrives within
+WRITE_BATCH_WINDOW seconds, up to WRITE_BATCH_MAX_ROWS rows, inserts them with
+insert_contributions() for each fundraiser and commits them in one transaction. Every
+caller then gets its own result once that commit has returned. If the shared transaction
+fails, its rows are retried in one transaction each, so a bad row only fails its own
+request.
+"""
+import logging
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from sqlalchemy import tuple_
+
+from metrics import WRITE_BATCH_SIZE
+from models import db, Contribution, Fundraiser, insert_contributions
+
+# Seconds the writer waits for more rows after the first one of a group
+WRITE_BATCH_WINDOW = float(os.environ.get("WRITE_BATCH_WINDOW", 0.003))
+# Rows committed together at most
+WRITE_BATCH_MAX_ROWS = int(os.environ.get("WRITE_BATCH_MAX_ROWS", 200))
+# Seconds a request waits for the commit of its row
+WRITE_TIMEOUT = 30
+
+
+class ContributionWriter:
+    """Commits the contributions submitted by the request threads of this process in groups."""
+
+    def __init__(self):
+        self.app = None
+        self.queue = queue.SimpleQueue()
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def init_app(self, app):
+        self.app = app
+
+    def submit(self, fundraiser_id, row):
+        """
+        Queues a contribution for the next group commit.
+
+        Parameters:
+            fundraiser_id (int): The ID of the fundraiser.
+            row (dict): The Contribution fields other than fundraiser_id, as returned by parse_message().
+
+        Returns:
+            Future: Resolves, once the row's transaction is committed, to a dict with either
+            contribution_id and funds_raised, the fundraiser's total after the commit, or
+            duplicate, the contribution recorded earlier under the same reference as a dict.
+            Raises the database error if the row could not be saved.
+        """
+        future = Future()
+        self.queue.put((fundraiser_id, row, future))
+        with self.lock:
+            # also restarts the thread in a worker forked after the parent started one
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run, name="contribution-writer", daemon=True
+                )
+                self.thread.start()
+        return future
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + WRITE_BATCH_WINDOW
+            while len(batch) < WRITE_BATCH_MAX_ROWS:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        batch.append(self.queue.get(timeout=remaining))
+                    else:
+                        # past the window, only take the rows that are already waiting
+                        batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            WRITE_BATCH_SIZE.observe(len(batch))
+            try:
+                with self.app.app_context():
+                    self.write(batch)
+            except Exception as e:
+                # the thread serves every later save in this process, so it must outlive a bad group
+                logging.error("Contribution writer failed on a group of %s: %s", len(batch), str(e))
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+
+    def write(self, batch):
+        try:
+            results = self.commit(batch)
+        except Exception as e:
+            db.session.rollback()
+            if len(batch) == 1:
+                batch[0][2].set_exception(e)
+                return
+            logging.warning(
+                "Group commit of %s contributions failed, retrying them one by one: %s",
+                len(batch),
+                str(e),
+            )
+            for entry in batch:
+                self.write([entry])
+            return
+        for (_, _, future), result in zip(batch, results):
+            future.set_result(result)
+
+    def commit(self, batch):
+        """Inserts the batch in one transaction and commits it. Returns the result of each entry."""
+        rows = {}
+        for fundraiser_id, row, _ in batch:
+            rows.setdefault(fundraiser_id, []).append(row)
+        inserted, originals = {}, {}
+        for fundraiser_id, fundraiser_rows in rows.items():
+            new, duplicates = insert_contributions(fundraiser_id, fundraiser_rows)
+            inserted.update(
+                ((fundraiser_id, reference), contribution_id)
+                for reference, contribution_id in new.items()
+            )
+            originals.update(
+                ((fundraiser_id, reference), contribution)
+                for reference, contribution in duplicates.items()
+            )
+        totals = dict(
+            db.session.query(Fundraiser.id, Fundraiser.funds_raised).filter(Fundraiser.id.in_(rows))
+        )
+
+        # a reference sent twice within the batch is a duplicate of the row inserted first
+        keys = [(fundraiser_id, row["contribution_reference"]) for fundraiser_id, row, _ in batch]
+        seen, repeated = set(), []
+        for key in keys:
+            if key in seen and key in inserted:
+                repeated.append(key)
+            seen.add(key)
+        if repeated:
+            originals.update(
+                ((contribution.fundraiser_id, contribution.contribution_reference), contribution)
+                for contribution in Contribution.query.filter(
+                    tuple_(Contribution.fundraiser_id, Contribution.contribution_reference).in_(repeated)
+                )
+            )
+
+        results, claimed = [], set()
+        for key in keys:
+            if key in inserted and key not in claimed:
+                claimed.add(key)
+                results.append({"contribution_id": inserted[key], "funds_raised": totals[key[0]]})
+            else:
+                original = originals[key]
+                results.append(
+                    {"duplicate": dict(original.to_dict(), contribution_id=original.contribution_id)}
+                )
+        db.session.commit()
+        return results
+
+
+contribution_writer = ContributionWriter()